@@ -0,0 +1,70 @@
+"""Benchmark categorical encoding modes on high-cardinality columns.
+
+Compares the previous LabelEncoder path with the label, codes and hash
+modes of encode_categories, on string columns and on the category columns
+the featurize stage reads from Parquet.
+
+Usage (from chapter11_data_version_control):
+    uv run python benchmarks/bench_categorical_encoding.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import LabelEncoder
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from feature_transform import encode_categories  # noqa: E402
+
+N_ROWS = 1_000_000
+CARDINALITIES = {"zip_code": 40_000, "device_id": 500_000}
+REPEATS = 3
+
+
+def make_column(n_unique):
+    """Create a string column drawing from n_unique distinct values."""
+    rng = np.random.default_rng(42)
+    uniques = np.array([f"id-{i:08d}" for i in range(n_unique)], dtype=object)
+    return pd.Series(uniques[rng.integers(0, n_unique, N_ROWS)], dtype="str")
+
+
+def label_encoder(values):
+    """Previous encoding: sklearn LabelEncoder on the values as strings."""
+    return LabelEncoder().fit_transform(values.astype(str))
+
+
+def best_time(func, values):
+    """Return the fastest of REPEATS runs of func(values), in seconds."""
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(values)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    """Print the encoding time of each mode for each column and input dtype."""
+    modes = {
+        "LabelEncoder": label_encoder,
+        "label": lambda values: encode_categories(values, "label"),
+        "codes": lambda values: encode_categories(values, "codes"),
+        "hash": lambda values: encode_categories(values, "hash"),
+    }
+
+    print(f"{N_ROWS} rows, time in seconds")
+    print(f"{'column':<24}" + "".join(f"{mode:>14}" for mode in modes))
+    for name, n_unique in CARDINALITIES.items():
+        values = make_column(n_unique)
+        for dtype in ["str", "category"]:
+            column = values.astype(dtype)
+            times = [best_time(encode, column) for encode in modes.values()]
+            print(f"{name + ' (' + dtype + ')':<24}" + "".join(f"{t:>14.3f}" for t in times))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark the vectorized clean_data against the per-column loop it replaced.
+
+Usage (from chapter11_data_version_control):
+    uv run python benchmarks/bench_clean_data.py
+"""
+
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from data_preparation import clean_data  # noqa: E402
+
+N_ROWS = 100_000
+COLUMN_COUNTS = [10, 100, 500]
+
+
+def clean_data_loop(df, missing_threshold=0.1, outlier_method="iqr", outlier_factor=1.5):
+    """Previous clean_data, scanning each column separately for every statistic."""
+    missing_ratio = df.isnull().sum() / len(df)
+    high_missing_cols = missing_ratio[missing_ratio > missing_threshold].index
+    if len(high_missing_cols) > 0:
+        df = df.drop(columns=high_missing_cols)
+
+    for col in df.select_dtypes(include=[np.number]).columns:
+        if df[col].isnull().sum() > 0:
+            df[col] = df[col].fillna(df[col].median())
+
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        if df[col].isnull().sum() > 0:
+            df[col] = df[col].fillna(df[col].mode()[0])
+
+    if outlier_method == "iqr":
+        numerical_cols = df.select_dtypes(include=[np.number]).columns
+        numerical_cols = numerical_cols.drop('customer_id', errors='ignore')
+        numerical_cols = numerical_cols.drop('churn', errors='ignore')
+
+        for col in numerical_cols:
+            Q1 = df[col].quantile(0.25)
+            Q3 = df[col].quantile(0.75)
+            IQR = Q3 - Q1
+            lower_bound = Q1 - outlier_factor * IQR
+            upper_bound = Q3 + outlier_factor * IQR
+
+            outliers_before = ((df[col] < lower_bound) | (df[col] > upper_bound)).sum()
+            if outliers_before > 0:
+                df[col] = df[col].clip(lower=lower_bound, upper=upper_bound)
+
+    return df
+
+
+def make_data(n_cols):
+    """Create a wide customer table with 5% missing values and some outliers."""
+    rng = np.random.default_rng(42)
+    n_numeric = n_cols - n_cols // 10
+    values = rng.standard_normal((N_ROWS, n_numeric))
+    values[rng.random(values.shape) < 0.05] = np.nan
+    values[rng.random(values.shape) < 0.001] = 50.0
+    df = pd.DataFrame(values, columns=[f"num_{i}" for i in range(n_numeric)])
+
+    for i in range(n_cols // 10):
+        categories = rng.choice(["a", "b", "c", "d"], N_ROWS).astype(object)
+        categories[rng.random(N_ROWS) < 0.05] = None
+        df[f"cat_{i}"] = categories
+
+    df["customer_id"] = np.arange(N_ROWS)
+    df["churn"] = rng.integers(0, 2, N_ROWS)
+    return df
+
+
+def best_time(func, df, repeats=3):
+    """Return the fastest of several runs of func on a fresh copy of df, in seconds."""
+    times = []
+    for _ in range(repeats):
+        data = df.copy()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func(data)
+            times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    """Print the run time of both versions for increasingly wide tables."""
+    print(f"{N_ROWS} rows")
+    print(f"{'columns':>8} {'loop (s)':>10} {'vectorized (s)':>15} {'speedup':>8}")
+    for n_cols in COLUMN_COUNTS:
+        df = make_data(n_cols)
+        loop_time = best_time(clean_data_loop, df)
+        vectorized_time = best_time(clean_data, df)
+        print(f"{n_cols:>8} {loop_time:>10.3f} {vectorized_time:>15.3f} {loop_time / vectorized_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
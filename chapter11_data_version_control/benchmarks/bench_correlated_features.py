@@ -0,0 +1,73 @@
+"""Benchmark blocked correlation pruning against the full correlation matrix.
+
+Usage (from chapter11_data_version_control):
+    uv run python benchmarks/bench_correlated_features.py
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from feature_engineering import correlated_features  # noqa: E402
+
+N_ROWS = 5_000
+COLUMN_COUNTS = [500, 1_000, 2_000]
+THRESHOLD = 0.95
+
+
+def correlated_features_dense(X, threshold):
+    """Previous pruning, from the full correlation matrix and a per-column scan."""
+    corr_matrix = X.corr().abs()
+    upper_triangle = corr_matrix.where(
+        np.triu(np.ones(corr_matrix.shape), k=1).astype(bool)
+    )
+    return [
+        column for column in upper_triangle.columns
+        if any(upper_triangle[column] > threshold)
+    ]
+
+
+def make_data(n_cols):
+    """Create features where about a third are noisy copies of others."""
+    rng = np.random.default_rng(42)
+    values = rng.standard_normal((N_ROWS, n_cols))
+    copies = rng.choice(n_cols, size=n_cols // 3, replace=False)
+    sources = rng.integers(0, n_cols, size=len(copies))
+    values[:, copies] = values[:, sources] + 0.1 * rng.standard_normal((N_ROWS, len(copies)))
+    return pd.DataFrame(values, columns=[f"feature_{i}" for i in range(n_cols)])
+
+
+def measure(func, X):
+    """Return the result, run time in seconds and peak traced memory in MB of func(X)."""
+    start = time.perf_counter()
+    result = func(X, THRESHOLD)
+    elapsed = time.perf_counter() - start
+    
+    # Trace memory in a second run, since tracing slows down Python code
+    tracemalloc.start()
+    func(X, THRESHOLD)
+    peak = tracemalloc.get_traced_memory()[1] / 1024**2
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    """Print time and memory of both versions for increasingly wide tables."""
+    print(f"{N_ROWS} rows, threshold {THRESHOLD}")
+    print(f"{'columns':>8} {'dense (s)':>10} {'dense (MB)':>11} {'blocked (s)':>12} {'blocked (MB)':>13} {'same':>5}")
+    for n_cols in COLUMN_COUNTS:
+        X = make_data(n_cols)
+        dense, dense_time, dense_peak = measure(correlated_features_dense, X)
+        blocked, blocked_time, blocked_peak = measure(correlated_features, X)
+        print(f"{n_cols:>8} {dense_time:>10.2f} {dense_peak:>11.0f} "
+              f"{blocked_time:>12.2f} {blocked_peak:>13.0f} {str(dense == blocked):>5}")
+
+
+if __name__ == "__main__":
+    main()
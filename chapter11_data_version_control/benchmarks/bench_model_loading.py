@@ -0,0 +1,102 @@
+"""Benchmark loading a large random forest from each artifact format.
+
+Each format is loaded in a fresh process, which then scores a batch of
+rows. Private memory (RssAnon) is what every scoring process pays for on
+its own. File-backed memory (RssFile) is shared by all processes that map
+the same files.
+
+Usage (from chapter11_data_version_control):
+    uv run python benchmarks/bench_model_loading.py
+"""
+
+import multiprocessing
+import pickle
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import joblib
+from sklearn.datasets import make_classification
+from sklearn.ensemble import RandomForestClassifier
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC))
+
+from model_io import ForestArrays  # noqa: E402
+
+N_TREES = 500
+N_ROWS = 20_000
+N_FEATURES = 20
+N_SCORED = 1_000
+
+
+def memory_mb():
+    """Return the private and file-backed resident memory of this process, in MB."""
+    memory = {}
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith(("RssAnon:", "RssFile:")):
+            name, kb = line.split()[:2]
+            memory[name.rstrip(":")] = int(kb) / 1024
+    return memory["RssAnon"], memory["RssFile"]
+
+
+def load_and_score(fmt, path, X):
+    """Load the model in the given format and score X, returning timings and memory growth."""
+    # Import everything before measuring, so only the model itself is counted
+    import sklearn.ensemble  # noqa: F401
+    sys.path.insert(0, str(SRC))
+    from model_io import ForestArrays  # noqa: F401
+
+    private_before, shared_before = memory_mb()
+    start = time.perf_counter()
+    if fmt == "pickle":
+        with open(path, "rb") as f:
+            model = pickle.load(f)
+    elif fmt == "joblib (mmap_mode='r')":
+        model = joblib.load(path, mmap_mode="r")
+    else:
+        model = ForestArrays.load(path)
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model.predict_proba(X)
+    score_time = time.perf_counter() - start
+
+    private_after, shared_after = memory_mb()
+    return load_time, score_time, private_after - private_before, shared_after - shared_before
+
+
+def main():
+    """Train a forest, save it in every format and load each in a fresh process."""
+    X, y = make_classification(N_ROWS, N_FEATURES, random_state=42)
+    model = RandomForestClassifier(n_estimators=N_TREES, random_state=42, n_jobs=-1).fit(X, y)
+
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        with open(directory / "model.pkl", "wb") as f:
+            pickle.dump(model, f)
+        joblib.dump(model, directory / "model.joblib")
+        ForestArrays.from_forest(model, [f"feature_{i}" for i in range(N_FEATURES)]).save(directory / "forest")
+
+        paths = {
+            "pickle": directory / "model.pkl",
+            "joblib (mmap_mode='r')": directory / "model.joblib",
+            "ForestArrays (mmap)": directory / "forest",
+        }
+        size_mb = sum(f.stat().st_size for f in (directory / "forest").iterdir()) / 1024**2
+        print(f"{N_TREES} trees, {size_mb:.0f} MB as flat arrays, scoring {N_SCORED} rows\n")
+        print(f"{'format':<26} {'load (s)':>9} {'score (s)':>10} {'private (MB)':>13} {'shared (MB)':>12}")
+
+        context = multiprocessing.get_context("spawn")
+        for fmt, path in paths.items():
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                load_time, score_time, private, shared = executor.submit(
+                    load_and_score, fmt, path, X[:N_SCORED]
+                ).result()
+            print(f"{fmt:<26} {load_time:>9.3f} {score_time:>10.3f} {private:>13.0f} {shared:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Typed columnar (Parquet) storage for data passed between pipeline stages."""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+def to_typed_frame(df):
+    """Store string columns as categories so they are written dictionary-encoded."""
+    df = df.copy()
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        df[col] = df[col].astype('category')
+    return df
+
+
+def build_schema(df):
+    """Build an explicit Arrow schema, with fixed int32 codes for category columns."""
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(schema):
+        if pa.types.is_dictionary(field.type):
+            # Keep the index type stable no matter how many categories there are
+            schema = schema.set(i, field.with_type(pa.dictionary(pa.int32(), field.type.value_type)))
+    return schema
+
+
+def write_table(df, path):
+    """Write a DataFrame to Parquet with an explicit schema and category dtypes."""
+    df = to_typed_frame(df)
+    table = pa.Table.from_pandas(df, schema=build_schema(df), preserve_index=False)
+    pq.write_table(table, path)
+    print(f"Wrote {table.num_rows} rows x {table.num_columns} columns to {path}")
+
+
+def read_table(path, columns=None):
+    """Read a Parquet file written by write_table, optionally only some columns."""
+    return pd.read_parquet(path, columns=columns)
+
+
+def read_column_names(path):
+    """Read the column names from the Parquet footer without loading any data."""
+    return pq.read_schema(path).names
+
+
+class TableWriter:
+    """Append DataFrame chunks to one Parquet file, using the first chunk's schema."""
+    
+    def __init__(self, path):
+        self.path = path
+        self.schema = None
+        self.writer = None
+        self.n_rows = 0
+    
+    def write(self, df):
+        """Convert a chunk to the file's schema and append it as a row group."""
+        df = to_typed_frame(df)
+        if self.writer is None:
+            self.schema = build_schema(df)
+            self.writer = pq.ParquetWriter(self.path, self.schema)
+        self.writer.write_table(pa.Table.from_pandas(df, schema=self.schema, preserve_index=False))
+        self.n_rows += len(df)
+    
+    def close(self):
+        """Finish the file."""
+        if self.writer is not None:
+            self.writer.close()
+            print(f"Wrote {self.n_rows} rows x {len(self.schema)} columns to {self.path}")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
@@ -5,6 +5,9 @@ import yaml
 import numpy as np
 from pathlib import Path
 
+from columnar import TableWriter, write_table
+from sketches import ColumnSample, ValueCounter
+
 
 def load_params():
     """Load parameters from params.yaml file."""
@@ -12,48 +15,179 @@ def load_params():
         return yaml.safe_load(f)
 
 
+def column_quantiles(values, q):
+    """Compute several quantiles of every column of a float array from a single sort."""
+    # NaN sorts to the end, so each column's observed values come first
+    values = np.sort(values, axis=0)
+    n_observed = values.shape[0] - np.isnan(values).sum(axis=0)
+    positions = np.outer(q, n_observed - 1).clip(0)
+    lower = np.floor(positions).astype(int)
+    upper = np.minimum(lower + 1, (n_observed - 1).clip(0))
+    columns = np.arange(values.shape[1])
+    low, high = values[lower, columns], values[upper, columns]
+    # Linear interpolation between neighbours, as in DataFrame.quantile
+    result = low + (high - low) * (positions - lower)
+    result[:, n_observed == 0] = np.nan
+    return result
+
+
 def clean_data(df, missing_threshold=0.1, outlier_method="iqr", outlier_factor=1.5):
-    """Clean the raw customer data."""
+    """Clean the raw customer data.
+    
+    Null counts, medians and quartiles are computed for all numeric columns
+    at once, and missing values are filled and outliers clipped on a single
+    array. Quartiles are taken from the observed values, before missing
+    values are filled with the median.
+    """
     print(f"Input data shape: {df.shape}")
     
     # Handle missing values
-    missing_ratio = df.isnull().sum() / len(df)
+    null_counts = df.isnull().sum()
+    missing_ratio = null_counts / len(df)
     high_missing_cols = missing_ratio[missing_ratio > missing_threshold].index
     if len(high_missing_cols) > 0:
         print(f"Dropping columns with >{missing_threshold*100}% missing: {list(high_missing_cols)}")
         df = df.drop(columns=high_missing_cols)
+        null_counts = null_counts.drop(high_missing_cols)
+    
+    # Medians and both quartiles of all numeric columns in one pass
+    numerical_cols = df.select_dtypes(include=[np.number]).columns
+    values = df[numerical_cols].to_numpy(dtype=float, copy=True)
+    Q1, median, Q3 = column_quantiles(values, [0.25, 0.5, 0.75])
     
     # Fill remaining missing values
-    for col in df.select_dtypes(include=[np.number]).columns:
-        if df[col].isnull().sum() > 0:
-            df[col] = df[col].fillna(df[col].median())
+    filled = null_counts[numerical_cols].to_numpy() > 0
+    np.copyto(values, median, where=np.isnan(values))
     
-    for col in df.select_dtypes(include=['object']).columns:
-        if df[col].isnull().sum() > 0:
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        if null_counts[col] > 0:
             df[col] = df[col].fillna(df[col].mode()[0])
     
     # Handle outliers for numerical columns
+    clipped = np.zeros(len(numerical_cols), dtype=bool)
     if outlier_method == "iqr":
-        numerical_cols = df.select_dtypes(include=[np.number]).columns
-        numerical_cols = numerical_cols.drop('customer_id', errors='ignore')
-        numerical_cols = numerical_cols.drop('churn', errors='ignore')
+        IQR = Q3 - Q1
+        lower_bound = Q1 - outlier_factor * IQR
+        upper_bound = Q3 + outlier_factor * IQR
         
-        for col in numerical_cols:
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - outlier_factor * IQR
-            upper_bound = Q3 + outlier_factor * IQR
-            
-            outliers_before = ((df[col] < lower_bound) | (df[col] > upper_bound)).sum()
-            if outliers_before > 0:
-                df[col] = df[col].clip(lower=lower_bound, upper=upper_bound)
-                print(f"Clipped {outliers_before} outliers in {col}")
+        # Never clip the identifier or the target
+        skip = numerical_cols.isin(['customer_id', 'churn'])
+        lower_bound[skip], upper_bound[skip] = -np.inf, np.inf
+        
+        outliers_before = ((values < lower_bound) | (values > upper_bound)).sum(axis=0)
+        clipped = outliers_before > 0
+        np.clip(values, lower_bound, upper_bound, out=values)
+        for col, count in zip(numerical_cols[clipped], outliers_before[clipped]):
+            print(f"Clipped {count} outliers in {col}")
+    
+    # Write back only the columns that changed
+    changed = filled | clipped
+    if changed.any():
+        df[numerical_cols[changed]] = values[:, changed]
     
     print(f"Cleaned data shape: {df.shape}")
     return df
 
 
+def profile_chunks(path, chunk_size):
+    """First streaming pass: summarize every column of a CSV file chunk by chunk."""
+    n_rows = 0
+    null_counts = None
+    for chunk in pd.read_csv(path, chunksize=chunk_size):
+        if null_counts is None:
+            null_counts = pd.Series(0, index=chunk.columns)
+            numerical_cols = chunk.select_dtypes(include=[np.number]).columns
+            sample = ColumnSample(len(numerical_cols), size=chunk_size)
+            minimum = np.full(len(numerical_cols), np.inf)
+            maximum = np.full(len(numerical_cols), -np.inf)
+            float_cols, counters = set(), {}
+        
+        n_rows += len(chunk)
+        null_counts += chunk.isnull().sum()
+        float_cols.update(chunk.select_dtypes(include=['float']).columns)
+        for col in chunk.select_dtypes(include=['object', 'string']).columns:
+            counters.setdefault(col, ValueCounter(capacity=chunk_size)).update(chunk[col])
+        
+        # A text column parses as float in a chunk where it is entirely missing
+        values = chunk[numerical_cols].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        sample.update(values)
+        minimum = np.fmin(minimum, np.fmin.reduce(values, axis=0))
+        maximum = np.fmax(maximum, np.fmax.reduce(values, axis=0))
+    
+    if null_counts is None:
+        raise ValueError(f"No rows in {path}")
+    
+    Q1, median, Q3 = column_quantiles(sample.values, [0.25, 0.5, 0.75])
+    stats = pd.DataFrame(
+        {'Q1': Q1, 'median': median, 'Q3': Q3, 'min': minimum, 'max': maximum},
+        index=numerical_cols,
+    ).drop(list(counters), errors='ignore')
+    modes = pd.Series({col: counter.mode() for col, counter in counters.items()}, dtype=object)
+    return n_rows, null_counts, stats, modes, float_cols
+
+
+def clean_data_streaming(input_path, output_path, chunk_size, missing_threshold=0.1,
+                         outlier_method="iqr", outlier_factor=1.5):
+    """Clean a CSV file in two passes over chunks, without loading it whole.
+    
+    The first pass counts nulls and keeps a sample of at most chunk_size
+    values per numeric column plus value counts per text column, so medians,
+    quartiles and modes are approximate once a column has more values than
+    that. The second pass fills, clips and appends each chunk to the output.
+    Memory stays proportional to chunk_size rather than to the file size.
+    """
+    print(f"Streaming {input_path} in chunks of {chunk_size} rows")
+    n_rows, null_counts, stats, modes, float_cols = profile_chunks(input_path, chunk_size)
+    print(f"Input data shape: ({n_rows}, {len(null_counts)})")
+    
+    # Handle missing values
+    missing_ratio = null_counts / n_rows
+    high_missing_cols = missing_ratio[missing_ratio > missing_threshold].index
+    if len(high_missing_cols) > 0:
+        print(f"Dropping columns with >{missing_threshold*100}% missing: {list(high_missing_cols)}")
+        null_counts = null_counts.drop(high_missing_cols)
+        stats = stats.drop(high_missing_cols, errors='ignore')
+        modes = modes.drop(high_missing_cols, errors='ignore')
+    
+    fill_values = pd.concat([stats['median'], modes])
+    fill_values = fill_values[null_counts[fill_values.index] > 0].to_dict()
+    
+    # Clip only columns whose range reaches past the IQR bounds
+    lower_bound = upper_bound = pd.Series(dtype=float)
+    if outlier_method == "iqr":
+        bounds = stats.drop(['customer_id', 'churn'], errors='ignore')
+        IQR = bounds['Q3'] - bounds['Q1']
+        lower_bound = bounds['Q1'] - outlier_factor * IQR
+        upper_bound = bounds['Q3'] + outlier_factor * IQR
+        has_outliers = (bounds['min'] < lower_bound) | (bounds['max'] > upper_bound)
+        lower_bound, upper_bound = lower_bound[has_outliers], upper_bound[has_outliers]
+    clip_cols = list(lower_bound.index)
+    
+    # Fix every column's type up front so all chunks share one schema
+    float_cols |= set(fill_values) | set(clip_cols)
+    dtypes = {col: 'float64' if col in float_cols else 'int64' for col in stats.index}
+    dtypes.update({col: 'str' for col in modes.index})
+    
+    outliers = pd.Series(0, index=clip_cols)
+    n_churned = n_missing = 0
+    with TableWriter(output_path) as writer:
+        for chunk in pd.read_csv(input_path, chunksize=chunk_size, dtype=dtypes):
+            chunk = chunk.drop(columns=high_missing_cols).fillna(fill_values)
+            if clip_cols:
+                values = chunk[clip_cols]
+                outliers += (values.lt(lower_bound) | values.gt(upper_bound)).sum()
+                chunk[clip_cols] = values.clip(lower=lower_bound, upper=upper_bound, axis=1)
+            
+            n_churned += chunk['churn'].sum()
+            n_missing += chunk.isnull().sum().sum()
+            writer.write(chunk)
+    
+    for col, count in outliers[outliers > 0].items():
+        print(f"Clipped {count} outliers in {col}")
+    print(f"Cleaned data shape: ({writer.n_rows}, {len(writer.schema)})")
+    return writer.n_rows, n_churned / writer.n_rows, n_missing
+
+
 def main():
     """Main data preparation function."""
     print("=== Data Preparation Stage ===")
@@ -62,29 +196,40 @@ def main():
     params = load_params()
     prep_params = params["data_preparation"]
     
-    # Load raw data
-    df = pd.read_csv("data/raw/customer_churn.csv")
-    print(f"Loaded raw data: {df.shape}")
-    
-    # Clean data
-    df_clean = clean_data(
-        df,
-        missing_threshold=prep_params["missing_threshold"],
-        outlier_method=prep_params["outlier_method"],
-        outlier_factor=prep_params["outlier_factor"]
-    )
-    
-    # Save cleaned data
+    clean_params = {
+        "missing_threshold": prep_params["missing_threshold"],
+        "outlier_method": prep_params["outlier_method"],
+        "outlier_factor": prep_params["outlier_factor"],
+    }
     Path("data/processed").mkdir(parents=True, exist_ok=True)
-    df_clean.to_csv("data/processed/clean_data.csv", index=False)
-    print("Saved cleaned data to data/processed/clean_data.csv")
+    
+    if prep_params.get("chunk_size"):
+        # Stream files that may not fit in memory
+        n_customers, churn_rate, n_missing = clean_data_streaming(
+            "data/raw/customer_churn.csv",
+            "data/processed/clean_data.parquet",
+            prep_params["chunk_size"],
+            **clean_params
+        )
+    else:
+        # Load raw data
+        df = pd.read_csv("data/raw/customer_churn.csv")
+        print(f"Loaded raw data: {df.shape}")
+        
+        # Clean data
+        df_clean = clean_data(df, **clean_params)
+        
+        # Save cleaned data
+        write_table(df_clean, "data/processed/clean_data.parquet")
+        n_customers, churn_rate = len(df_clean), df_clean['churn'].mean()
+        n_missing = df_clean.isnull().sum().sum()
+    print("Saved cleaned data to data/processed/clean_data.parquet")
     
     # Print basic statistics
     print(f"\nData Quality Summary:")
-    print(f"- Total customers: {len(df_clean)}")
-    print(f"- Churn rate: {df_clean['churn'].mean():.1%}")
-    print(f"- Missing values: {df_clean.isnull().sum().sum()}")
-
+    print(f"- Total customers: {n_customers}")
+    print(f"- Churn rate: {churn_rate:.1%}")
+    print(f"- Missing values: {n_missing}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
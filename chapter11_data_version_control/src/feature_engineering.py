@@ -3,10 +3,14 @@
 import pandas as pd
 import numpy as np
 import yaml
-from sklearn.preprocessing import StandardScaler, LabelEncoder
+from sklearn.preprocessing import StandardScaler
 from sklearn.feature_selection import SelectKBest, f_classif
 from pathlib import Path
 
+from columnar import read_table, write_table
+from feature_transform import FeatureTransformer, add_derived_features, encode_categories
+from stage_cache import StageCache, cache_key
+
 
 def load_params():
     """Load parameters from params.yaml file."""
@@ -14,27 +18,24 @@ def load_params():
         return yaml.safe_load(f)
 
 
-def engineer_features(df):
+def engineer_features(df, encoding='label', hash_buckets=1024):
     """Create new features from existing data."""
-    df = df.copy()
-    
     # Create new features
-    df['avg_monthly_charges'] = df['total_charges'] / (df['tenure'] + 1)  # +1 to avoid division by zero
-    df['tenure_months'] = df['tenure']
-    df['charges_per_month'] = df['monthly_charges']
+    df = add_derived_features(df)
     
     # Categorical encoding
-    categorical_cols = df.select_dtypes(include=['object']).columns
+    categorical_cols = df.select_dtypes(include=['object', 'category']).columns
     categorical_cols = categorical_cols.drop('customer_id', errors='ignore')
     
-    le_dict = {}
+    categories = {}
     for col in categorical_cols:
-        le = LabelEncoder()
-        df[col] = le.fit_transform(df[col].astype(str))
-        le_dict[col] = le
-        print(f"Encoded {col}: {len(le.classes_)} categories")
+        df[col], categories[col] = encode_categories(df[col], encoding, hash_buckets=hash_buckets)
+        if categories[col] is None:
+            print(f"Hashed {col} into {hash_buckets} buckets")
+        else:
+            print(f"Encoded {col}: {len(categories[col])} categories")
     
-    return df, le_dict
+    return df, categories
 
 
 def scale_features(df, target_col='churn', scaling_method='standard'):
@@ -65,6 +66,57 @@ def scale_features(df, target_col='churn', scaling_method='standard'):
     return df_scaled, scaler
 
 
+def correlated_features(X, threshold, block_size=1024):
+    """Find columns correlated above threshold with any earlier column.
+    
+    Correlations are computed tile by tile as float32 dot products of
+    standardized columns, so memory grows with columns x block_size rather
+    than with the full correlation matrix. Columns already found correlated
+    are left out of the remaining tiles. Values within 1e-3 of the threshold
+    are recomputed in float64 so float32 rounding never changes the result.
+    X must not contain missing values, which the prepare stage ensures.
+    """
+    values = X.to_numpy(dtype=np.float64)
+    n_rows, n_cols = values.shape
+    means = values.mean(axis=0)
+    norms = np.empty(n_cols)
+    
+    # One unit-norm centered column per row, so a dot product of two rows is a
+    # correlation. Built a block at a time to avoid a float64 copy of X.
+    standardized = np.empty((n_cols, n_rows), dtype=np.float32)
+    for start in range(0, n_cols, block_size):
+        block = values[:, start:start + block_size] - means[start:start + block_size]
+        block_norms = np.linalg.norm(block, axis=0)
+        block_norms[block_norms == 0] = np.inf  # Constant columns correlate with nothing
+        norms[start:start + block_size] = block_norms
+        standardized[start:start + block_size] = (block / block_norms).T
+    
+    dropped = np.zeros(n_cols, dtype=bool)
+    for start in range(0, n_cols, block_size):
+        targets = np.arange(start, min(start + block_size, n_cols))
+        # Earlier columns count even if they were dropped themselves
+        for compare_start in range(0, targets[-1], block_size):
+            active = targets[~dropped[targets]]
+            if len(active) == 0:
+                break
+            compare = np.arange(compare_start, min(compare_start + block_size, active[-1]))
+            tile = np.abs(standardized[compare] @ standardized[active].T)
+            
+            # Only pairs where the compared column comes first
+            earlier = compare[:, None] < active[None, :]
+            tile[~earlier] = 0
+            
+            rows, cols = np.nonzero(earlier & (np.abs(tile - threshold) <= 1e-3))
+            if len(rows) > 0:
+                i, j = compare[rows], active[cols]
+                dots = np.einsum('ij,ij->j', values[:, i] - means[i], values[:, j] - means[j])
+                tile[rows, cols] = np.abs(dots) / (norms[i] * norms[j])
+            
+            dropped[active[(tile > threshold).any(axis=0)]] = True
+    
+    return X.columns[dropped].tolist()
+
+
 def select_features(df, target_col='churn', max_features=20, correlation_threshold=0.95):
     """Select the most important features."""
     feature_cols = [col for col in df.columns if col not in ['customer_id', target_col]]
@@ -72,15 +124,7 @@ def select_features(df, target_col='churn', max_features=20, correlation_thresho
     y = df[target_col]
     
     # Remove highly correlated features
-    corr_matrix = X.corr().abs()
-    upper_triangle = corr_matrix.where(
-        np.triu(np.ones(corr_matrix.shape), k=1).astype(bool)
-    )
-    
-    high_corr_features = [
-        column for column in upper_triangle.columns 
-        if any(upper_triangle[column] > correlation_threshold)
-    ]
+    high_corr_features = correlated_features(X, correlation_threshold)
     
     if high_corr_features:
         X = X.drop(columns=high_corr_features)
@@ -107,20 +151,14 @@ def select_features(df, target_col='churn', max_features=20, correlation_thresho
     return df_selected, selected_features, selector
 
 
-def main():
-    """Main feature engineering function."""
-    print("=== Feature Engineering Stage ===")
-    
-    # Load parameters
-    params = load_params()
-    feature_params = params["feature_engineering"]
-    
-    # Load cleaned data
-    df = pd.read_csv("data/processed/clean_data.csv")
-    print(f"Loaded cleaned data: {df.shape}")
-    
+def build_features(df, feature_params):
+    """Encode, scale and select features, returning the features and fitted artifacts."""
     # Engineer features
-    df_engineered, label_encoders = engineer_features(df)
+    df_engineered, categories = engineer_features(
+        df,
+        encoding=feature_params["categorical_encoding"],
+        hash_buckets=feature_params["hash_buckets"]
+    )
     print(f"Engineered features: {df_engineered.shape}")
     
     # Scale features
@@ -141,10 +179,60 @@ def main():
         selected_features = [col for col in df_scaled.columns if col not in ['customer_id', 'churn']]
         feature_selector = None
     
+    return {
+        "features": df_final,
+        "categories": categories,
+        "scaler": scaler,
+        "selected_features": selected_features,
+        "feature_selector": feature_selector,
+    }
+
+
+def main():
+    """Main feature engineering function."""
+    print("=== Feature Engineering Stage ===")
+    
+    # Load parameters
+    params = load_params()
+    feature_params = params["feature_engineering"]
+    cache_params = params["stage_cache"]
+    
+    # Reuse artifacts computed from the same data, code and feature params
+    cache = StageCache(cache_params["dir"], max_bytes=cache_params["max_size_mb"] * 1024**2)
+    key = cache_key(
+        "featurize",
+        ["data/processed/clean_data.parquet", "src/feature_engineering.py", "src/feature_transform.py"],
+        params,
+        sections=["feature_engineering"]
+    )
+    artifacts = cache.get(key)
+    
+    if artifacts is None:
+        # Load cleaned data
+        df = read_table("data/processed/clean_data.parquet")
+        print(f"Loaded cleaned data: {df.shape}")
+        
+        artifacts = build_features(df, feature_params)
+        cache.put(key, artifacts)
+    df_final = artifacts["features"]
+    selected_features = artifacts["selected_features"]
+    
     # Save processed features
     Path("data/features").mkdir(parents=True, exist_ok=True)
-    df_final.to_csv("data/features/features.csv", index=False)
-    print(f"Saved engineered features to data/features/features.csv")
+    write_table(df_final, "data/features/features.parquet")
+    print(f"Saved engineered features to data/features/features.parquet")
+    
+    # Save the fitted transformation so new data can be scored without refitting
+    transformer = FeatureTransformer.from_fitted(
+        artifacts["categories"],
+        artifacts["scaler"],
+        selected_features,
+        encoding=feature_params["categorical_encoding"],
+        hash_buckets=feature_params["hash_buckets"]
+    )
+    Path("models").mkdir(parents=True, exist_ok=True)
+    transformer.save("models/feature_transformer.pkl")
+    print("Saved feature transformer to models/feature_transformer.pkl")
     
     # Print feature summary
     print(f"\nFeature Engineering Summary:")
@@ -0,0 +1,96 @@
+"""Fitted feature transformation, reusable for scoring new customer data."""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+
+
+def add_derived_features(df):
+    """Add the features derived from tenure and charges."""
+    return df.assign(
+        avg_monthly_charges=df['total_charges'] / (df['tenure'] + 1),  # +1 to avoid division by zero
+        tenure_months=df['tenure'],
+        charges_per_month=df['monthly_charges'],
+    )
+
+
+def encode_categories(values, encoding, categories=None, hash_buckets=1024):
+    """Encode a categorical column as integer codes.
+    
+    "label" gives the codes of sklearn's LabelEncoder on the values as
+    strings. "codes" uses pandas category codes without converting values to
+    strings. "hash" maps each value to one of hash_buckets buckets and needs
+    no fitted categories. Categories are fitted from values when None is
+    passed. Values outside the given categories get code -1.
+    
+    Returns the codes and the categories (None when hashing).
+    """
+    if encoding == "hash":
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        return (hashes % np.uint64(hash_buckets)).astype(np.int64), None
+    if encoding == "label":
+        values = values.astype(str)
+    elif encoding != "codes":
+        raise ValueError(f"Unknown categorical encoding: {encoding}")
+    
+    # Fitted categories come out sorted, except for columns that already are categorical
+    values = pd.Categorical(values, categories=categories)
+    return values.codes.astype(np.int64), values.categories
+
+
+class FeatureTransformer:
+    """Encoding, scaling and selection fitted by the featurize stage.
+    
+    transform_batch() applies them to new cleaned data without refitting,
+    computing only the selected features as one float array.
+    """
+    
+    def __init__(self, categories, feature_names, means, scales, encoding="label", hash_buckets=1024):
+        self.categories = categories
+        self.encoding = encoding
+        self.hash_buckets = hash_buckets
+        self.feature_names = list(feature_names)
+        self.means = np.asarray(means, dtype=np.float64)
+        self.scales = np.asarray(scales, dtype=np.float64)
+    
+    @classmethod
+    def from_fitted(cls, categories, scaler, selected_features, encoding="label", hash_buckets=1024):
+        """Collect what transform_batch needs from the fitted categories, scaler and selection."""
+        if scaler is None:
+            means, scales = np.zeros(len(selected_features)), np.ones(len(selected_features))
+        else:
+            positions = pd.Index(scaler.feature_names_in_).get_indexer(selected_features)
+            means, scales = scaler.mean_[positions], scaler.scale_[positions]
+        return cls(categories, selected_features, means, scales, encoding, hash_buckets)
+    
+    def transform_batch(self, df):
+        """Turn cleaned customer records into the model's feature matrix.
+        
+        Categories not seen while fitting are encoded as -1, except with
+        hash encoding, which puts them in a bucket like any other value.
+        """
+        df = add_derived_features(df)
+        values = np.empty((len(df), len(self.feature_names)), dtype=np.float64)
+        for i, col in enumerate(self.feature_names):
+            if col in self.categories:
+                values[:, i], _ = encode_categories(
+                    df[col], self.encoding, self.categories[col], self.hash_buckets
+                )
+            else:
+                values[:, i] = df[col].to_numpy(dtype=np.float64)
+        
+        values -= self.means
+        values /= self.scales
+        return pd.DataFrame(values, columns=self.feature_names, index=df.index)
+    
+    def save(self, path):
+        """Save the transformer with pickle."""
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+    
+    @staticmethod
+    def load(path):
+        """Load a transformer saved with save()."""
+        with open(path, "rb") as f:
+            return pickle.load(f)
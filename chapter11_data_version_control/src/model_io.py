@@ -0,0 +1,114 @@
+"""Random forest stored as flat arrays that scoring processes can memory-map."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+
+class ForestArrays:
+    """Nodes of all trees of a fitted RandomForestClassifier in a few flat arrays.
+    
+    Unpickling a scikit-learn forest copies every tree into private memory,
+    even when the pickle is loaded with joblib's mmap_mode. Saved with save()
+    and loaded with load(), these arrays are instead memory-mapped read-only,
+    so loading is nearly instant and every process scoring with the same
+    files shares their pages through the OS page cache.
+    """
+    
+    ARRAYS = ("roots", "left", "right", "feature", "threshold", "values", "classes")
+    
+    def __init__(self, roots, left, right, feature, threshold, values, classes, feature_names):
+        self.roots = roots
+        self.left = left
+        self.right = right
+        self.feature = feature
+        self.threshold = threshold
+        self.values = values
+        self.classes = classes
+        self.feature_names = list(feature_names)
+    
+    @classmethod
+    def from_forest(cls, model, feature_names):
+        """Flatten the trees of a fitted RandomForestClassifier."""
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        node_counts = np.array([tree.node_count for tree in trees])
+        roots = np.concatenate([[0], np.cumsum(node_counts)[:-1]])
+        
+        # Child indices become positions in the flat arrays; -1 marks a leaf
+        left = np.concatenate([
+            np.where(tree.children_left >= 0, tree.children_left + root, -1)
+            for tree, root in zip(trees, roots)
+        ])
+        right = np.concatenate([
+            np.where(tree.children_right >= 0, tree.children_right + root, -1)
+            for tree, root in zip(trees, roots)
+        ])
+        feature = np.concatenate([tree.feature for tree in trees]).clip(0)
+        threshold = np.concatenate([tree.threshold for tree in trees])
+        
+        # Class probabilities at each node, as DecisionTreeClassifier.predict_proba gives them
+        values = np.concatenate([tree.value[:, 0, :len(model.classes_)] for tree in trees])
+        totals = values.sum(axis=1, keepdims=True)
+        totals[totals == 0] = 1
+        values = values / totals
+        
+        # Object arrays would need pickle to load, so store string labels as text
+        classes = np.asarray(model.classes_)
+        if classes.dtype == object:
+            classes = classes.astype(str)
+        
+        return cls(
+            roots.astype(np.int64), left.astype(np.int64), right.astype(np.int64),
+            feature.astype(np.int64), threshold.astype(np.float64), values,
+            classes, feature_names,
+        )
+    
+    def save(self, directory):
+        """Save each array as a .npy file, plus the feature names, in directory."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(directory / f"{name}.npy", getattr(self, name))
+        with open(directory / "feature_names.json", "w") as f:
+            json.dump(self.feature_names, f)
+    
+    @classmethod
+    def load(cls, directory, mmap_mode="r"):
+        """Load arrays saved with save(), memory-mapped unless mmap_mode is None."""
+        directory = Path(directory)
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode=mmap_mode) for name in cls.ARRAYS}
+        with open(directory / "feature_names.json") as f:
+            feature_names = json.load(f)
+        return cls(**arrays, feature_names=feature_names)
+    
+    def predict_proba(self, X, batch_size=10_000):
+        """Average the class probabilities of the leaves each row reaches in every tree."""
+        # Trees compare float32 features against thresholds, like scikit-learn
+        X = np.asarray(X, dtype=np.float32)
+        n_trees = len(self.roots)
+        proba = np.empty((len(X), len(self.classes)))
+        
+        for start in range(0, len(X), batch_size):
+            rows = X[start:start + batch_size]
+            # One entry per (row, tree) pair, advanced a level at a time until it reaches a leaf
+            nodes = np.tile(self.roots, len(rows))
+            samples = np.repeat(np.arange(len(rows)), n_trees)
+            active = np.arange(len(nodes))
+            while len(active) > 0:
+                node = nodes[active]
+                left = self.left[node]
+                internal = left >= 0
+                active, node, left = active[internal], node[internal], left[internal]
+                
+                go_left = rows[samples[active], self.feature[node]] <= self.threshold[node]
+                nodes[active] = np.where(go_left, left, self.right[node])
+            
+            leaf_values = self.values[nodes].reshape(len(rows), n_trees, -1)
+            proba[start:start + len(rows)] = leaf_values.sum(axis=1) / n_trees
+        
+        return proba
+    
+    def predict(self, X):
+        """Predict the most probable class of each row."""
+        return self.classes[self.predict_proba(X).argmax(axis=1)]
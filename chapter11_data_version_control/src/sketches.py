@@ -0,0 +1,62 @@
+"""Bounded-memory summaries of columns that are read one chunk at a time."""
+
+import numpy as np
+import pandas as pd
+
+
+class ColumnSample:
+    """Uniform random sample of at most `size` observed values per column.
+
+    Every observed value gets a random key and the values with the smallest
+    keys are kept (bottom-k sampling), so the sample stays uniform over the
+    whole stream while memory is fixed at `size` rows. Columns with at most
+    `size` observed values are kept whole, so their quantiles are exact.
+    """
+
+    def __init__(self, n_columns, size, seed=42):
+        self.size = size
+        self.keys = np.full((0, n_columns), np.inf)
+        self.values = np.empty((0, n_columns))
+        self.rng = np.random.default_rng(seed)
+
+    def update(self, block):
+        """Add the rows of a 2-D float array. NaN values are never sampled."""
+        keys = self.rng.random(block.shape)
+        keys[np.isnan(block)] = np.inf
+        keys = np.concatenate([self.keys, keys])
+        values = np.concatenate([self.values, block])
+
+        if len(keys) > self.size:
+            keep = np.argpartition(keys, self.size - 1, axis=0)[:self.size]
+            keys = np.take_along_axis(keys, keep, axis=0)
+            values = np.take_along_axis(values, keep, axis=0)
+
+        self.keys, self.values = keys, values
+        return self
+
+
+class ValueCounter:
+    """Counts of the most frequent values of a column, at most `capacity` of them.
+
+    When more distinct values are seen, only the most frequent ones are kept,
+    so the mode stays right for any column whose mode is clearly frequent.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=float)
+
+    def update(self, values):
+        """Add the values of a Series. Missing values are not counted."""
+        counts = self.counts.add(values.value_counts(), fill_value=0)
+        if len(counts) > self.capacity:
+            counts = counts.nlargest(self.capacity)
+        self.counts = counts
+        return self
+
+    def mode(self):
+        """Return the most frequent value, the smallest one on ties as Series.mode() does."""
+        if self.counts.empty:
+            return np.nan
+        top = self.counts[self.counts == self.counts.max()]
+        return top.index.sort_values()[0]
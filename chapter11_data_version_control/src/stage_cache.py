@@ -0,0 +1,87 @@
+"""Content-addressed cache for artifacts computed inside pipeline stages."""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+
+def file_digest(path, block_size=1 << 20):
+    """Hash a file's content block by block, so large files are never loaded whole."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_key(stage, paths, params, sections):
+    """Build a key from the stage name, its input files and the params sections it reads.
+    
+    Params outside the given sections do not change the key, so a stage is
+    not recomputed when only another stage's settings change.
+    """
+    payload = {
+        "stage": stage,
+        "files": {str(path): file_digest(path) for path in paths},
+        "params": {section: params[section] for section in sections},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class StageCache:
+    """Local store of pickled stage artifacts, addressed by cache key.
+    
+    When the store grows beyond max_bytes, the least recently used entries
+    are deleted first.
+    """
+    
+    def __init__(self, root=".cache/stages", max_bytes=512 * 1024**2):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+    
+    def _path(self, key):
+        return self.root / key[:2] / f"{key}.pkl"
+    
+    def get(self, key):
+        """Return the artifacts stored under key, or None if there are none."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                artifacts = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        
+        # The modification time records the last use for eviction
+        os.utime(path)
+        print(f"Stage cache hit: {key[:12]}")
+        return artifacts
+    
+    def put(self, key, artifacts):
+        """Store artifacts under key, then evict entries beyond the size limit."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Write to a temporary file first so a reader never sees a partial entry
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+            pickle.dump(artifacts, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, path)
+        print(f"Stored stage cache entry: {key[:12]} ({path.stat().st_size / 1024**2:.1f} MB)")
+        self.evict()
+    
+    def evict(self):
+        """Delete the least recently used entries until the store fits in max_bytes."""
+        entries = []
+        for path in self.root.glob("*/*.pkl"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            print(f"Evicted stage cache entry: {path.stem[:12]}")
@@ -0,0 +1,232 @@
+"""Hyperparameter sweep over the random forest settings of the churn model."""
+
+import itertools
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+from columnar import read_column_names, read_table
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score, f1_score, roc_auc_score
+from sklearn.model_selection import train_test_split
+
+# Arrays shared with the worker processes, set by attach_shared_data
+_shared = {}
+
+
+def load_params():
+    """Load parameters from params.yaml file."""
+    with open("params.yaml", "r") as f:
+        return yaml.safe_load(f)
+
+
+def share_array(array):
+    """Copy an array into a new shared memory block, returning the block and how to attach to it."""
+    block = SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def attach_block(name):
+    """Attach to an existing shared memory block without taking ownership of it."""
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no track argument
+        block = SharedMemory(name=name)
+        resource_tracker.unregister(block._name, "shared_memory")
+        return block
+
+
+def attach_shared_data(specs, n_fit):
+    """Worker initializer: view the shared arrays without copying them."""
+    for key, (name, shape, dtype) in specs.items():
+        block = attach_block(name)
+        _shared[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        _shared[f"{key}_block"] = block  # Keep the block open while the view is used
+    _shared["n_fit"] = n_fit
+
+
+def run_trial(model_params, n_samples, n_jobs):
+    """Fit a forest on the first n_samples fit rows and score it on the validation rows."""
+    X, y, n_fit = _shared["X"], _shared["y"], _shared["n_fit"]
+    model = RandomForestClassifier(**model_params, n_jobs=n_jobs)
+    
+    # Fit rows are shuffled, so every prefix is a random subsample
+    start = time.perf_counter()
+    model.fit(X[:n_samples], y[:n_samples])
+    fit_seconds = time.perf_counter() - start
+    
+    X_val, y_val = X[n_fit:], y[n_fit:]
+    # A small rung's prefix may hold a single class, leaving one probability column
+    positive = np.flatnonzero(model.classes_ == 1)
+    if len(positive) > 0:
+        proba = model.predict_proba(X_val)[:, positive[0]]
+    else:
+        proba = np.zeros(len(X_val))
+    y_pred = (proba > 0.5).astype(y_val.dtype)
+    return {
+        "accuracy": accuracy_score(y_val, y_pred),
+        "f1_score": f1_score(y_val, y_pred, zero_division=0),
+        # AUC is undefined when the validation rows hold a single class
+        "roc_auc": roc_auc_score(y_val, proba) if len(np.unique(y_val)) > 1 else np.nan,
+        "fit_seconds": fit_seconds,
+    }
+
+
+def make_candidates(search_space, method="grid", n_trials=20, random_state=42):
+    """List every combination of the search space, or n_trials random ones."""
+    names = list(search_space)
+    combinations = list(itertools.product(*(search_space[name] for name in names)))
+    if method == "random" and n_trials < len(combinations):
+        rng = np.random.default_rng(random_state)
+        chosen = rng.choice(len(combinations), size=n_trials, replace=False)
+        combinations = [combinations[i] for i in sorted(chosen)]
+    elif method not in ("grid", "random"):
+        raise ValueError(f"Unknown search method: {method}")
+    return [dict(zip(names, values, strict=True)) for values in combinations]
+
+
+def halving_schedule(n_candidates, n_fit, factor, min_samples):
+    """Return the number of fit rows for each rung of successive halving.
+    
+    The last rung uses all fit rows, and each earlier rung 1/factor as many.
+    There are enough rungs to narrow the candidates down to about one,
+    unless the first rung would get fewer than min_samples rows.
+    """
+    if factor <= 1 or n_candidates <= 1:
+        return [n_fit]
+    
+    n_rungs = 1 + math.ceil(math.log(n_candidates) / math.log(factor))
+    while n_rungs > 1 and n_fit // factor ** (n_rungs - 1) < min_samples:
+        n_rungs -= 1
+    return [n_fit // factor ** (n_rungs - 1 - rung) for rung in range(n_rungs)]
+
+
+def balance_jobs(n_trials, n_jobs=-1):
+    """Split the cores between parallel trials and the threads of each forest."""
+    n_cores = os.cpu_count() if n_jobs == -1 else n_jobs
+    n_workers = max(1, min(n_trials, n_cores))
+    return n_workers, max(1, n_cores // n_workers)
+
+
+def load_sweep_data(eval_params, validation_size):
+    """Read the features once and split off the test rows and a validation set.
+    
+    Returns X with the shuffled fit rows first and the validation rows last,
+    the target in the same order, and the number of fit rows. The test rows
+    used by the evaluate stage are left out entirely.
+    """
+    feature_path = "data/features/features.parquet"
+    columns = [col for col in read_column_names(feature_path) if col != "customer_id"]
+    df = read_table(feature_path, columns=columns)
+    print(f"Loaded feature data: {df.shape}")
+    
+    X = df.drop(columns="churn").to_numpy(dtype=np.float32)
+    y = df["churn"].to_numpy()
+    
+    # Same split as the training stage, then a validation set from the training rows
+    X_train, _, y_train, _ = train_test_split(
+        X, y, test_size=eval_params["test_size"], random_state=eval_params["random_state"], stratify=y
+    )
+    X_fit, X_val, y_fit, y_val = train_test_split(
+        X_train, y_train, test_size=validation_size, random_state=eval_params["random_state"], stratify=y_train
+    )
+    return np.concatenate([X_fit, X_val]), np.concatenate([y_fit, y_val]), len(X_fit)
+
+
+def run_sweep(candidates, schedule, specs, n_fit, metric="accuracy", factor=3, n_jobs=-1, random_state=42):
+    """Evaluate candidates rung by rung, keeping the best 1/factor of them after each rung.
+    
+    Returns one row per trial and the best candidate of the last rung with its score.
+    """
+    results = []
+    for rung, n_samples in enumerate(schedule):
+        n_workers, forest_jobs = balance_jobs(len(candidates), n_jobs)
+        print(f"Rung {rung}: {len(candidates)} trials on {n_samples} rows "
+              f"({n_workers} parallel trials x {forest_jobs} forest jobs)")
+        
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=attach_shared_data, initargs=(specs, n_fit)
+        ) as executor:
+            futures = [
+                executor.submit(run_trial, {**params, "random_state": random_state}, n_samples, forest_jobs)
+                for params in candidates
+            ]
+            scores = [future.result() for future in futures]
+        
+        for params, score in zip(candidates, scores, strict=True):
+            results.append({
+                "trial": len(results),
+                "rung": rung,
+                "n_samples": n_samples,
+                "n_jobs": forest_jobs,
+                **params,
+                **score,
+            })
+        
+        # Undefined scores (NaN) rank last
+        values = np.nan_to_num([score[metric] for score in scores], nan=-np.inf)
+        if rung < len(schedule) - 1:
+            n_keep = math.ceil(len(candidates) / factor)
+            best = np.argsort(-values, kind="stable")[:n_keep]
+            candidates = [candidates[i] for i in sorted(best)]
+    
+    best = int(np.argmax(values))
+    return pd.DataFrame(results), candidates[best], scores[best][metric]
+
+
+def main():
+    """Main hyperparameter sweep function."""
+    print("=== Hyperparameter Sweep ===")
+    
+    # Load parameters
+    params = load_params()
+    sweep_params = params["sweep"]
+    eval_params = params["evaluation"]
+    
+    # Load the data once and share it with every worker process
+    X, y, n_fit = load_sweep_data(eval_params, sweep_params["validation_size"])
+    blocks, specs = zip(*(share_array(array) for array in (X, y)), strict=True)
+    specs = dict(zip(["X", "y"], specs, strict=True))
+    
+    try:
+        candidates = make_candidates(
+            sweep_params["search_space"],
+            method=sweep_params["method"],
+            n_trials=sweep_params["n_trials"],
+            random_state=eval_params["random_state"]
+        )
+        schedule = halving_schedule(
+            len(candidates), n_fit, sweep_params["halving_factor"], sweep_params["min_samples"]
+        )
+        results, best_params, best_score = run_sweep(
+            candidates, schedule, specs, n_fit,
+            metric=sweep_params["metric"],
+            factor=sweep_params["halving_factor"],
+            n_jobs=sweep_params["n_jobs"],
+            random_state=params["model"]["random_state"]
+        )
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    
+    # Save one row per trial
+    Path("metrics").mkdir(parents=True, exist_ok=True)
+    results.to_csv("metrics/sweep.csv", index=False)
+    print(f"Saved {len(results)} trial results to metrics/sweep.csv")
+    
+    print(f"\nBest {sweep_params['metric']}: {best_score:.4f}")
+    for name, value in best_params.items():
+        print(f"  {name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,15 @@ import pandas as pd
 import numpy as np
 import yaml
 import pickle
+import os
+from sklearn.base import clone
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import StratifiedKFold, cross_val_predict, train_test_split
 from pathlib import Path
 
+from columnar import read_column_names, read_table, write_table
+from model_io import ForestArrays
+
 
 def load_params():
     """Load parameters from params.yaml file."""
@@ -63,6 +68,26 @@ def train_model(X_train, y_train, model_params):
     return model
 
 
+def cross_validate_predictions(model, X, y, cv_folds=5, n_jobs=None):
+    """Predict every row with a model trained on the other folds, fitting folds in parallel."""
+    splitter = StratifiedKFold(n_splits=cv_folds)
+    folds = np.empty(len(y), dtype=np.int64)
+    for fold, (_, held_out) in enumerate(splitter.split(X, y)):
+        folds[held_out] = fold
+    
+    # Split the cores between parallel folds and the threads of each forest,
+    # instead of every fold's forest using all of them
+    model = clone(model)
+    if n_jobs is not None and n_jobs != 1:
+        n_cores = n_jobs if n_jobs > 0 else os.cpu_count() + 1 + n_jobs
+        n_jobs = max(1, min(cv_folds, n_cores))
+        model.set_params(n_jobs=max(1, n_cores // n_jobs))
+    
+    print(f"Computing out-of-fold predictions ({cv_folds} folds)...")
+    cv_predictions = cross_val_predict(model, X, y, cv=splitter, n_jobs=n_jobs)
+    return cv_predictions, folds
+
+
 def main():
     """Main model training function."""
     print("=== Model Training Stage ===")
@@ -72,8 +97,10 @@ def main():
     model_params = params["model"]
     eval_params = params["evaluation"]
     
-    # Load feature data
-    df = pd.read_csv("data/features/features.csv")
+    # Load feature data, reading only the feature and target columns
+    feature_path = "data/features/features.parquet"
+    columns = [col for col in read_column_names(feature_path) if col != 'customer_id']
+    df = read_table(feature_path, columns=columns)
     print(f"Loaded feature data: {df.shape}")
     
     # Prepare training/test split
@@ -94,6 +121,24 @@ def main():
     print(f"- Training accuracy: {train_accuracy:.4f}")
     print(f"- Test accuracy: {test_accuracy:.4f}")
     
+    # Predictions for evaluation: the split, out-of-fold and final model predictions of every row
+    X = df[X_train.columns]
+    y = df['churn']
+    cv_predictions, folds = cross_validate_predictions(
+        model, X, y,
+        cv_folds=eval_params["cv_folds"],
+        n_jobs=eval_params["n_jobs"]
+    )
+    predictions = pd.DataFrame({
+        'row': np.arange(len(df)),
+        'churn': y.to_numpy(),
+        'test': df.index.isin(X_test.index),
+        'fold': folds,
+        'cv_prediction': cv_predictions,
+        'prediction': model.predict(X),
+        'probability': model.predict_proba(X)[:, 1],
+    })
+    
     # Save model
     Path("models").mkdir(parents=True, exist_ok=True)
     with open("models/model.pkl", "wb") as f:
@@ -104,6 +149,14 @@ def main():
         }, f)
     
     print("Saved trained model to models/model.pkl")
+    
+    # Flat copy of the trees that scoring processes can memory-map and share
+    ForestArrays.from_forest(model, X_train.columns).save("models/forest")
+    print("Saved memory-mappable forest to models/forest")
+    
+    Path("data/predictions").mkdir(parents=True, exist_ok=True)
+    write_table(predictions, "data/predictions/predictions.parquet")
+    print("Saved predictions to data/predictions/predictions.parquet")
 
 
 if __name__ == "__main__":
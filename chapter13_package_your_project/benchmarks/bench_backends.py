@@ -0,0 +1,77 @@
+"""
+Benchmark processors on pandas, pyarrow and polars inputs.
+
+Data arriving as an Arrow table can either be converted to pandas first or
+passed to the processors directly. This script times both routes, plus
+polars, for fit and transform of each processor.
+
+Usage:
+    uv run python benchmarks/bench_backends.py
+"""
+
+import time
+
+import numpy as np
+import polars as pl
+import pyarrow as pa
+
+from pandas_processors import (
+    MeanMedianImputer, MinMaxNormalizer, SimpleImputer, StandardNormalizer,
+)
+
+N_ROWS = 1_000_000
+N_COLS = 20
+MISSING_RATE = 0.1
+REPEATS = 3
+
+
+def best_time_ms(func) -> float:
+    """Return the fastest of REPEATS runs of func, in milliseconds."""
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def make_table() -> pa.Table:
+    """Create an Arrow table of floats with nulls for missing values."""
+    rng = np.random.default_rng(42)
+    values = rng.standard_normal((N_ROWS, N_COLS))
+    missing = rng.random((N_ROWS, N_COLS)) < MISSING_RATE
+    return pa.table({
+        f"feature_{i+1}": pa.array(values[:, i], mask=missing[:, i])
+        for i in range(N_COLS)
+    })
+
+
+def main():
+    """Print fit plus transform time for each processor and input route."""
+    table = make_table()
+    df = table.to_pandas()
+    polars_df = pl.from_arrow(table)
+
+    routes = {
+        "pandas": lambda run: run(df),
+        "arrow->pandas": lambda run: run(table.to_pandas()),
+        "arrow": lambda run: run(table),
+        "polars": lambda run: run(polars_df),
+    }
+    processors = {
+        "MeanMedianImputer(mean)": lambda data: MeanMedianImputer().fit_transform(data),
+        "MeanMedianImputer(median)": lambda data: MeanMedianImputer("median").fit_transform(data),
+        "SimpleImputer": lambda data: SimpleImputer().transform(data),
+        "MinMaxNormalizer": lambda data: MinMaxNormalizer().fit_transform(data),
+        "StandardNormalizer": lambda data: StandardNormalizer().fit_transform(data),
+    }
+
+    print(f"{N_ROWS} rows x {N_COLS} columns, {MISSING_RATE:.0%} missing\n")
+    print(f"{'processor':<28}" + "".join(f"{route + ' (ms)':>20}" for route in routes))
+    for name, run in processors.items():
+        times = [best_time_ms(lambda: route(run)) for route in routes.values()]
+        print(f"{name:<28}" + "".join(f"{ms:>20.1f}" for ms in times))
+
+
+if __name__ == "__main__":
+    main()
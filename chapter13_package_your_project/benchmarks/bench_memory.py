@@ -0,0 +1,67 @@
+"""
+Benchmark peak memory of copying versus in-place transforms.
+
+Peak memory is measured with tracemalloc, which tracks NumPy allocations,
+and is reported relative to the size of the input DataFrame.
+
+Usage:
+    uv run python benchmarks/bench_memory.py
+"""
+
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from pandas_processors import (
+    MeanMedianImputer, MinMaxNormalizer, SimpleImputer, StandardNormalizer,
+)
+
+N_ROWS = 200_000
+N_COLS = 50
+
+
+def peak_memory_mb(func) -> float:
+    """Return the peak memory allocated while running func, in MB."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def make_data(missing_rate: float) -> pd.DataFrame:
+    """Create a float DataFrame with the given share of missing values."""
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(
+        rng.standard_normal((N_ROWS, N_COLS)),
+        columns=[f"feature_{i+1}" for i in range(N_COLS)],
+    )
+    return df.mask(rng.random(df.shape) < missing_rate)
+
+
+def main():
+    """Print peak memory for each processor with copy=True and copy=False."""
+    input_mb = make_data(0.0).memory_usage(index=False).sum() / 1e6
+    print(f"{N_ROWS} rows x {N_COLS} columns, input size {input_mb:.0f} MB\n")
+    print(f"{'processor':<32} {'copy=True (MB)':>15} {'copy=False (MB)':>16}")
+
+    cases = [
+        ("MeanMedianImputer", 0.1, lambda df: MeanMedianImputer().fit(df)),
+        ("SimpleImputer", 0.1, lambda df: SimpleImputer()),
+        ("SimpleImputer (no missing)", 0.0, lambda df: SimpleImputer()),
+        ("MinMaxNormalizer", 0.0, lambda df: MinMaxNormalizer().fit(df)),
+        ("StandardNormalizer", 0.0, lambda df: StandardNormalizer().fit(df)),
+    ]
+    for name, missing_rate, make in cases:
+        peaks = []
+        for copy in (True, False):
+            df = make_data(missing_rate)
+            processor = make(df)
+            peaks.append(peak_memory_mb(lambda: processor.transform(df, copy=copy)))
+        print(f"{name:<32} {peaks[0]:>15.0f} {peaks[1]:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark multi-process fitting against the number of worker processes.
+
+Fits MeanMedianImputer(strategy="median") and StandardNormalizer on a wide
+frame with increasing n_jobs and reports the speedup over n_jobs=1.
+
+Usage:
+    uv run python benchmarks/bench_parallel.py
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from pandas_processors import MeanMedianImputer, StandardNormalizer
+
+N_ROWS = 50_000
+N_COLS = 1_000
+
+
+def time_fit(processor, df: pd.DataFrame) -> float:
+    """Return the best wall-clock time of three fits, in seconds."""
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        processor.fit(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Print fit time and speedup for each worker count."""
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(
+        rng.standard_normal((N_ROWS, N_COLS)),
+        columns=[f"feature_{i+1}" for i in range(N_COLS)],
+    )
+    df = df.mask(rng.random(df.shape) < 0.1)
+
+    n_cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, n_cores} & set(range(1, n_cores + 1)))
+    print(f"{N_ROWS} rows x {N_COLS} columns, {n_cores} CPU cores")
+
+    for name, make in [
+        ("median imputer", lambda n: MeanMedianImputer(strategy="median", n_jobs=n)),
+        ("standard normalizer", lambda n: StandardNormalizer(n_jobs=n)),
+    ]:
+        print(f"\n{name}")
+        print(f"{'n_jobs':>7} {'fit (s)':>9} {'speedup':>8}")
+        baseline = None
+        for n_jobs in worker_counts:
+            seconds = time_fit(make(n_jobs), df)
+            baseline = baseline or seconds
+            print(f"{n_jobs:>7} {seconds:>9.3f} {baseline / seconds:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark loading fitted processors with pickle versus memory mapping.
+
+A StandardNormalizer is fit on a small DataFrame with a growing number of
+columns, saved with pickle and with save(), and loaded back. Memory-mapped
+loads only parse the header, which does not hold the column labels, so their
+time stays flat as columns grow; the benchmark fails if it does not.
+
+Usage:
+    uv run python benchmarks/bench_serialize.py
+"""
+
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from pandas_processors import StandardNormalizer
+
+COLUMN_COUNTS = [1_000, 10_000, 50_000]
+REPEATS = 20
+# Largest allowed ratio of memory-mapped load times at the most and fewest columns
+MAX_MMAP_GROWTH = 3
+
+
+def best_time_ms(func) -> float:
+    """Return the fastest of REPEATS runs of func, in milliseconds."""
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    """Print save size and load time for each column count."""
+    mmap_times = []
+    print(f"{'columns':>8} {'pickle (ms)':>12} {'load (ms)':>10} {'mmap (ms)':>10} {'size (MB)':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_cols in COLUMN_COUNTS:
+            rng = np.random.default_rng(42)
+            df = pd.DataFrame(
+                rng.standard_normal((10, n_cols)),
+                columns=[f"feature_{i+1}" for i in range(n_cols)],
+            )
+            # The fitted dictionaries are what had to be pickled before save() existed
+            normalizer = StandardNormalizer().fit(df)
+            state = {"mean_": normalizer.mean_, "std_": normalizer.std_}
+
+            pickle_path = Path(tmp) / f"normalizer_{n_cols}.pkl"
+            pickle_path.write_bytes(pickle.dumps(state))
+            binary_path = normalizer.save(Path(tmp) / f"normalizer_{n_cols}.bin")
+
+            pickle_ms = best_time_ms(lambda: pickle.loads(pickle_path.read_bytes()))
+            read_ms = best_time_ms(lambda: StandardNormalizer.load(binary_path, mmap=False))
+            mmap_ms = best_time_ms(lambda: StandardNormalizer.load(binary_path))
+            size_mb = binary_path.stat().st_size / 1e6
+            mmap_times.append(mmap_ms)
+
+            print(f"{n_cols:>8} {pickle_ms:>12.2f} {read_ms:>10.2f} {mmap_ms:>10.2f} {size_mb:>10.2f}")
+
+    growth = mmap_times[-1] / mmap_times[0]
+    assert growth < MAX_MMAP_GROWTH, (
+        f"Memory-mapped loads took {growth:.1f}x longer at {COLUMN_COUNTS[-1]} columns "
+        f"than at {COLUMN_COUNTS[0]}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Benchmark suite with regression gating.
+
+Times fit and transform of every processor across row counts, column
+counts, missing rates and dtypes, and records the wall-clock time and the
+peak resident memory (RSS) of each case. Every case runs in a fresh
+process, so memory measurements do not leak between cases.
+
+Results are saved as JSON. The compare command checks a run against a
+stored baseline and exits with status 1 when a tracked metric regressed by
+more than the threshold, so it can gate CI.
+
+Usage:
+    uv run python benchmarks/suite.py run --profile quick --output baseline.json
+    uv run python benchmarks/suite.py run --profile quick --output current.json
+    uv run python benchmarks/suite.py compare baseline.json current.json --threshold 0.2
+"""
+
+import argparse
+import datetime
+import gc
+import itertools
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pandas_processors import (
+    MeanMedianImputer, MinMaxNormalizer, SimpleImputer, StandardNormalizer,
+)
+
+PROFILES = {
+    "quick": {
+        "rows": [1_000, 100_000],
+        "cols": [10, 100],
+        "missing_rates": [0.0, 0.1],
+        "dtypes": ["float64"],
+        "max_cells": 10_000_000,
+    },
+    "full": {
+        "rows": [1_000, 100_000, 1_000_000, 10_000_000],
+        "cols": [10, 100, 1_000, 10_000],
+        "missing_rates": [0.0, 0.1, 0.5],
+        "dtypes": ["float64", "float32", "int64"],
+        # 800 MB as float64. This leaves 1,000 rows with up to 10,000 columns,
+        # 100,000 rows with up to 1,000, 1,000,000 rows with up to 100 and
+        # 10,000,000 rows with 10.
+        "max_cells": 100_000_000,
+    },
+}
+
+PROCESSORS = {
+    "MeanMedianImputer(mean)": lambda: MeanMedianImputer(strategy="mean"),
+    "MeanMedianImputer(median)": lambda: MeanMedianImputer(strategy="median"),
+    "SimpleImputer": lambda: SimpleImputer(),
+    "MinMaxNormalizer": lambda: MinMaxNormalizer(),
+    "StandardNormalizer": lambda: StandardNormalizer(),
+}
+
+METRICS = ("time_s", "peak_rss_mb")
+
+
+def iter_cases(profile: str, pattern: str = "") -> Iterator[Tuple[str, Dict]]:
+    """Yield (case id, parameters) for every case of a profile matching pattern."""
+    grid = PROFILES[profile]
+    for rows, cols, missing_rate, dtype in itertools.product(
+        grid["rows"], grid["cols"], grid["missing_rates"], grid["dtypes"]
+    ):
+        if rows * cols > grid["max_cells"]:
+            continue  # Shapes over the profile's cell limit would not fit in memory
+        if dtype.startswith("int") and missing_rate > 0:
+            continue  # Integer columns cannot hold missing values
+        for processor in PROCESSORS:
+            operations = ["transform"] if processor == "SimpleImputer" else ["fit", "transform"]
+            for operation in operations:
+                case_id = (
+                    f"{processor}.{operation}/rows={rows}/cols={cols}"
+                    f"/missing={missing_rate}/dtype={dtype}"
+                )
+                if pattern in case_id:
+                    yield case_id, {
+                        "processor": processor, "operation": operation, "rows": rows,
+                        "cols": cols, "missing_rate": missing_rate, "dtype": dtype,
+                    }
+
+
+def make_data(rows: int, cols: int, missing_rate: float, dtype: str) -> pd.DataFrame:
+    """Create a DataFrame of the given shape, share of missing values and dtype."""
+    rng = np.random.default_rng(42)
+    if dtype.startswith("int"):
+        values = rng.integers(0, 1_000, size=(rows, cols), dtype=dtype)
+    else:
+        values = rng.standard_normal((rows, cols)).astype(dtype)
+        if missing_rate > 0:
+            values[rng.random((rows, cols)) < missing_rate] = np.nan
+    return pd.DataFrame(values, columns=[f"feature_{i+1}" for i in range(cols)])
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident memory of this process, in MB."""
+    status = Path("/proc/self/status")
+    if status.exists():
+        # VmHWM can be reset through clear_refs, unlike ru_maxrss
+        for line in status.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def reset_peak_rss() -> None:
+    """Reset the peak to the current resident memory where the OS allows it (Linux)."""
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        pass
+
+
+def run_case(params: Dict, repeat: int) -> Dict[str, float]:
+    """
+    Run one case and return its metrics.
+
+    time_s is the fastest of repeat runs. peak_rss_mb is how far the
+    operation pushed the process's peak memory above its level after the
+    data was created and the processor fit, i.e. the extra memory the
+    operation needed. Outside Linux the peak cannot be reset, so memory
+    used while fitting before a transform case can hide the transform's.
+    """
+    df = make_data(params["rows"], params["cols"], params["missing_rate"], params["dtype"])
+    processor = PROCESSORS[params["processor"]]()
+    if params["operation"] == "fit":
+        operation = processor.fit
+    else:
+        if hasattr(processor, "fit"):
+            processor.fit(df)
+        operation = processor.transform
+
+    gc.collect()
+    reset_peak_rss()
+    rss_before = peak_rss_mb()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation(df)
+        times.append(time.perf_counter() - start)
+
+    return {"time_s": min(times), "peak_rss_mb": peak_rss_mb() - rss_before}
+
+
+def run(profile: str, pattern: str, repeat: int) -> Dict:
+    """Run every matching case in its own process and collect the results."""
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for case_id, params in iter_cases(profile, pattern):
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results[case_id] = executor.submit(run_case, params, repeat).result()
+        metrics = results[case_id]
+        print(f"{case_id:<90} {metrics['time_s'] * 1000:>10.2f} ms "
+              f"{metrics['peak_rss_mb']:>9.1f} MB", flush=True)
+
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "profile": profile,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "results": results,
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float,
+            min_time: float, min_rss: float) -> List[str]:
+    """
+    Compare two runs and return a description of every regression.
+
+    A metric regresses when it grew by more than threshold (0.2 = 20%).
+    Changes below min_time seconds or min_rss MB are treated as noise.
+    """
+    floors = {"time_s": min_time, "peak_rss_mb": min_rss}
+    regressions = []
+    for case_id, metrics in current["results"].items():
+        if case_id not in baseline["results"]:
+            continue
+        for metric in METRICS:
+            old, new = baseline["results"][case_id][metric], metrics[metric]
+            if new - old > floors[metric] and new > old * (1 + threshold):
+                change = (new / old - 1) if old > 0 else float("inf")
+                regressions.append(f"{case_id} {metric}: {old:.4g} -> {new:.4g} (+{change:.0%})")
+    return regressions
+
+
+def main():
+    """Parse the command line and run or compare benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmark suite")
+    run_parser.add_argument("--profile", choices=PROFILES, default="quick")
+    run_parser.add_argument("--filter", default="", help="Only run cases whose id contains this")
+    run_parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the fastest counts")
+    run_parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+
+    compare_parser = commands.add_parser("compare", help="Compare results against a baseline")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.2,
+                                help="Allowed relative increase, e.g. 0.2 for 20%%")
+    compare_parser.add_argument("--min-time", type=float, default=0.001,
+                                help="Ignore time increases smaller than this many seconds")
+    compare_parser.add_argument("--min-rss", type=float, default=5.0,
+                                help="Ignore memory increases smaller than this many MB")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run(args.profile, args.filter, args.repeat)
+        if args.output:
+            args.output.write_text(json.dumps(results, indent=2))
+            print(f"\nSaved {len(results['results'])} results to {args.output}")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    regressions = compare(baseline, current, args.threshold, args.min_time, args.min_rss)
+    if regressions:
+        print(f"{len(regressions)} metrics regressed by more than {args.threshold:.0%}:")
+        print("\n".join(regressions))
+        sys.exit(1)
+    print("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,15 +7,23 @@ This package provides utilities for creating, imputing, and normalizing pandas D
 __version__ = "0.1.0"
 __author__ = "khuyentran1401"
 
-from .create import create_dataframe, create_sample_data
+from .create import create_dataframe, create_sample_data, iter_sample_data, write_sample_data
 from .impute import MeanMedianImputer, SimpleImputer
 from .normalize import MinMaxNormalizer, StandardNormalizer
+from .pipeline import Pipeline
+from .sketch import QuantileSketch
+from .stream import iter_chunks
 
 __all__ = [
     "create_dataframe",
     "create_sample_data", 
+    "iter_sample_data",
+    "write_sample_data",
     "MeanMedianImputer",
     "SimpleImputer",
     "MinMaxNormalizer",
     "StandardNormalizer",
+    "Pipeline",
+    "QuantileSketch",
+    "iter_chunks",
 ]
\ No newline at end of file
@@ -0,0 +1,379 @@
+"""
+DataFrame backends.
+
+This module lets the processors work on pandas DataFrames, pyarrow Tables
+and polars DataFrames. Each backend computes statistics with the native
+kernels of its library and returns results of the same type as its input,
+so Arrow and polars data never has to be converted to pandas.
+
+The processors only deal with per-column parameter arrays, which are the
+same for every backend: fill values for the imputers and an affine
+``(x - center) * scale + offset`` map for the normalizers.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    import polars
+    import pyarrow
+
+from ._engine import (
+    apply_affine, apply_fill, assign_block, column_extrema, column_median,
+    column_moments, sample_std, select_columns, to_block,
+)
+from ._parallel import column_reduce
+
+Frame = Union[pd.DataFrame, "pyarrow.Table", "polars.DataFrame"]
+
+STATISTICS = ("mean", "std", "median", "min", "max")
+
+
+class PandasBackend:
+    """Backend for pandas DataFrames, built on the NumPy kernels in _engine."""
+
+    def select_columns(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> List[str]:
+        """Return the requested columns that exist, or all numeric columns."""
+        return select_columns(df, columns)
+
+    def to_block(self, df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+        """Return the columns as a 2-D float64 array with NaN for missing values."""
+        return to_block(df, columns)
+
+    def statistics(self, df: pd.DataFrame, columns: List[str], names: Iterable[str],
+                   n_jobs: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Compute the named statistics of each column, sharding across n_jobs processes."""
+        names = set(names)
+        result = {}
+        if names & {"mean", "std"}:
+            count, result["mean"], m2 = column_reduce(df, columns, column_moments, n_jobs)
+            result["std"] = sample_std(count, m2)
+        if "median" in names:
+            result["median"], = column_reduce(df, columns, column_median, n_jobs)
+        if names & {"min", "max"}:
+            result["min"], result["max"] = column_reduce(df, columns, column_extrema, n_jobs)
+        return result
+
+    def affine(self, df: pd.DataFrame, columns: List[str], center: np.ndarray,
+               scale: np.ndarray, offset: np.ndarray, copy: bool = True) -> pd.DataFrame:
+        """Map each column through ``(x - center) * scale + offset``."""
+        return apply_affine(df, columns, center, scale, offset, copy=copy)
+
+    def fill(self, df: pd.DataFrame, columns: List[str], values: np.ndarray,
+             copy: bool = True) -> pd.DataFrame:
+        """Replace missing values in each column with its value."""
+        return apply_fill(df, columns, values, copy=copy)
+
+    def fill_constant(self, df: pd.DataFrame, columns: Optional[List[str]], value: Any,
+                      copy: bool = True) -> pd.DataFrame:
+        """Replace missing values in the given columns (default all) with one value."""
+        if columns is None:
+            columns = df.columns.tolist()
+        columns = [col for col in columns if col in df.columns]
+
+        has_missing = df[columns].isna().any()
+        columns = has_missing.index[has_missing.to_numpy()].tolist()
+        if not columns:
+            return df.copy() if copy else df
+
+        filled = df[columns].fillna(value)
+        if copy:
+            return assign_block(df, columns, filled)
+
+        df[columns] = filled
+        return df
+
+
+class ArrowBackend:
+    """
+    Backend for pyarrow Tables, built on pyarrow.compute.
+
+    Both nulls and NaN count as missing. Tables are immutable, so transforms
+    always return a new Table that shares the buffers of untouched columns.
+    """
+
+    def __init__(self):
+        """Import pyarrow, which is only needed once a Table is passed in."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        self.pa = pa
+        self.pc = pc
+
+    def select_columns(self, table: "pyarrow.Table",
+                       columns: Optional[List[str]] = None) -> List[str]:
+        """Return the requested columns that exist, or all numeric columns."""
+        if columns is None:
+            types = self.pa.types
+            return [
+                field.name for field in table.schema
+                if types.is_integer(field.type) or types.is_floating(field.type)
+            ]
+        return [col for col in columns if col in table.column_names]
+
+    def _observed(self, column):
+        """Return column with NaN turned into null, so kernels skip both."""
+        pc = self.pc
+        if self.pa.types.is_floating(column.type) and pc.any(pc.is_nan(column)).as_py():
+            return pc.if_else(pc.is_nan(column), None, column)
+        return column
+
+    def to_block(self, table: "pyarrow.Table", columns: List[str]) -> np.ndarray:
+        """Return the columns as a 2-D float64 array with NaN for missing values."""
+        block = np.empty((table.num_rows, len(columns)), order="F")
+        for i, col in enumerate(columns):
+            block[:, i] = self.pc.cast(table.column(col), self.pa.float64()).to_numpy()
+        return block
+
+    def statistics(self, table: "pyarrow.Table", columns: List[str], names: Iterable[str],
+                   n_jobs: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Compute the named statistics of each column with pyarrow.compute."""
+        pc = self.pc
+        names = set(names)
+        result = {name: np.full(len(columns), np.nan) for name in STATISTICS if name in names}
+
+        for i, col in enumerate(columns):
+            column = self._observed(table.column(col))
+            if "mean" in names:
+                result["mean"][i] = _as_float(pc.mean(column).as_py())
+            if "std" in names:
+                result["std"][i] = _as_float(pc.stddev(column, ddof=1).as_py())
+            if "median" in names:
+                result["median"][i] = _as_float(pc.quantile(column, q=0.5)[0].as_py())
+            if names & {"min", "max"}:
+                extrema = pc.min_max(column)
+                for key in ("min", "max"):
+                    if key in result:
+                        result[key][i] = _as_float(extrema[key].as_py())
+
+        return result
+
+    def _present(self, table: "pyarrow.Table", columns: Sequence[str]) -> List[int]:
+        """Return the positions in columns of the columns present in the table."""
+        names = set(table.column_names)
+        return [i for i, col in enumerate(columns) if col in names]
+
+    def affine(self, table: "pyarrow.Table", columns: List[str], center: np.ndarray,
+               scale: np.ndarray, offset: np.ndarray, copy: bool = True) -> "pyarrow.Table":
+        """Map each column through ``(x - center) * scale + offset``."""
+        pa, pc = self.pa, self.pc
+        center, scale, offset = center.tolist(), scale.tolist(), offset.tolist()
+        for i in self._present(table, columns):
+            col = columns[i]
+            position = table.schema.get_field_index(col)
+            if scale[i] == 0:
+                # Constant columns map every row, missing or not, to the offset
+                new = pa.array(np.full(table.num_rows, offset[i]))
+            else:
+                values = pc.cast(table.column(col), pa.float64())
+                new = pc.add(pc.multiply(pc.subtract(values, center[i]), scale[i]), offset[i])
+            table = table.set_column(position, col, new)
+        return table
+
+    def fill(self, table: "pyarrow.Table", columns: List[str], values: np.ndarray,
+             copy: bool = True) -> "pyarrow.Table":
+        """Replace missing values in each column with its value."""
+        present = self._present(table, columns)
+        return self._fill(table, [columns[i] for i in present],
+                          [float(values[i]) for i in present], as_float=True)
+
+    def fill_constant(self, table: "pyarrow.Table", columns: Optional[List[str]], value: Any,
+                      copy: bool = True) -> "pyarrow.Table":
+        """Replace missing values in the given columns (default all) with one value."""
+        if columns is None:
+            columns = table.column_names
+        columns = [col for col in columns if col in table.column_names]
+        return self._fill(table, columns, [value] * len(columns), as_float=False)
+
+    def _fill(self, table: "pyarrow.Table", columns: List[str], values: List[Any],
+              as_float: bool) -> "pyarrow.Table":
+        """Fill the columns that contain missing values, leaving the rest shared."""
+        pa, pc = self.pa, self.pc
+        for col, value in zip(columns, values):
+            column = self._observed(table.column(col))
+            if column.null_count == 0:
+                continue
+            if as_float:
+                column = pc.cast(column, pa.float64())
+            else:
+                column, value = self._common_type(column, value)
+            table = table.set_column(table.schema.get_field_index(col), col,
+                                     pc.fill_null(column, value))
+        return table
+
+    def _common_type(self, column, value: Any):
+        """
+        Return column and value cast to one type, widening the column if needed.
+
+        As in polars, a value the column's type cannot hold exactly turns the
+        column into strings for a string value and into float64 otherwise.
+        """
+        pa, pc = self.pa, self.pc
+        errors = (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError)
+        scalar = pa.scalar(value)
+        try:
+            return column, pc.cast(scalar, column.type)
+        except errors:
+            pass
+        target = pa.string() if pa.types.is_string(scalar.type) else pa.float64()
+        try:
+            return pc.cast(column, target), pc.cast(scalar, target)
+        except errors:
+            raise TypeError(f"Cannot fill a {column.type} column with {value!r}") from None
+
+
+class PolarsBackend:
+    """
+    Backend for polars DataFrames, built on polars expressions.
+
+    Statistics for all columns are computed in one query that polars runs
+    in parallel. Both nulls and NaN count as missing. DataFrames are
+    immutable, so transforms always return a new DataFrame that shares the
+    buffers of untouched columns.
+    """
+
+    def __init__(self):
+        """Import polars, which is only needed once a polars DataFrame is passed in."""
+        import polars as pl
+
+        self.pl = pl
+
+    def select_columns(self, df: "polars.DataFrame",
+                       columns: Optional[List[str]] = None) -> List[str]:
+        """Return the requested columns that exist, or all numeric columns."""
+        if columns is None:
+            return [name for name, dtype in df.schema.items() if dtype.is_numeric()]
+        return [col for col in columns if col in df.columns]
+
+    def _observed(self, columns: List[str]):
+        """Expression for the columns as float64 with NaN turned into null."""
+        pl = self.pl
+        return pl.col(columns).cast(pl.Float64).fill_nan(None)
+
+    def to_block(self, df: "polars.DataFrame", columns: List[str]) -> np.ndarray:
+        """Return the columns as a 2-D float64 array with NaN for missing values."""
+        return df.select(self.pl.col(columns).cast(self.pl.Float64)).to_numpy(order="fortran")
+
+    def statistics(self, df: "polars.DataFrame", columns: List[str], names: Iterable[str],
+                   n_jobs: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Compute the named statistics of each column with polars expressions."""
+        names = [name for name in STATISTICS if name in set(names)]
+        if not columns:
+            return {name: np.empty(0) for name in names}
+
+        observed = self._observed(columns)
+        reducers = {
+            "mean": observed.mean(),
+            "std": observed.std(ddof=1),
+            "median": observed.median(),
+            "min": observed.min(),
+            "max": observed.max(),
+        }
+        row = df.select(
+            reducers[name].name.suffix(f"__{name}") for name in names
+        ).to_numpy()[0]
+
+        n_cols = len(columns)
+        return {
+            name: row[i * n_cols:(i + 1) * n_cols].astype(np.float64)
+            for i, name in enumerate(names)
+        }
+
+    def affine(self, df: "polars.DataFrame", columns: List[str], center: np.ndarray,
+               scale: np.ndarray, offset: np.ndarray, copy: bool = True) -> "polars.DataFrame":
+        """Map each column through ``(x - center) * scale + offset``."""
+        pl = self.pl
+        expressions = []
+        for col, c, s, o in zip(columns, center.tolist(), scale.tolist(), offset.tolist()):
+            if col not in df.columns:
+                continue
+            if s == 0:
+                # Constant columns map every row, missing or not, to the offset
+                expressions.append(pl.lit(o, dtype=pl.Float64).alias(col))
+            else:
+                expressions.append(((pl.col(col).cast(pl.Float64) - c) * s + o).alias(col))
+        return df.with_columns(expressions)
+
+    def _missing(self, df: "polars.DataFrame", columns: List[str]) -> List[bool]:
+        """Return whether each column contains nulls or NaN, in one query."""
+        pl = self.pl
+        if not columns:
+            return []
+        expressions = [
+            (pl.col(col).is_null() | pl.col(col).is_nan()).any()
+            if df.schema[col].is_float() else pl.col(col).is_null().any()
+            for col in columns
+        ]
+        return list(df.select(expressions).row(0))
+
+    def fill(self, df: "polars.DataFrame", columns: List[str], values: np.ndarray,
+             copy: bool = True) -> "polars.DataFrame":
+        """Replace missing values in each column with its value."""
+        pairs = [(col, value) for col, value in zip(columns, values.tolist()) if col in df.columns]
+        missing = self._missing(df, [col for col, _ in pairs])
+        return df.with_columns(
+            self._observed([col]).fill_null(value)
+            for (col, value), has_missing in zip(pairs, missing) if has_missing
+        )
+
+    def fill_constant(self, df: "polars.DataFrame", columns: Optional[List[str]], value: Any,
+                      copy: bool = True) -> "polars.DataFrame":
+        """Replace missing values in the given columns (default all) with one value."""
+        pl = self.pl
+        if columns is None:
+            columns = df.columns
+        columns = [col for col in columns if col in df.columns]
+        missing = self._missing(df, columns)
+
+        expressions = []
+        for col, has_missing in zip(columns, missing):
+            if not has_missing:
+                continue
+            expression = pl.col(col)
+            if df.schema[col].is_float():
+                expression = expression.fill_nan(None)
+            expressions.append(expression.fill_null(value))
+        return df.with_columns(expressions)
+
+
+def _as_float(value: Optional[float]) -> float:
+    """Convert a scalar result to float, with NaN for a missing result."""
+    return np.nan if value is None else float(value)
+
+
+_BACKENDS: Dict[str, Any] = {}
+
+
+def get_backend(data: Frame):
+    """
+    Return the backend for a pandas DataFrame, pyarrow Table or polars DataFrame.
+
+    Args:
+        data: Data passed to a processor
+
+    Returns:
+        Backend instance for the type of data
+
+    Raises:
+        TypeError: If data is not one of the supported types
+    """
+    if isinstance(data, pd.DataFrame):
+        key, backend_class = "pandas", PandasBackend
+    else:
+        module = type(data).__module__.split(".")[0]
+        name = type(data).__name__
+        if module == "pyarrow" and name == "Table":
+            key, backend_class = "pyarrow", ArrowBackend
+        elif module == "polars" and name == "DataFrame":
+            key, backend_class = "polars", PolarsBackend
+        else:
+            raise TypeError(
+                f"Unsupported data type {type(data).__name__}. "
+                "Use a pandas DataFrame, pyarrow Table or polars DataFrame"
+            )
+
+    if key not in _BACKENDS:
+        _BACKENDS[key] = backend_class()
+    return _BACKENDS[key]
@@ -0,0 +1,550 @@
+"""
+Vectorized engine shared by the processors.
+
+This module provides the array kernels used by the imputers and normalizers.
+Statistics are computed over the selected columns as a single 2-D float64
+block, and transforms are applied to that block in one broadcasted operation.
+"""
+
+import warnings
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .sketch import QuantileSketch
+
+
+def select_columns(df: pd.DataFrame, columns: Optional[List[str]] = None) -> List[str]:
+    """
+    Resolve the columns a processor should be fit on.
+
+    Args:
+        df: DataFrame to select columns from
+        columns: Requested columns. If None, uses all numeric columns.
+
+    Returns:
+        List of the requested columns that are present in the DataFrame
+    """
+    if columns is None:
+        return df.select_dtypes(include=[np.number]).columns.tolist()
+    return [col for col in columns if col in df.columns]
+
+
+def to_block(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """
+    Extract columns as a 2-D float64 array with NaN for missing values.
+
+    Args:
+        df: DataFrame to extract from
+        columns: Columns to extract, in order
+
+    Returns:
+        Array of shape (n_rows, len(columns))
+    """
+    return df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def nan_reduce(func, block: np.ndarray, **kwargs) -> np.ndarray:
+    """
+    Apply a NaN-aware NumPy reduction column-wise.
+
+    All-missing columns reduce to NaN, matching pandas, without emitting
+    NumPy's "empty slice" warnings.
+
+    Args:
+        func: NaN-aware reduction such as np.nanmin or np.nanstd
+        block: 2-D array to reduce over axis 0
+        **kwargs: Extra keyword arguments passed to func
+
+    Returns:
+        1-D array with one value per column
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return func(block, axis=0, **kwargs)
+
+
+def column_moments(block: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the count, mean and sum of squared deviations of each column.
+
+    Missing values are ignored. The sum of squared deviations (M2) is the
+    quantity Welford's algorithm tracks: the sample variance is
+    ``m2 / (count - 1)``.
+
+    Args:
+        block: 2-D array of shape (n_rows, n_cols)
+
+    Returns:
+        Tuple of (count, mean, m2) arrays, one value per column
+    """
+    missing = np.isnan(block)
+
+    if missing.any():
+        count = block.shape[0] - missing.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(missing, 0.0, block).sum(axis=0) / count
+        deviations = np.where(missing, 0.0, block - mean)
+    else:
+        count = np.full(block.shape[1], block.shape[0])
+        mean = block.mean(axis=0) if block.shape[0] else np.full(block.shape[1], np.nan)
+        deviations = block - mean
+
+    m2 = np.einsum("ij,ij->j", deviations, deviations)
+    return count.astype(np.float64), mean, m2
+
+
+def column_extrema(block: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the minimum and maximum of each column, ignoring missing values.
+
+    Args:
+        block: 2-D array of shape (n_rows, n_cols)
+
+    Returns:
+        Tuple of (min, max) arrays, NaN for all-missing columns
+    """
+    return nan_reduce(np.nanmin, block), nan_reduce(np.nanmax, block)
+
+
+def column_median(block: np.ndarray) -> Tuple[np.ndarray]:
+    """
+    Compute the median of each column, ignoring missing values.
+
+    Args:
+        block: 2-D array of shape (n_rows, n_cols)
+
+    Returns:
+        One-element tuple holding the array of medians
+    """
+    return (nan_reduce(np.nanmedian, block),)
+
+
+def sample_std(count: np.ndarray, m2: np.ndarray) -> np.ndarray:
+    """
+    Convert counts and M2 values into sample standard deviations (ddof=1).
+
+    Args:
+        count: Number of observed values per column
+        m2: Sum of squared deviations per column
+
+    Returns:
+        Standard deviations, NaN where fewer than two values were observed
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+
+
+def merge_moments(count_a: np.ndarray, mean_a: np.ndarray, m2_a: np.ndarray,
+                  count_b: np.ndarray, mean_b: np.ndarray,
+                  m2_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Combine the moments of two disjoint parts of the data (Chan et al.).
+
+    Args:
+        count_a: Counts of the first part
+        mean_a: Means of the first part
+        m2_a: Sums of squared deviations of the first part
+        count_b: Counts of the second part
+        mean_b: Means of the second part
+        m2_b: Sums of squared deviations of the second part
+
+    Returns:
+        Tuple of (count, mean, m2) arrays for the combined data
+    """
+    count = count_a + count_b
+    delta = mean_b - mean_a
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = mean_a + delta * (count_b / count)
+        m2 = m2_a + m2_b + delta ** 2 * (count_a * count_b / count)
+
+    # An empty side contributes nothing (and has a NaN mean)
+    mean = np.where(count_a == 0, mean_b, np.where(count_b == 0, mean_a, mean))
+    m2 = np.where(count_a == 0, m2_b, np.where(count_b == 0, m2_a, m2))
+
+    return count, mean, m2
+
+
+class RunningStats:
+    """
+    Mergeable per-column statistics accumulated over chunks of data.
+
+    Memory use depends on the number of columns and the sketch size, not on
+    the number of rows seen.
+
+    Attributes:
+        columns: Columns the statistics are tracked for
+        count: Number of observed (non-missing) values per column
+        mean: Running mean per column
+        m2: Running sum of squared deviations per column
+        min: Running minimum per column, if extrema are tracked
+        max: Running maximum per column, if extrema are tracked
+        sketches: One QuantileSketch per column, if quantiles are tracked
+    """
+
+    def __init__(self, columns: List[str], extrema: bool = False,
+                 quantile_error: Optional[float] = None):
+        """
+        Initialize empty statistics.
+
+        Args:
+            columns: Columns to track
+            extrema: Whether to track running minimum and maximum
+            quantile_error: Rank error of the quantile sketches. If None,
+                quantiles are not tracked.
+        """
+        n_cols = len(columns)
+        self.columns = list(columns)
+        self.count = np.zeros(n_cols)
+        self.mean = np.full(n_cols, np.nan)
+        self.m2 = np.zeros(n_cols)
+        self.min = np.full(n_cols, np.nan) if extrema else None
+        self.max = np.full(n_cols, np.nan) if extrema else None
+        self.sketches = (
+            [QuantileSketch(quantile_error) for _ in columns]
+            if quantile_error is not None else None
+        )
+
+    def update(self, df: pd.DataFrame) -> "RunningStats":
+        """
+        Add a chunk of rows to the statistics.
+
+        Args:
+            df: Chunk containing all tracked columns
+
+        Returns:
+            Self for method chaining
+        """
+        return self.update_block(to_block(df, self.columns))
+
+    def update_block(self, block: np.ndarray) -> "RunningStats":
+        """
+        Add a chunk of rows, already extracted as a float64 block, to the statistics.
+
+        Args:
+            block: 2-D array whose columns are aligned with the tracked columns
+
+        Returns:
+            Self for method chaining
+        """
+        self.count, self.mean, self.m2 = merge_moments(
+            self.count, self.mean, self.m2, *column_moments(block)
+        )
+
+        if self.min is not None:
+            chunk_min, chunk_max = column_extrema(block)
+            self.min = np.fmin(self.min, chunk_min)
+            self.max = np.fmax(self.max, chunk_max)
+
+        if self.sketches is not None:
+            for sketch, values in zip(self.sketches, block.T):
+                sketch.update(values)
+
+        return self
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """
+        Merge statistics accumulated over another part of the data.
+
+        Args:
+            other: Statistics over the same columns
+
+        Returns:
+            Self for method chaining
+        """
+        self.count, self.mean, self.m2 = merge_moments(
+            self.count, self.mean, self.m2, other.count, other.mean, other.m2
+        )
+
+        if self.min is not None:
+            self.min = np.fmin(self.min, other.min)
+            self.max = np.fmax(self.max, other.max)
+
+        if self.sketches is not None:
+            for sketch, other_sketch in zip(self.sketches, other.sketches):
+                sketch.merge(other_sketch)
+
+        return self
+
+    def std(self) -> np.ndarray:
+        """Return the sample standard deviation (ddof=1) of each column."""
+        return sample_std(self.count, self.m2)
+
+    def median(self) -> np.ndarray:
+        """Return the approximate median of each column."""
+        return np.array([sketch.median() for sketch in self.sketches])
+
+
+class ChunkedFitMixin:
+    """
+    Adds fit_from_chunks() to processors that implement partial_fit().
+
+    Processors keep their streaming statistics in ``self._stats``, which is
+    None until the first call to partial_fit().
+    """
+
+    def fit_from_chunks(self, chunks: Iterable[pd.DataFrame],
+                        columns: Optional[List[str]] = None):
+        """
+        Fit on an iterable of DataFrame chunks, one chunk in memory at a time.
+
+        Accepts any iterable of DataFrames, such as
+        ``pd.read_csv(path, chunksize=...)`` or ``iter_chunks(path)``.
+
+        Args:
+            chunks: Iterable of DataFrames with the same columns
+            columns: List of columns to fit. If None, uses all numeric
+                columns of the first chunk.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If chunks is empty
+        """
+        self._stats = None
+        for chunk in chunks:
+            self.partial_fit(chunk, columns)
+
+        if self._stats is None:
+            raise ValueError("No chunks to fit on.")
+
+        return self
+
+
+def affine_transform(block: np.ndarray, center: np.ndarray, scale: np.ndarray,
+                     offset: np.ndarray) -> np.ndarray:
+    """
+    Compute ``(block - center) * scale + offset`` column-wise.
+
+    Columns with a scale of 0 are constant columns: every row, including
+    missing ones, is set to the offset. The parameters are either 1-D
+    (one value per column) or 2-D (one value per row and column).
+
+    Args:
+        block: 2-D array of shape (n_rows, n_cols)
+        center: Per-column value subtracted first
+        scale: Per-column multiplier
+        offset: Per-column value added last
+
+    Returns:
+        New array with the transformed values
+    """
+    result = block - center
+    result *= scale
+    result += offset
+
+    constant = scale == 0
+    if constant.any():
+        np.copyto(result, offset, where=constant)
+
+    return result
+
+
+def assign_block(df: pd.DataFrame, columns: List[str],
+                 block: Union[np.ndarray, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Return a copy of df with the given columns replaced by block.
+
+    The replacement is done in a single concatenation rather than one
+    column assignment at a time, so the frame is consolidated only once.
+
+    Args:
+        df: Original DataFrame
+        columns: Columns to replace, aligned with the columns of block
+        block: 2-D array or DataFrame of new values
+
+    Returns:
+        New DataFrame with the original column order
+    """
+    replaced = pd.DataFrame(block, index=df.index, columns=columns)
+    untouched = df.drop(columns=columns)
+    return pd.concat([untouched, replaced], axis=1)[df.columns]
+
+
+def write_block(df: pd.DataFrame, columns: List[str], block: np.ndarray,
+                copy: bool = True) -> pd.DataFrame:
+    """
+    Write block into the given columns of df.
+
+    With copy=False, float64 columns are overwritten inside the DataFrame's
+    existing blocks and other columns are replaced, so no second copy of the
+    whole frame is made.
+
+    Args:
+        df: DataFrame to write into
+        columns: Columns to write, aligned with the columns of block
+        block: 2-D array of new values
+        copy: If True, leave df untouched and return a new DataFrame
+
+    Returns:
+        The updated DataFrame (df itself when copy=False)
+    """
+    if copy:
+        return assign_block(df, columns, block)
+    if len(columns) == 0:
+        return df
+
+    columns = np.asarray(columns, dtype=object)
+    is_float = (df.dtypes[columns] == np.float64).to_numpy()
+
+    if is_float.all():
+        df.loc[:, columns.tolist()] = block
+    else:
+        if is_float.any():
+            df.loc[:, columns[is_float].tolist()] = block[:, is_float]
+        df[columns[~is_float].tolist()] = block[:, ~is_float]
+
+    return df
+
+
+def present_columns(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """
+    Find which fitted columns are present in a DataFrame.
+
+    Args:
+        df: DataFrame to transform
+        columns: Columns the processor was fit on
+
+    Returns:
+        Boolean mask aligned with columns
+    """
+    return df.columns.get_indexer(columns) >= 0
+
+
+def apply_affine(df: pd.DataFrame, columns: List[str], center: np.ndarray,
+                 scale: np.ndarray, offset: np.ndarray, copy: bool = True,
+                 rows: Optional[np.ndarray] = None) -> pd.DataFrame:
+    """
+    Apply a fitted column-wise affine transform to a DataFrame.
+
+    Fitted columns missing from df are skipped.
+
+    Args:
+        df: DataFrame to transform
+        columns: Columns the parameters are aligned with
+        center: Per-column value subtracted first
+        scale: Per-column multiplier
+        offset: Per-column value added last
+        copy: If False, write the result into df instead of a new DataFrame
+        rows: Row of the parameter tables to use for each row of df. When
+            given, the parameters are 2-D tables of shape (n_groups, n_cols).
+
+    Returns:
+        DataFrame with the transformed columns
+    """
+    present = present_columns(df, columns)
+    selected = np.asarray(columns, dtype=object)[present].tolist()
+    params = [param[..., present] for param in (center, scale, offset)]
+    if rows is not None:
+        params = [param.take(rows, axis=0) for param in params]
+
+    block = affine_transform(to_block(df, selected), *params)
+    return write_block(df, selected, block, copy)
+
+
+def apply_fill(df: pd.DataFrame, columns: List[str], fill_values: np.ndarray,
+               copy: bool = True, rows: Optional[np.ndarray] = None) -> pd.DataFrame:
+    """
+    Fill missing values of the fitted columns with per-column values.
+
+    A null-count pre-pass finds the columns that actually contain missing
+    values; only those are extracted and written back. When no column needs
+    filling, df is returned as is (or a plain copy if copy=True).
+
+    Args:
+        df: DataFrame to fill
+        columns: Columns the fill values are aligned with
+        fill_values: Per-column fill values
+        copy: If False, write the result into df instead of a new DataFrame
+        rows: Row of the fill table to use for each row of df. When given,
+            fill_values is a 2-D table of shape (n_groups, n_cols).
+
+    Returns:
+        DataFrame with missing values filled
+    """
+    present = present_columns(df, columns)
+    selected = np.asarray(columns, dtype=object)[present]
+    fill_values = np.asarray(fill_values)[..., present]
+
+    has_missing = df[selected.tolist()].isna().any().to_numpy()
+    if not has_missing.any():
+        return df.copy() if copy else df
+
+    selected = selected[has_missing].tolist()
+    fill_values = fill_values[..., has_missing]
+    if rows is not None:
+        fill_values = fill_values.take(rows, axis=0)
+
+    block = to_block(df, selected)
+    block = np.where(np.isnan(block), fill_values, block)
+    return write_block(df, selected, block, copy)
+
+
+def group_statistics(df: pd.DataFrame, group_by: str, columns: List[str],
+                     global_stats: Dict[str, np.ndarray]) -> Tuple[pd.Index, Dict[str, np.ndarray]]:
+    """
+    Compute per-group statistics in a single groupby().agg pass.
+
+    Each statistic is returned as a table with one row per group and a last
+    row holding the global statistics, so that row ``len(keys)`` can serve
+    groups that were not seen during fit. Cells for which a group has too
+    few observed values fall back to the global statistic.
+
+    Args:
+        df: DataFrame to learn from
+        group_by: Column whose values define the groups
+        columns: Columns to compute statistics for
+        global_stats: Global statistics keyed by pandas aggregation name
+            ("mean", "std", "median", "min" or "max"), aligned with columns
+
+    Returns:
+        Tuple of (group keys, tables keyed like global_stats), each table of
+        shape (len(keys) + 1, len(columns))
+
+    Raises:
+        TypeError: If df is not a pandas DataFrame
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError("group_by requires a pandas DataFrame")
+
+    names = list(global_stats)
+    if not columns:
+        return pd.Index([]), {name: np.empty((1, 0)) for name in names}
+
+    grouped = df.groupby(group_by, sort=False, dropna=False, observed=True)[columns]
+    aggregated = grouped.agg(names)
+
+    tables = {}
+    for name in names:
+        table = aggregated.xs(name, axis=1, level=1).to_numpy(dtype=np.float64, na_value=np.nan)
+        table = np.where(np.isnan(table), global_stats[name], table)
+        tables[name] = np.vstack([table, global_stats[name]])
+
+    return aggregated.index, tables
+
+
+def group_rows(df: pd.DataFrame, group_by: str, keys: pd.Index) -> np.ndarray:
+    """
+    Map each row of df to its row in a table built by group_statistics().
+
+    Args:
+        df: DataFrame to transform
+        group_by: Column whose values define the groups
+        keys: Group keys returned by group_statistics()
+
+    Returns:
+        Integer array with one table row per row of df; rows of groups that
+        were not seen during fit point to the global row ``len(keys)``
+
+    Raises:
+        TypeError: If df is not a pandas DataFrame
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError("group_by requires a pandas DataFrame")
+
+    rows = keys.get_indexer(df[group_by])
+    rows[rows < 0] = len(keys)
+    return rows
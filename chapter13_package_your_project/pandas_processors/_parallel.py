@@ -0,0 +1,111 @@
+"""
+Multi-process column reductions.
+
+This module shards the columns of a DataFrame across a process pool. The
+numeric block is copied once into a shared-memory buffer that every worker
+maps directly, so the DataFrame itself is never pickled; only the small
+per-column results travel back to the parent process.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ._engine import to_block
+
+Reducer = Callable[[np.ndarray], Tuple[np.ndarray, ...]]
+
+
+def effective_n_jobs(n_jobs: Optional[int]) -> int:
+    """
+    Resolve an n_jobs setting into a number of worker processes.
+
+    Args:
+        n_jobs: None or 1 for serial execution, -1 for all CPU cores, or a
+            positive number of processes
+
+    Returns:
+        Number of processes to use, at least 1
+
+    Raises:
+        ValueError: If n_jobs is 0 or below -1
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError("n_jobs must be None, -1 or a positive integer")
+    return n_jobs
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing shared-memory block without taking ownership of it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no track argument
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+def _reduce_shard(name: str, shape: Tuple[int, int], start: int, stop: int,
+                  reducer: Reducer) -> Tuple[np.ndarray, ...]:
+    """Run a reducer over columns [start, stop) of a shared block."""
+    shm = _attach(name)
+    block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order="F")
+    try:
+        # Copy the results out before the buffer is closed
+        return tuple(np.array(result) for result in reducer(block[:, start:stop]))
+    finally:
+        del block
+        shm.close()
+
+
+def column_reduce(df: pd.DataFrame, columns: List[str], reducer: Reducer,
+                  n_jobs: Optional[int] = None) -> Tuple[np.ndarray, ...]:
+    """
+    Apply a column-wise reducer to the selected columns, optionally in parallel.
+
+    Args:
+        df: DataFrame to reduce
+        columns: Columns to reduce
+        reducer: Module-level function mapping a 2-D block to a tuple of
+            per-column arrays, such as column_moments
+        n_jobs: Number of worker processes. None or 1 runs in this process.
+
+    Returns:
+        Tuple of arrays aligned with columns
+    """
+    n_workers = min(effective_n_jobs(n_jobs), len(columns))
+    if n_workers <= 1:
+        return reducer(to_block(df, columns))
+
+    shape = (len(df), len(columns))
+    bounds = np.linspace(0, len(columns), n_workers + 1).astype(int)
+    shards = list(zip(bounds[:-1], bounds[1:]))
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, 8 * shape[0] * shape[1]))
+    # Column-major layout keeps every shard contiguous in memory
+    block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order="F")
+    try:
+        # Fill shard by shard so only one shard is ever copied twice
+        for start, stop in shards:
+            block[:, start:stop] = to_block(df, columns[start:stop])
+
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(_reduce_shard, shm.name, shape, start, stop, reducer)
+                for start, stop in shards
+            ]
+            results = [future.result() for future in futures]
+    finally:
+        del block
+        shm.close()
+        shm.unlink()
+
+    return tuple(np.concatenate(parts) for parts in zip(*results))
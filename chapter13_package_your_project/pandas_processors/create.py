@@ -6,7 +6,8 @@ This module provides functions for creating pandas DataFrames with various data
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional
+from pathlib import Path
+from typing import Dict, Iterator, List, Any, Optional, Union
 
 
 def create_dataframe(data: Dict[str, List[Any]], index: Optional[List] = None) -> pd.DataFrame:
@@ -31,8 +32,23 @@ def create_dataframe(data: Dict[str, List[Any]], index: Optional[List] = None) -
     return pd.DataFrame(data, index=index)
 
 
+def _sample_block(rng: np.random.Generator, n_rows: int, n_cols: int,
+                  missing_rate: float) -> np.ndarray:
+    """Generate standard normal data with an exact share of cells set to NaN."""
+    data = rng.standard_normal((n_rows, n_cols))
+    
+    n_missing = int(n_rows * n_cols * missing_rate)
+    if n_missing > 0:
+        # Flat indices map straight onto the C-ordered array
+        missing_indices = rng.choice(data.size, size=n_missing, replace=False)
+        data.ravel()[missing_indices] = np.nan
+    
+    return data
+
+
 def create_sample_data(n_rows: int = 100, n_cols: int = 5, 
-                      missing_rate: float = 0.1, random_state: int = 42) -> pd.DataFrame:
+                      missing_rate: float = 0.1,
+                      random_state: Union[int, np.random.Generator, None] = 42) -> pd.DataFrame:
     """
     Create sample DataFrame with numeric data and optional missing values.
     
@@ -40,7 +56,7 @@ def create_sample_data(n_rows: int = 100, n_cols: int = 5,
         n_rows: Number of rows to generate
         n_cols: Number of columns to generate  
         missing_rate: Proportion of values to make missing (0.0 to 1.0)
-        random_state: Random seed for reproducibility
+        random_state: Random seed or np.random.Generator for reproducibility
         
     Returns:
         pandas DataFrame with sample numeric data
@@ -50,29 +66,102 @@ def create_sample_data(n_rows: int = 100, n_cols: int = 5,
         >>> print(df.shape)
         (10, 3)
     """
-    np.random.seed(random_state)
-    
-    # Generate random numeric data
-    data = np.random.randn(n_rows, n_cols)
+    rng = np.random.default_rng(random_state)
     
     # Create column names
     columns = [f"feature_{i+1}" for i in range(n_cols)]
     
-    # Create DataFrame
-    df = pd.DataFrame(data, columns=columns)
+    return pd.DataFrame(_sample_block(rng, n_rows, n_cols, missing_rate), columns=columns)
+
+
+def iter_sample_data(n_rows: int = 100, n_cols: int = 5, missing_rate: float = 0.1,
+                     random_state: Union[int, np.random.Generator, None] = 42,
+                     chunk_rows: int = 100_000) -> Iterator[pd.DataFrame]:
+    """
+    Generate sample data lazily as DataFrames of at most chunk_rows rows.
     
-    # Add missing values
-    if missing_rate > 0:
-        n_missing = int(n_rows * n_cols * missing_rate)
-        missing_indices = np.random.choice(
-            df.size, size=n_missing, replace=False
+    Only one chunk is held in memory at a time, so datasets larger than
+    memory can be produced. Each chunk has the same missing rate and the
+    row index continues across chunks.
+    
+    Args:
+        n_rows: Total number of rows to generate
+        n_cols: Number of columns to generate
+        missing_rate: Proportion of values in each chunk to make missing
+        random_state: Random seed or np.random.Generator for reproducibility
+        chunk_rows: Maximum number of rows per chunk
+        
+    Yields:
+        pandas DataFrame chunks with sample numeric data
+        
+    Example:
+        >>> chunks = iter_sample_data(n_rows=250, n_cols=3, chunk_rows=100)
+        >>> [len(chunk) for chunk in chunks]
+        [100, 100, 50]
+    """
+    rng = np.random.default_rng(random_state)
+    columns = [f"feature_{i+1}" for i in range(n_cols)]
+    
+    for start in range(0, n_rows, chunk_rows):
+        stop = min(start + chunk_rows, n_rows)
+        yield pd.DataFrame(
+            _sample_block(rng, stop - start, n_cols, missing_rate),
+            columns=columns,
+            index=pd.RangeIndex(start, stop),
         )
+
+
+def write_sample_data(path: Union[str, Path], n_rows: int = 100, n_cols: int = 5,
+                      missing_rate: float = 0.1,
+                      random_state: Union[int, np.random.Generator, None] = 42,
+                      chunk_rows: int = 100_000) -> Path:
+    """
+    Write sample data to a Parquet or Arrow IPC file chunk by chunk.
+    
+    Each chunk from iter_sample_data() is appended to the file as it is
+    generated, so multi-GB fixtures can be built with memory bounded by
+    chunk_rows.
+    
+    Args:
+        path: Output path ending in .parquet, .arrow or .feather
+        n_rows: Total number of rows to generate
+        n_cols: Number of columns to generate
+        missing_rate: Proportion of values to make missing
+        random_state: Random seed or np.random.Generator for reproducibility
+        chunk_rows: Number of rows generated and written at a time
         
-        # Convert flat indices to row, col indices
-        row_indices = missing_indices // n_cols
-        col_indices = missing_indices % n_cols
+    Returns:
+        Path of the written file
+        
+    Raises:
+        ValueError: If the file extension is not supported
+        ImportError: If pyarrow is not installed
         
-        for row, col in zip(row_indices, col_indices):
-            df.iloc[row, col] = np.nan
+    Example:
+        >>> write_sample_data("fixture.parquet", n_rows=10_000_000, n_cols=50)
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix not in (".parquet", ".arrow", ".feather"):
+        raise ValueError(f"Unsupported file type '{path.suffix}'. Use .parquet, .arrow or .feather")
+    
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Writing sample data requires pyarrow. Install it with: pip install pyarrow"
+        ) from e
+    
+    schema = pa.schema([(f"feature_{i+1}", pa.float64()) for i in range(n_cols)])
+    if suffix == ".parquet":
+        # Random floats gain nothing from dictionary encoding
+        writer = pq.ParquetWriter(path, schema, use_dictionary=False)
+    else:
+        writer = pa.ipc.new_file(path, schema)
+    
+    with writer:
+        for chunk in iter_sample_data(n_rows, n_cols, missing_rate, random_state, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
     
-    return df
\ No newline at end of file
+    return path
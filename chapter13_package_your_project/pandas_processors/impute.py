@@ -1,15 +1,20 @@
 """
 Data imputation utilities.
 
-This module provides classes for handling missing values in pandas DataFrames.
+This module provides classes for handling missing values in pandas DataFrames,
+pyarrow Tables and polars DataFrames.
 """
 
 import pandas as pd
 import numpy as np
-from typing import Union, List, Optional
+from typing import Union, List, Optional, Dict
 
+from ._backends import Frame, get_backend
+from ._engine import ChunkedFitMixin, RunningStats, apply_fill, group_rows, group_statistics
+from .serialize import SerializableMixin
 
-class MeanMedianImputer:
+
+class MeanMedianImputer(ChunkedFitMixin, SerializableMixin):
     """
     Imputer that fills missing values with mean or median.
     
@@ -18,15 +23,35 @@ class MeanMedianImputer:
     
     Attributes:
         strategy: Either "mean" or "median"
-        fill_values_: Dictionary storing computed fill values for each column
+        sketch_error: Rank error of the approximate median used by partial_fit()
+        n_jobs: Number of processes used by fit()
+        group_by: Column whose values define groups with their own fill values
+        columns_: List of columns the imputer was fit on
+        fill_array_: Array of fill values aligned with columns_
+        group_keys_: Index of the groups seen by fit() when group_by is set
+        fill_table_: Array of shape (len(group_keys_) + 1, len(columns_)) with
+            the fill values of each group; the last row holds fill_array_
     """
     
-    def __init__(self, strategy: str = "mean"):
+    _init_params = ("strategy", "sketch_error", "n_jobs")
+    _fitted_arrays = ("fill_array_",)
+    
+    def __init__(self, strategy: str = "mean", sketch_error: float = 0.01,
+                 n_jobs: Optional[int] = None, group_by: Optional[str] = None):
         """
         Initialize the imputer.
         
         Args:
             strategy: Strategy for imputation, either "mean" or "median"
+            sketch_error: Target rank error of the streaming median sketch
+                used by partial_fit() and fit_from_chunks() when strategy is
+                "median". fit() always computes the exact median.
+            n_jobs: Number of processes fit() shards columns across. None or 1
+                fits in the current process, -1 uses all CPU cores. Only used for
+                pandas input; pyarrow and polars run their own multithreaded kernels.
+            group_by: Column to group pandas DataFrames by. Each group is filled
+                with its own mean or median, and groups not seen by fit()
+                are filled with the global value.
             
         Raises:
             ValueError: If strategy is not "mean" or "median"
@@ -35,69 +60,135 @@ class MeanMedianImputer:
             raise ValueError("Strategy must be either 'mean' or 'median'")
         
         self.strategy = strategy
-        self.fill_values_ = {}
+        self.sketch_error = sketch_error
+        self.n_jobs = n_jobs
+        self.group_by = group_by
+        self.columns_ = []
+        self.fill_array_ = np.empty(0)
+        self.group_keys_ = pd.Index([])
+        self.fill_table_ = np.empty((0, 0))
+        self._stats = None
     
-    def fit(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> "MeanMedianImputer":
+    @property
+    def fill_values_(self) -> Dict[str, float]:
+        """Dictionary mapping each fitted column to its fill value."""
+        return dict(zip(self.columns_, self.fill_array_.tolist()))
+    
+    def fit(self, df: Frame, columns: Optional[List[str]] = None) -> "MeanMedianImputer":
         """
         Learn the fill values from the data.
         
         Args:
-            df: DataFrame to learn from
+            df: pandas DataFrame, pyarrow Table or polars DataFrame to learn from
             columns: List of columns to impute. If None, uses all numeric columns.
+                The group_by column is never imputed.
             
         Returns:
             Self for method chaining
+            
+        Raises:
+            TypeError: If group_by is set and df is not a pandas DataFrame
         """
-        if columns is None:
-            columns = df.select_dtypes(include=[np.number]).columns.tolist()
+        backend = get_backend(df)
+        self.columns_ = [
+            col for col in backend.select_columns(df, columns) if col != self.group_by
+        ]
+        self._stats = None
+        
+        statistics = backend.statistics(df, self.columns_, [self.strategy], self.n_jobs)
+        self.fill_array_ = statistics[self.strategy]
         
-        self.fill_values_ = {}
+        if self.group_by is not None:
+            self.group_keys_, tables = group_statistics(
+                df, self.group_by, self.columns_, {self.strategy: self.fill_array_}
+            )
+            self.fill_table_ = tables[self.strategy]
         
-        for col in columns:
-            if col in df.columns:
-                if self.strategy == "mean":
-                    self.fill_values_[col] = df[col].mean()
-                else:  # median
-                    self.fill_values_[col] = df[col].median()
+        return self
+    
+    def partial_fit(self, df: Frame, columns: Optional[List[str]] = None) -> "MeanMedianImputer":
+        """
+        Update the fill values with a chunk of data.
+        
+        Means are exact running means. Medians are estimated with a
+        QuantileSketch per column, so memory does not grow with the number
+        of rows. The first call after initialization or fit() starts a new
+        stream.
+        
+        Args:
+            df: Chunk of data to learn from
+            columns: List of columns to impute. If None, uses all numeric
+                columns. Only used by the first call of a stream.
+            
+        Returns:
+            Self for method chaining
+            
+        Raises:
+            ValueError: If the imputer has a group_by column
+        """
+        if self.group_by is not None:
+            raise ValueError("partial_fit() does not support group_by")
+        
+        backend = get_backend(df)
+        if self._stats is None:
+            quantile_error = self.sketch_error if self.strategy == "median" else None
+            self._stats = RunningStats(
+                backend.select_columns(df, columns), quantile_error=quantile_error
+            )
+        
+        self._stats.update_block(backend.to_block(df, self._stats.columns))
+        self.columns_ = self._stats.columns
+        if self.strategy == "mean":
+            self.fill_array_ = self._stats.mean.copy()
+        else:  # median
+            self.fill_array_ = self._stats.median()
         
         return self
     
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+    def transform(self, df: Frame, copy: bool = True) -> Frame:
         """
         Apply the imputation to the DataFrame.
         
+        Only columns that contain missing values are touched. pyarrow Tables
+        and polars DataFrames are immutable, so for them a new object sharing
+        the untouched columns is always returned and copy is ignored.
+        
         Args:
-            df: DataFrame to impute
+            df: pandas DataFrame, pyarrow Table or polars DataFrame to impute
+            copy: If False, fill df in place instead of returning a new
+                DataFrame, which avoids holding two copies of the data
             
         Returns:
-            DataFrame with missing values filled
+            Data of the same type with missing values filled (df itself when
+            copy=False)
             
         Raises:
             ValueError: If imputer has not been fit yet
+            TypeError: If group_by is set and df is not a pandas DataFrame
         """
-        if not self.fill_values_:
+        if len(self.columns_) == 0:
             raise ValueError("Imputer has not been fit yet. Call fit() first.")
         
-        df_imputed = df.copy()
+        if self.group_by is not None:
+            rows = group_rows(df, self.group_by, self.group_keys_)
+            return apply_fill(df, self.columns_, self.fill_table_, copy, rows=rows)
         
-        for col, fill_value in self.fill_values_.items():
-            if col in df_imputed.columns:
-                df_imputed[col] = df_imputed[col].fillna(fill_value)
-        
-        return df_imputed
+        return get_backend(df).fill(df, self.columns_, self.fill_array_, copy)
     
-    def fit_transform(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    def fit_transform(self, df: Frame, columns: Optional[List[str]] = None,
+                      copy: bool = True) -> Frame:
         """
         Fit the imputer and transform the data in one step.
         
         Args:
             df: DataFrame to fit and transform
             columns: List of columns to impute
+            copy: If False, fill df in place
             
         Returns:
             DataFrame with missing values filled
         """
-        return self.fit(df, columns).transform(df)
+        return self.fit(df, columns).transform(df, copy=copy)
 
 
 class SimpleImputer:
@@ -117,24 +208,23 @@ class SimpleImputer:
         """
         self.fill_value = fill_value
     
-    def transform(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    def transform(self, df: Frame, columns: Optional[List[str]] = None,
+                  copy: bool = True) -> Frame:
         """
         Fill missing values with the specified fill value.
         
+        Only columns that contain missing values are touched. pyarrow Tables
+        and polars DataFrames are immutable, so for them a new object sharing
+        the untouched columns is always returned and copy is ignored.
+        
         Args:
-            df: DataFrame to impute
+            df: pandas DataFrame, pyarrow Table or polars DataFrame to impute
             columns: List of columns to impute. If None, uses all columns.
+            copy: If False, fill df in place instead of returning a new
+                DataFrame, which avoids holding two copies of the data
             
         Returns:
-            DataFrame with missing values filled
+            Data of the same type with missing values filled (df itself when
+            copy=False)
         """
-        df_imputed = df.copy()
-        
-        if columns is None:
-            columns = df.columns.tolist()
-        
-        for col in columns:
-            if col in df_imputed.columns:
-                df_imputed[col] = df_imputed[col].fillna(self.fill_value)
-        
-        return df_imputed
\ No newline at end of file
+        return get_backend(df).fill_constant(df, columns, self.fill_value, copy)
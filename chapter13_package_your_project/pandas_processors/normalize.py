@@ -1,186 +1,378 @@
 """
 Data normalization utilities.
 
-This module provides classes for normalizing pandas DataFrames.
+This module provides classes for normalizing pandas DataFrames, pyarrow
+Tables and polars DataFrames.
 """
 
 import pandas as pd
 import numpy as np
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
+from ._backends import Frame, get_backend
+from ._engine import (
+    ChunkedFitMixin, RunningStats, apply_affine, group_rows, group_statistics,
+)
+from .serialize import SerializableMixin
 
-class MinMaxNormalizer:
+
+class MinMaxNormalizer(ChunkedFitMixin, SerializableMixin):
     """
     Normalizer that scales features to a given range (default 0-1).
-    
+
     Attributes:
         feature_range: Tuple of (min, max) for the target range
-        data_min_: Dictionary storing minimum values for each column
-        data_max_: Dictionary storing maximum values for each column
+        n_jobs: Number of processes used by fit()
+        group_by: Column whose values define groups with their own statistics
+        columns_: List of columns the normalizer was fit on
+        data_min_array_: Array of minimum values aligned with columns_
+        data_max_array_: Array of maximum values aligned with columns_
+        group_keys_: Index of the groups seen by fit() when group_by is set
+        data_min_table_: Array of shape (len(group_keys_) + 1, len(columns_))
+            with the minimums of each group; the last row holds data_min_array_
+        data_max_table_: Same as data_min_table_ for the maximums
     """
-    
-    def __init__(self, feature_range: tuple = (0, 1)):
+
+    _init_params = ("feature_range", "n_jobs")
+    _fitted_arrays = ("data_min_array_", "data_max_array_")
+
+    def __init__(self, feature_range: tuple = (0, 1), n_jobs: Optional[int] = None,
+                 group_by: Optional[str] = None):
         """
         Initialize the normalizer.
-        
+
         Args:
             feature_range: Desired range of transformed data as (min, max)
+            n_jobs: Number of processes fit() shards columns across. None or 1
+                fits in the current process, -1 uses all CPU cores. Only used for
+                pandas input; pyarrow and polars run their own multithreaded kernels.
+            group_by: Column to group pandas DataFrames by. Each group is scaled
+                with its own statistics, and groups not seen by fit() are
+                scaled with the global statistics.
         """
         self.feature_range = feature_range
-        self.data_min_ = {}
-        self.data_max_ = {}
-    
-    def fit(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> "MinMaxNormalizer":
+        self.n_jobs = n_jobs
+        self.group_by = group_by
+        self.columns_ = []
+        self.data_min_array_ = np.empty(0)
+        self.data_max_array_ = np.empty(0)
+        self.group_keys_ = pd.Index([])
+        self.data_min_table_ = np.empty((0, 0))
+        self.data_max_table_ = np.empty((0, 0))
+        self._stats = None
+
+    @property
+    def data_min_(self) -> Dict[str, float]:
+        """Dictionary mapping each fitted column to its minimum value."""
+        return dict(zip(self.columns_, self.data_min_array_.tolist()))
+
+    @property
+    def data_max_(self) -> Dict[str, float]:
+        """Dictionary mapping each fitted column to its maximum value."""
+        return dict(zip(self.columns_, self.data_max_array_.tolist()))
+
+    def fit(self, df: Frame, columns: Optional[List[str]] = None) -> "MinMaxNormalizer":
         """
         Learn the min and max values from the data.
-        
+
         Args:
-            df: DataFrame to learn from
+            df: pandas DataFrame, pyarrow Table or polars DataFrame to learn from
             columns: List of columns to normalize. If None, uses all numeric columns.
-            
+                The group_by column is never normalized.
+
         Returns:
             Self for method chaining
+
+        Raises:
+            TypeError: If group_by is set and df is not a pandas DataFrame
         """
-        if columns is None:
-            columns = df.select_dtypes(include=[np.number]).columns.tolist()
-        
-        self.data_min_ = {}
-        self.data_max_ = {}
-        
-        for col in columns:
-            if col in df.columns:
-                self.data_min_[col] = df[col].min()
-                self.data_max_[col] = df[col].max()
-        
+        backend = get_backend(df)
+        self.columns_ = [
+            col for col in backend.select_columns(df, columns) if col != self.group_by
+        ]
+        self._stats = None
+
+        statistics = backend.statistics(df, self.columns_, ["min", "max"], self.n_jobs)
+        self.data_min_array_, self.data_max_array_ = statistics["min"], statistics["max"]
+
+        if self.group_by is not None:
+            self.group_keys_, tables = group_statistics(df, self.group_by, self.columns_, statistics)
+            self.data_min_table_, self.data_max_table_ = tables["min"], tables["max"]
+
         return self
-    
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+
+    def partial_fit(self, df: Frame, columns: Optional[List[str]] = None) -> "MinMaxNormalizer":
+        """
+        Update the min and max values with a chunk of data.
+
+        The first call after initialization or fit() starts a new stream;
+        later calls keep running minimums and maximums across chunks.
+
+        Args:
+            df: Chunk of data to learn from
+            columns: List of columns to normalize. If None, uses all numeric
+                columns. Only used by the first call of a stream.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the normalizer has a group_by column
+        """
+        if self.group_by is not None:
+            raise ValueError("partial_fit() does not support group_by")
+
+        backend = get_backend(df)
+        if self._stats is None:
+            self._stats = RunningStats(backend.select_columns(df, columns), extrema=True)
+
+        self._stats.update_block(backend.to_block(df, self._stats.columns))
+        self.columns_ = self._stats.columns
+        self.data_min_array_ = self._stats.min.copy()
+        self.data_max_array_ = self._stats.max.copy()
+
+        return self
+
+    def _affine_params(self, grouped: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the (center, scale, offset) arrays of the fitted transform.
+
+        With grouped=True the arrays are tables with one row per group, as
+        in data_min_table_.
+        """
+        min_val, max_val = self.feature_range
+        if grouped:
+            data_min, data_max = self.data_min_table_, self.data_max_table_
+        else:
+            data_min, data_max = self.data_min_array_, self.data_max_array_
+        data_range = data_max - data_min
+
+        # Constant columns get a scale of 0 and are mapped to min_val
+        scale = np.divide(
+            max_val - min_val, data_range,
+            out=np.zeros_like(data_range), where=data_range != 0,
+        )
+        offset = np.full_like(data_range, min_val)
+
+        return data_min, scale, offset
+
+    def transform(self, df: Frame, copy: bool = True) -> Frame:
         """
         Apply min-max normalization to the DataFrame.
-        
+
         Args:
-            df: DataFrame to normalize
-            
+            df: pandas DataFrame, pyarrow Table or polars DataFrame to normalize
+            copy: If False, write the results into df instead of returning a
+                new DataFrame, which avoids holding two copies of the data.
+                pyarrow Tables and polars DataFrames are immutable, so for
+                them a new object sharing the untouched columns is returned.
+
         Returns:
-            DataFrame with normalized values
-            
+            Data of the same type with normalized values (df itself when copy=False)
+
         Raises:
             ValueError: If normalizer has not been fit yet
+            TypeError: If group_by is set and df is not a pandas DataFrame
         """
-        if not self.data_min_ or not self.data_max_:
+        if len(self.columns_) == 0:
             raise ValueError("Normalizer has not been fit yet. Call fit() first.")
-        
-        df_normalized = df.copy()
-        min_val, max_val = self.feature_range
-        
-        for col in self.data_min_.keys():
-            if col in df_normalized.columns:
-                data_range = self.data_max_[col] - self.data_min_[col]
-                if data_range == 0:
-                    # Handle case where all values are the same
-                    df_normalized[col] = min_val
-                else:
-                    # Apply min-max scaling formula
-                    df_normalized[col] = (
-                        (df_normalized[col] - self.data_min_[col]) / data_range
-                    ) * (max_val - min_val) + min_val
-        
-        return df_normalized
-    
-    def fit_transform(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
+
+        if self.group_by is not None:
+            rows = group_rows(df, self.group_by, self.group_keys_)
+            return apply_affine(df, self.columns_, *self._affine_params(grouped=True),
+                                copy=copy, rows=rows)
+
+        return get_backend(df).affine(df, self.columns_, *self._affine_params(), copy=copy)
+
+    def fit_transform(self, df: Frame, columns: Optional[List[str]] = None,
+                      copy: bool = True) -> Frame:
         """
         Fit the normalizer and transform the data in one step.
-        
+
         Args:
             df: DataFrame to fit and transform
             columns: List of columns to normalize
-            
+            copy: If False, write the results into df
+
         Returns:
             DataFrame with normalized values
         """
-        return self.fit(df, columns).transform(df)
+        return self.fit(df, columns).transform(df, copy=copy)
 
 
-class StandardNormalizer:
+class StandardNormalizer(ChunkedFitMixin, SerializableMixin):
     """
     Normalizer that standardizes features by removing mean and scaling to unit variance.
-    
+
     Also known as Z-score normalization.
-    
+
     Attributes:
-        mean_: Dictionary storing mean values for each column
-        std_: Dictionary storing standard deviation values for each column
+        n_jobs: Number of processes used by fit()
+        group_by: Column whose values define groups with their own statistics
+        columns_: List of columns the normalizer was fit on
+        mean_array_: Array of mean values aligned with columns_
+        std_array_: Array of standard deviation values aligned with columns_
+        group_keys_: Index of the groups seen by fit() when group_by is set
+        mean_table_: Array of shape (len(group_keys_) + 1, len(columns_)) with
+            the means of each group; the last row holds mean_array_
+        std_table_: Same as mean_table_ for the standard deviations
     """
-    
-    def __init__(self):
-        """Initialize the normalizer."""
-        self.mean_ = {}
-        self.std_ = {}
-    
-    def fit(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> "StandardNormalizer":
+
+    _init_params = ("n_jobs",)
+    _fitted_arrays = ("mean_array_", "std_array_")
+
+    def __init__(self, n_jobs: Optional[int] = None, group_by: Optional[str] = None):
+        """
+        Initialize the normalizer.
+
+        Args:
+            n_jobs: Number of processes fit() shards columns across. None or 1
+                fits in the current process, -1 uses all CPU cores. Only used for
+                pandas input; pyarrow and polars run their own multithreaded kernels.
+            group_by: Column to group pandas DataFrames by. Each group is scaled
+                with its own statistics, and groups not seen by fit() are
+                scaled with the global statistics.
+        """
+        self.n_jobs = n_jobs
+        self.group_by = group_by
+        self.columns_ = []
+        self.mean_array_ = np.empty(0)
+        self.std_array_ = np.empty(0)
+        self.group_keys_ = pd.Index([])
+        self.mean_table_ = np.empty((0, 0))
+        self.std_table_ = np.empty((0, 0))
+        self._stats = None
+
+    @property
+    def mean_(self) -> Dict[str, float]:
+        """Dictionary mapping each fitted column to its mean."""
+        return dict(zip(self.columns_, self.mean_array_.tolist()))
+
+    @property
+    def std_(self) -> Dict[str, float]:
+        """Dictionary mapping each fitted column to its standard deviation."""
+        return dict(zip(self.columns_, self.std_array_.tolist()))
+
+    def fit(self, df: Frame, columns: Optional[List[str]] = None) -> "StandardNormalizer":
         """
         Learn the mean and standard deviation from the data.
-        
+
         Args:
-            df: DataFrame to learn from
+            df: pandas DataFrame, pyarrow Table or polars DataFrame to learn from
             columns: List of columns to normalize. If None, uses all numeric columns.
-            
+                The group_by column is never normalized.
+
         Returns:
             Self for method chaining
+
+        Raises:
+            TypeError: If group_by is set and df is not a pandas DataFrame
         """
-        if columns is None:
-            columns = df.select_dtypes(include=[np.number]).columns.tolist()
-        
-        self.mean_ = {}
-        self.std_ = {}
-        
-        for col in columns:
-            if col in df.columns:
-                self.mean_[col] = df[col].mean()
-                self.std_[col] = df[col].std()
-        
+        backend = get_backend(df)
+        self.columns_ = [
+            col for col in backend.select_columns(df, columns) if col != self.group_by
+        ]
+        self._stats = None
+
+        statistics = backend.statistics(df, self.columns_, ["mean", "std"], self.n_jobs)
+        self.mean_array_, self.std_array_ = statistics["mean"], statistics["std"]
+
+        if self.group_by is not None:
+            self.group_keys_, tables = group_statistics(df, self.group_by, self.columns_, statistics)
+            self.mean_table_, self.std_table_ = tables["mean"], tables["std"]
+
         return self
-    
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+
+    def partial_fit(self, df: Frame, columns: Optional[List[str]] = None) -> "StandardNormalizer":
+        """
+        Update the mean and standard deviation with a chunk of data.
+
+        Chunk statistics are merged with Chan's parallel update of Welford's
+        algorithm, so the result matches fitting on all chunks at once. The
+        first call after initialization or fit() starts a new stream.
+
+        Args:
+            df: Chunk of data to learn from
+            columns: List of columns to normalize. If None, uses all numeric
+                columns. Only used by the first call of a stream.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the normalizer has a group_by column
+        """
+        if self.group_by is not None:
+            raise ValueError("partial_fit() does not support group_by")
+
+        backend = get_backend(df)
+        if self._stats is None:
+            self._stats = RunningStats(backend.select_columns(df, columns))
+
+        self._stats.update_block(backend.to_block(df, self._stats.columns))
+        self.columns_ = self._stats.columns
+        self.mean_array_ = self._stats.mean.copy()
+        self.std_array_ = self._stats.std()
+
+        return self
+
+    def _affine_params(self, grouped: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the (center, scale, offset) arrays of the fitted transform.
+
+        With grouped=True the arrays are tables with one row per group, as
+        in mean_table_.
+        """
+        if grouped:
+            mean, std = self.mean_table_, self.std_table_
+        else:
+            mean, std = self.mean_array_, self.std_array_
+
+        # Columns with a standard deviation of 0 get a scale of 0 and are mapped to 0
+        scale = np.divide(1.0, std, out=np.zeros_like(std), where=std != 0)
+        offset = np.zeros_like(std)
+
+        return mean, scale, offset
+
+    def transform(self, df: Frame, copy: bool = True) -> Frame:
         """
         Apply standard normalization to the DataFrame.
-        
+
         Args:
-            df: DataFrame to normalize
-            
+            df: pandas DataFrame, pyarrow Table or polars DataFrame to normalize
+            copy: If False, write the results into df instead of returning a
+                new DataFrame, which avoids holding two copies of the data.
+                pyarrow Tables and polars DataFrames are immutable, so for
+                them a new object sharing the untouched columns is returned.
+
         Returns:
-            DataFrame with standardized values
-            
+            Data of the same type with standardized values (df itself when copy=False)
+
         Raises:
             ValueError: If normalizer has not been fit yet
+            TypeError: If group_by is set and df is not a pandas DataFrame
         """
-        if not self.mean_ or not self.std_:
+        if len(self.columns_) == 0:
             raise ValueError("Normalizer has not been fit yet. Call fit() first.")
-        
-        df_normalized = df.copy()
-        
-        for col in self.mean_.keys():
-            if col in df_normalized.columns:
-                if self.std_[col] == 0:
-                    # Handle case where standard deviation is 0
-                    df_normalized[col] = 0
-                else:
-                    # Apply z-score normalization
-                    df_normalized[col] = (
-                        df_normalized[col] - self.mean_[col]
-                    ) / self.std_[col]
-        
-        return df_normalized
-    
-    def fit_transform(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
+
+        if self.group_by is not None:
+            rows = group_rows(df, self.group_by, self.group_keys_)
+            return apply_affine(df, self.columns_, *self._affine_params(grouped=True),
+                                copy=copy, rows=rows)
+
+        return get_backend(df).affine(df, self.columns_, *self._affine_params(), copy=copy)
+
+    def fit_transform(self, df: Frame, columns: Optional[List[str]] = None,
+                      copy: bool = True) -> Frame:
         """
         Fit the normalizer and transform the data in one step.
-        
+
         Args:
             df: DataFrame to fit and transform
             columns: List of columns to normalize
-            
+            copy: If False, write the results into df
+
         Returns:
             DataFrame with standardized values
         """
-        return self.fit(df, columns).transform(df)
\ No newline at end of file
+        return self.fit(df, columns).transform(df, copy=copy)
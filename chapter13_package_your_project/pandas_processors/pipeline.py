@@ -0,0 +1,292 @@
+"""
+Fused preprocessing pipelines.
+
+This module provides a Pipeline that chains imputers and normalizers. The
+statistics every step needs are computed in one pass over the data, and at
+transform time all steps are applied as a single vectorized kernel.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ._engine import (
+    ChunkedFitMixin, RunningStats, column_extrema, column_median, column_moments,
+    merge_moments, present_columns, sample_std, select_columns, to_block, write_block,
+)
+from .impute import MeanMedianImputer, SimpleImputer
+from .normalize import MinMaxNormalizer, StandardNormalizer
+
+Step = Union[MeanMedianImputer, SimpleImputer, MinMaxNormalizer, StandardNormalizer]
+
+
+def _affine(values: np.ndarray, center: np.ndarray, scale: np.ndarray,
+            offset: np.ndarray) -> np.ndarray:
+    """Map per-column values through ``(values - center) * scale + offset``."""
+    return (values - center) * scale + offset
+
+
+class Pipeline(ChunkedFitMixin):
+    """
+    Chain of imputers and normalizers fitted and applied as one transform.
+
+    Every supported step maps each column through an affine function, and
+    imputers set missing values to a constant. The whole chain therefore
+    collapses into ``a * x + b`` per column, with missing values replaced by
+    a per-column fill value. Each step's statistics are derived from the
+    statistics of the raw data instead of from the output of the previous
+    step, so fitting needs one pass and transforming needs one allocation.
+    An imputer placed after another imputer has nothing left to fill, and
+    a median imputer in that position reports the median of the originally
+    observed values.
+
+    Example:
+        >>> pipeline = Pipeline([
+        ...     ("impute", MeanMedianImputer(strategy="median")),
+        ...     ("scale", StandardNormalizer()),
+        ... ])
+        >>> df_clean = pipeline.fit_transform(df)
+
+    Attributes:
+        steps: List of (name, processor) tuples, fitted in place by fit()
+        columns_: List of columns the pipeline was fit on
+        scale_: Per-column multiplier of the fused transform
+        offset_: Per-column offset of the fused transform
+        fill_: Per-column value for missing inputs, NaN if they stay missing
+        timings_: Seconds spent in each stage of the last fit and transform
+    """
+
+    def __init__(self, steps: List[Tuple[str, Step]]):
+        """
+        Initialize the pipeline.
+
+        Args:
+            steps: List of (name, processor) tuples applied in order
+
+        Raises:
+            TypeError: If a step is not an imputer or normalizer from this package
+            ValueError: If a SimpleImputer has a non-numeric fill value or a
+                step has a group_by column
+        """
+        for name, step in steps:
+            if not isinstance(step, (MeanMedianImputer, SimpleImputer,
+                                     MinMaxNormalizer, StandardNormalizer)):
+                raise TypeError(f"Step '{name}' is not a supported processor")
+            if isinstance(step, SimpleImputer) and not isinstance(step.fill_value, (int, float)):
+                raise ValueError(f"Step '{name}' must have a numeric fill value")
+            if getattr(step, "group_by", None) is not None:
+                raise ValueError(f"Step '{name}' uses group_by, which Pipeline does not support")
+
+        self.steps = steps
+        self.columns_ = []
+        self.scale_ = np.empty(0)
+        self.offset_ = np.empty(0)
+        self.fill_ = np.empty(0)
+        self.timings_ = {}
+        self._stats = None
+        self._n_rows = 0
+
+    def _needs(self, step_class: type, **attributes) -> bool:
+        """Return whether any step is an instance of step_class with the given attributes."""
+        return any(
+            isinstance(step, step_class)
+            and all(getattr(step, key) == value for key, value in attributes.items())
+            for _, step in self.steps
+        )
+
+    def fit(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> "Pipeline":
+        """
+        Fit every step from a single pass of statistics over the data.
+
+        Args:
+            df: DataFrame to learn from
+            columns: List of columns to process. If None, uses all numeric columns.
+
+        Returns:
+            Self for method chaining
+        """
+        self.timings_ = {}
+        self._stats = None
+        self.columns_ = select_columns(df, columns)
+
+        start = time.perf_counter()
+        block = to_block(df, self.columns_)
+        count, mean, m2 = column_moments(block)
+        minimum, maximum = (
+            column_extrema(block) if self._needs(MinMaxNormalizer) else (None, None)
+        )
+        median, = (
+            column_median(block) if self._needs(MeanMedianImputer, strategy="median") else (None,)
+        )
+        self.timings_["statistics"] = time.perf_counter() - start
+
+        self._fit_steps(len(df), count, mean, m2, minimum, maximum, median)
+        return self
+
+    def partial_fit(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> "Pipeline":
+        """
+        Update the pipeline with a chunk of data.
+
+        Medians are approximated with the sketch settings of the first median
+        imputer. The first call after initialization or fit() starts a new stream.
+
+        Args:
+            df: Chunk of data to learn from
+            columns: List of columns to process. If None, uses all numeric
+                columns. Only used by the first call of a stream.
+
+        Returns:
+            Self for method chaining
+        """
+        self.timings_ = {}
+        if self._stats is None:
+            median_errors = [
+                step.sketch_error for _, step in self.steps
+                if isinstance(step, MeanMedianImputer) and step.strategy == "median"
+            ]
+            self._stats = RunningStats(
+                select_columns(df, columns),
+                extrema=self._needs(MinMaxNormalizer),
+                quantile_error=median_errors[0] if median_errors else None,
+            )
+            self._n_rows = 0
+
+        start = time.perf_counter()
+        self._stats.update(df)
+        self._n_rows += len(df)
+        self.timings_["statistics"] = time.perf_counter() - start
+
+        stats = self._stats
+        self.columns_ = stats.columns
+        self._fit_steps(
+            self._n_rows, stats.count, stats.mean, stats.m2, stats.min, stats.max,
+            stats.median() if stats.sketches is not None else None,
+        )
+        return self
+
+    def _fit_steps(self, n_rows: int, count: np.ndarray, mean: np.ndarray, m2: np.ndarray,
+                   minimum: Optional[np.ndarray], maximum: Optional[np.ndarray],
+                   median: Optional[np.ndarray]) -> None:
+        """
+        Fit each step and compose the fused transform from raw-data statistics.
+
+        The statistics describe the observed (non-missing) values in the
+        space of the current step and are updated analytically as each step
+        is applied: affine steps map them directly, and imputation merges in
+        the filled values as a group with zero variance.
+        """
+        n_cols = len(self.columns_)
+        count, mean, m2 = count.copy(), mean.copy(), m2.copy()
+        scale, offset, fill = np.ones(n_cols), np.zeros(n_cols), np.full(n_cols, np.nan)
+
+        for name, step in self.steps:
+            start = time.perf_counter()
+
+            if isinstance(step, (MeanMedianImputer, SimpleImputer)):
+                if isinstance(step, SimpleImputer):
+                    value = np.full(n_cols, float(step.fill_value))
+                else:
+                    value = mean.copy() if step.strategy == "mean" else median.copy()
+                    step.columns_, step.fill_array_, step._stats = list(self.columns_), value, None
+
+                n_missing = n_rows - count
+                has_missing = n_missing > 0
+                fill = np.where(has_missing & np.isnan(fill), value, fill)
+
+                # Merge the filled values into the statistics as a zero-variance group
+                count, mean, m2 = merge_moments(
+                    count, mean, m2,
+                    n_missing, np.where(has_missing, value, np.nan), np.zeros(n_cols),
+                )
+                if minimum is not None:
+                    minimum = np.where(has_missing, np.fmin(minimum, value), minimum)
+                    maximum = np.where(has_missing, np.fmax(maximum, value), maximum)
+            else:
+                step.columns_, step._stats = list(self.columns_), None
+                if isinstance(step, MinMaxNormalizer):
+                    step.data_min_array_, step.data_max_array_ = minimum.copy(), maximum.copy()
+                else:
+                    step.mean_array_, step.std_array_ = mean.copy(), sample_std(count, m2)
+                params = step._affine_params()
+                step_scale, step_offset = params[1], params[2]
+                constant = step_scale == 0
+
+                scale = scale * step_scale
+                offset = _affine(offset, *params)
+                # Constant columns map every row, missing or not, to the offset
+                fill = np.where(constant, step_offset, _affine(fill, *params))
+
+                mean = _affine(mean, *params)
+                m2 = np.where(constant, 0.0, m2 * step_scale ** 2)
+                count = np.where(constant, n_rows, count)
+                if minimum is not None:
+                    low, high = _affine(minimum, *params), _affine(maximum, *params)
+                    minimum, maximum = np.fmin(low, high), np.fmax(low, high)
+                if median is not None:
+                    median = _affine(median, *params)
+
+            self.timings_[name] = time.perf_counter() - start
+
+        self.scale_, self.offset_, self.fill_ = scale, offset, fill
+
+    def transform(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+        """
+        Apply all steps to the DataFrame in one fused kernel.
+
+        Args:
+            df: DataFrame to transform
+            copy: If False, write the results into df instead of returning a
+                new DataFrame
+
+        Returns:
+            Transformed DataFrame (df itself when copy=False)
+
+        Raises:
+            ValueError: If the pipeline has not been fit yet
+        """
+        if len(self.columns_) == 0:
+            raise ValueError("Pipeline has not been fit yet. Call fit() first.")
+
+        start = time.perf_counter()
+        present = present_columns(df, self.columns_)
+        selected = np.asarray(self.columns_, dtype=object)[present].tolist()
+        fill = self.fill_[present]
+
+        block = to_block(df, selected)
+        result = block * self.scale_[present]
+        result += self.offset_[present]
+        np.copyto(result, fill, where=np.isnan(block) & ~np.isnan(fill))
+
+        df = write_block(df, selected, result, copy)
+        self.timings_["transform"] = time.perf_counter() - start
+        return df
+
+    def fit_transform(self, df: pd.DataFrame, columns: Optional[List[str]] = None,
+                      copy: bool = True) -> pd.DataFrame:
+        """
+        Fit the pipeline and transform the data in one step.
+
+        Args:
+            df: DataFrame to fit and transform
+            columns: List of columns to process
+            copy: If False, write the results into df
+
+        Returns:
+            Transformed DataFrame
+        """
+        return self.fit(df, columns).transform(df, copy=copy)
+
+    def report_timings(self) -> Dict[str, float]:
+        """
+        Return the timings of the last fit and transform in milliseconds.
+
+        The "statistics" entry is the shared pass over the data, one entry
+        per step covers deriving that step's parameters, and "transform" is
+        the fused kernel.
+
+        Returns:
+            Dictionary mapping stage names to milliseconds
+        """
+        return {stage: seconds * 1000 for stage, seconds in self.timings_.items()}
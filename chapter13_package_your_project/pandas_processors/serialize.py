@@ -0,0 +1,260 @@
+"""
+Binary serialization of fitted processors.
+
+This module provides a compact file format for fitted imputers and
+normalizers. A file holds a small JSON header followed by the column labels
+as UTF-8 text with an offsets array and one contiguous float64 array per
+fitted parameter, each aligned to 64 bytes. Loading memory-maps the arrays
+and decodes the labels only when ``columns_`` is first used, so start-up
+time does not grow with the number of columns.
+
+Layout::
+
+    b"PDPROC01" | header length (uint64, little endian) | JSON header | arrays
+"""
+
+import json
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+
+MAGIC = b"PDPROC01"
+ALIGNMENT = 64
+FORMAT_VERSION = 3
+
+# Types of column labels that are stored, in the order of their codes
+LABEL_TYPES = (str, int, float, bool)
+
+
+def _align(offset: int) -> int:
+    """Round offset up to the next multiple of ALIGNMENT."""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _header_length(prefix: bytes) -> int:
+    """Validate the magic bytes and return the length of the JSON header."""
+    if prefix[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a serialized pandas_processors file")
+    header_length, = struct.unpack("<Q", prefix[len(MAGIC):len(MAGIC) + 8])
+    return header_length
+
+
+def _parse_header(data: bytes) -> Dict[str, Any]:
+    """Decode the JSON header at the start of data."""
+    start = len(MAGIC) + 8
+    header = json.loads(data[start:start + _header_length(data)])
+    if header["version"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported format version {header['version']}")
+    return header
+
+
+def _encode_labels(labels: List[Any]) -> Dict[str, np.ndarray]:
+    """Encode column labels as type codes, UTF-8 text and text offsets."""
+    codes, texts = [], []
+    for label in labels:
+        if isinstance(label, np.generic):
+            label = label.item()
+        if type(label) not in LABEL_TYPES:
+            raise ValueError(
+                f"Column labels must be strings or numbers to be serialized, got {label!r}"
+            )
+        codes.append(LABEL_TYPES.index(type(label)))
+        texts.append((label if isinstance(label, str) else repr(label)).encode())
+
+    return {
+        "label_types": np.array(codes, dtype=np.uint8),
+        "label_offsets": np.cumsum([0] + [len(text) for text in texts], dtype="<i8"),
+        "label_text": np.frombuffer(b"".join(texts), dtype=np.uint8),
+    }
+
+
+class _EncodedLabels:
+    """Column labels as stored in a file, decoded on first use."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = arrays
+
+    def decode(self) -> List[Any]:
+        """Rebuild the list of labels with their original types."""
+        text = self.arrays["label_text"].tobytes()
+        offsets = self.arrays["label_offsets"].tolist()
+        parse = (bytes.decode, int, float, lambda value: value == b"True")
+        return [
+            parse[code](text[start:stop])
+            for code, start, stop in zip(self.arrays["label_types"].tolist(), offsets, offsets[1:])
+        ]
+
+
+class SerializableMixin:
+    """
+    Adds to_bytes(), from_bytes(), save() and load() to fitted processors.
+
+    Classes list the constructor arguments to store in ``_init_params`` and
+    the fitted float arrays aligned with ``columns_`` in ``_fitted_arrays``.
+    """
+
+    _init_params: Tuple[str, ...] = ()
+    _fitted_arrays: Tuple[str, ...] = ()
+
+    @property
+    def columns_(self) -> List[Any]:
+        """Columns the processor was fit on, decoded from a loaded file on first use."""
+        if isinstance(self._columns, _EncodedLabels):
+            self._columns = self._columns.decode()
+        return self._columns
+
+    @columns_.setter
+    def columns_(self, columns: List[Any]) -> None:
+        self._columns = columns
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the fitted processor.
+
+        Returns:
+            Bytes in the pandas_processors binary format
+
+        Raises:
+            ValueError: If the processor has not been fit yet, has a group_by
+                column or has column labels other than strings and numbers
+        """
+        if len(self.columns_) == 0:
+            raise ValueError(f"{type(self).__name__} has not been fit yet. Call fit() first.")
+        if getattr(self, "group_by", None) is not None:
+            raise ValueError("Processors with group_by cannot be serialized")
+
+        arrays = _encode_labels(self.columns_)
+        arrays.update({
+            name: np.ascontiguousarray(getattr(self, name), dtype="<f8")
+            for name in self._fitted_arrays
+        })
+
+        layout, position = {}, 0
+        for name, array in arrays.items():
+            layout[name] = {"dtype": array.dtype.str, "offset": position, "count": len(array)}
+            position = _align(position + array.nbytes)
+
+        header = {
+            "version": FORMAT_VERSION,
+            "class": type(self).__name__,
+            "params": {name: getattr(self, name) for name in self._init_params},
+            "n_columns": len(self.columns_),
+            "arrays": layout,
+        }
+        # The header stores absolute offsets, which depend on the header's
+        # own size, so grow the space reserved for it until it fits
+        prefix_size = len(MAGIC) + 8
+        data_start = _align(prefix_size + len(json.dumps(header)))
+        while True:
+            shifted = {
+                name: {**entry, "offset": entry["offset"] + data_start}
+                for name, entry in layout.items()
+            }
+            header_bytes = json.dumps({**header, "arrays": shifted}).encode()
+            if prefix_size + len(header_bytes) <= data_start:
+                break
+            data_start += ALIGNMENT
+        header_bytes += b" " * (data_start - prefix_size - len(header_bytes))
+
+        buffer = bytearray(data_start + position)
+        buffer[:len(MAGIC)] = MAGIC
+        buffer[len(MAGIC):prefix_size] = struct.pack("<Q", len(header_bytes))
+        buffer[prefix_size:data_start] = header_bytes
+        for name, array in arrays.items():
+            offset = shifted[name]["offset"]
+            buffer[offset:offset + array.nbytes] = array.tobytes()
+
+        return bytes(buffer)
+
+    @classmethod
+    def _from_header(cls, header: Dict[str, Any], read_array):
+        """Build a processor from a decoded header and an array reader."""
+        if header["class"] != cls.__name__:
+            raise ValueError(f"File contains a {header['class']}, not a {cls.__name__}")
+
+        # JSON has no tuples, so restore sequences such as feature_range
+        params = {
+            name: tuple(value) if isinstance(value, list) else value
+            for name, value in header["params"].items()
+        }
+        processor = cls(**params)
+
+        arrays = {
+            name: read_array(np.dtype(entry["dtype"]), entry["offset"], entry["count"])
+            for name, entry in header["arrays"].items()
+        }
+        for name in cls._fitted_arrays:
+            setattr(processor, name, arrays[name])
+        processor.columns_ = _EncodedLabels(arrays)
+
+        return processor
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """
+        Load a processor from bytes produced by to_bytes().
+
+        The fitted arrays are read-only views into data, not copies.
+
+        Args:
+            data: Serialized processor
+
+        Returns:
+            Fitted processor
+
+        Raises:
+            ValueError: If data is not a serialized processor of this class
+        """
+        header = _parse_header(data)
+        return cls._from_header(
+            header,
+            lambda dtype, offset, count: np.frombuffer(data, dtype=dtype, count=count, offset=offset),
+        )
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """
+        Save the fitted processor to a file.
+
+        Args:
+            path: Output file path
+
+        Returns:
+            Path of the written file
+        """
+        path = Path(path)
+        path.write_bytes(self.to_bytes())
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap: bool = True):
+        """
+        Load a processor saved with save().
+
+        Args:
+            path: File written by save()
+            mmap: If True, memory-map the fitted arrays read-only instead of
+                reading them, so loading takes the same time for any number
+                of columns and processes share the pages
+
+        Returns:
+            Fitted processor
+
+        Raises:
+            ValueError: If the file is not a serialized processor of this class
+        """
+        path = Path(path)
+        if not mmap:
+            return cls.from_bytes(path.read_bytes())
+
+        with open(path, "rb") as f:
+            prefix = f.read(len(MAGIC) + 8)
+            header = _parse_header(prefix + f.read(_header_length(prefix)))
+
+        return cls._from_header(
+            header,
+            lambda dtype, offset, count: np.memmap(
+                path, dtype=dtype, mode="r", offset=offset, shape=(count,)
+            ),
+        )
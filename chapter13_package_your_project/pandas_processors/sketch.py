@@ -0,0 +1,145 @@
+"""
+Streaming quantile sketch.
+
+This module provides a mergeable KLL quantile sketch used to approximate
+medians over data that is too large to hold in memory at once.
+"""
+
+import math
+from typing import List, Optional
+
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    KLL sketch that approximates quantiles of a stream of numbers.
+
+    Values are kept in a hierarchy of buffers ("compactors"). When a buffer
+    overflows it is sorted and every other value is promoted to the next
+    level, where each value stands for twice as many observations. Memory
+    stays bounded by roughly ``3 * k`` values no matter how many values are
+    added.
+
+    Attributes:
+        error: Target normalized rank error of quantile estimates
+        k: Size of the largest compactor, derived from error
+        count: Number of values added so far
+    """
+
+    def __init__(self, error: float = 0.01, seed: Optional[int] = 0):
+        """
+        Initialize the sketch.
+
+        Args:
+            error: Target rank error, e.g. 0.01 means a reported median lies
+                between the 49th and 51st percentiles with high probability
+            seed: Seed for the random choices made during compaction
+
+        Raises:
+            ValueError: If error is not between 0 and 1
+        """
+        if not 0 < error < 1:
+            raise ValueError("error must be between 0 and 1")
+
+        self.error = error
+        # Empirical KLL error bound: error ~= 2.296 / k ** 0.9723
+        self.k = max(8, math.ceil((2.296 / error) ** (1 / 0.9723)))
+        self.count = 0
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        """Return the number of values a compactor may hold before compacting."""
+        depth = len(self._levels) - level - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self) -> None:
+        """Compact overflowing levels until every level is within capacity."""
+        level = 0
+        while level < len(self._levels):
+            values = self._levels[level]
+            if len(values) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+
+                values = np.sort(values)
+                # Keep one value behind when the level has an odd size
+                keep = values[:len(values) % 2]
+                promoted = values[len(keep) + self._rng.integers(2)::2]
+
+                self._levels[level] = keep
+                self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+            level += 1
+
+    def update(self, values: np.ndarray) -> "QuantileSketch":
+        """
+        Add values to the sketch. Missing values are ignored.
+
+        Args:
+            values: 1-D array of values
+
+        Returns:
+            Self for method chaining
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self.count += len(values)
+        self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Merge another sketch into this one.
+
+        Args:
+            other: Sketch built over a different part of the stream
+
+        Returns:
+            Self for method chaining
+        """
+        for level, values in enumerate(other._levels):
+            if level == len(self._levels):
+                self._levels.append(np.empty(0))
+            self._levels[level] = np.concatenate([self._levels[level], values])
+
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile of the values added so far.
+
+        While no compaction has happened the sketch still holds every value
+        and the result is exact.
+
+        Args:
+            q: Quantile to estimate, between 0 and 1
+
+        Returns:
+            Estimated quantile, or NaN if the sketch is empty
+        """
+        if self.count == 0:
+            return np.nan
+        if len(self._levels[0]) == self.count:
+            return float(np.quantile(self._levels[0], q))
+
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(len(level_values), 2.0 ** level)
+            for level, level_values in enumerate(self._levels)
+        ])
+        order = np.argsort(values, kind="stable")
+        cumulative = np.cumsum(weights[order])
+
+        position = np.searchsorted(cumulative, q * cumulative[-1], side="left")
+        return float(values[order][min(position, len(values) - 1)])
+
+    def median(self) -> float:
+        """Estimate the median of the values added so far."""
+        return self.quantile(0.5)
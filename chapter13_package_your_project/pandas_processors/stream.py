@@ -0,0 +1,58 @@
+"""
+Chunked data reading utilities.
+
+This module provides helpers for reading large CSV and Parquet files as a
+stream of pandas DataFrames, for use with ``partial_fit`` and
+``fit_from_chunks``.
+"""
+
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+
+import pandas as pd
+
+
+def iter_chunks(path: Union[str, Path], chunksize: int = 100_000,
+                columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV or Parquet file lazily as DataFrames of at most chunksize rows.
+
+    CSV files are read with ``pd.read_csv(..., chunksize=...)``. Parquet files
+    are read batch by batch with pyarrow, so only one batch is in memory at a
+    time.
+
+    Args:
+        path: Path to a .csv or .parquet file
+        chunksize: Maximum number of rows per chunk
+        columns: Columns to read. If None, reads all columns.
+
+    Yields:
+        DataFrame chunks in file order
+
+    Raises:
+        ValueError: If the file extension is not supported
+        ImportError: If reading Parquet and pyarrow is not installed
+
+    Example:
+        >>> imputer = MeanMedianImputer(strategy="median")
+        >>> imputer.fit_from_chunks(iter_chunks("daily_extract.parquet"))
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == ".csv":
+        with pd.read_csv(path, chunksize=chunksize, usecols=columns) as reader:
+            yield from reader
+    elif suffix in (".parquet", ".pq"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Reading Parquet files requires pyarrow. Install it with: pip install pyarrow"
+            ) from e
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Unsupported file type '{path.suffix}'. Use .csv or .parquet")
@@ -0,0 +1,127 @@
+"""
+Tests for the pyarrow and polars backends.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from pandas_processors.impute import MeanMedianImputer, SimpleImputer
+from pandas_processors.normalize import MinMaxNormalizer, StandardNormalizer
+
+pa = pytest.importorskip("pyarrow")
+pl = pytest.importorskip("polars")
+
+
+@pytest.fixture
+def df():
+    """DataFrame with missing values, an integer column and a constant column."""
+    return pd.DataFrame({
+        "A": [1.0, 2.0, np.nan, 4.0, 10.0],
+        "B": [5, 6, 7, 8, 9],
+        "C": [3.0, np.nan, 3.0, 3.0, 3.0],
+        "D": ["x", None, "y", "z", "w"],
+    })
+
+
+def to_arrow(df):
+    """Convert to a pyarrow Table, turning NaN into nulls."""
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def to_polars(df):
+    """Convert to a polars DataFrame, turning NaN into nulls."""
+    return pl.from_pandas(df)
+
+
+CONVERTERS = [to_arrow, to_polars]
+
+PROCESSORS = [
+    lambda: MeanMedianImputer(strategy="mean"),
+    lambda: MeanMedianImputer(strategy="median"),
+    lambda: MinMaxNormalizer(feature_range=(-1, 1)),
+    lambda: StandardNormalizer(),
+]
+
+
+def assert_matches_pandas(result, expected):
+    """Assert that a pyarrow or polars result holds the same values as pandas."""
+    result = result.to_pandas()
+    columns = ["A", "B", "C"]
+    np.testing.assert_allclose(
+        result[columns].to_numpy(dtype=float, na_value=np.nan),
+        expected[columns].to_numpy(dtype=float),
+    )
+
+
+class TestBackends:
+    """Test that processors accept pyarrow Tables and polars DataFrames."""
+    
+    @pytest.mark.parametrize("convert", CONVERTERS)
+    @pytest.mark.parametrize("make_processor", PROCESSORS)
+    def test_fit_transform_matches_pandas(self, df, convert, make_processor):
+        """Test that fitted parameters and output match the pandas path."""
+        expected_processor = make_processor()
+        expected = expected_processor.fit_transform(df)
+        processor = make_processor()
+        result = processor.fit_transform(convert(df))
+        
+        assert type(result) is type(convert(df))
+        assert processor.columns_ == expected_processor.columns_
+        assert_matches_pandas(result, expected)
+    
+    @pytest.mark.parametrize("make_data", [pa.table, pl.DataFrame])
+    def test_nan_counts_as_missing(self, make_data):
+        """Test that NaN in a float column is treated like a null."""
+        data = make_data({"A": [1.0, float("nan"), 3.0]})
+        
+        imputer = MeanMedianImputer().fit(data)
+        result = imputer.transform(data).to_pandas()
+        
+        assert imputer.fill_values_ == {"A": 2.0}
+        assert result["A"].tolist() == [1.0, 2.0, 3.0]
+    
+    @pytest.mark.parametrize("convert", CONVERTERS)
+    def test_untouched_columns_are_shared(self, df, convert):
+        """Test that columns without missing values are not copied."""
+        data = convert(df)
+        result = MeanMedianImputer().fit(data, columns=["A", "B"]).transform(data)
+        
+        if isinstance(data, pa.Table):
+            assert result.column("B").chunk(0).buffers()[1].address == \
+                data.column("B").chunk(0).buffers()[1].address
+        else:
+            assert np.shares_memory(result["B"].to_numpy(), data["B"].to_numpy())
+        assert result.to_pandas()["A"].isna().sum() == 0
+    
+    @pytest.mark.parametrize("convert", CONVERTERS)
+    def test_partial_fit(self, df, convert):
+        """Test that partial_fit on chunks matches fit on pandas data."""
+        data = convert(df)
+        normalizer = StandardNormalizer()
+        normalizer.partial_fit(data.slice(0, 2))
+        normalizer.partial_fit(data.slice(2, 3))
+        
+        expected = StandardNormalizer().fit(df)
+        np.testing.assert_allclose(normalizer.mean_array_, expected.mean_array_)
+        np.testing.assert_allclose(normalizer.std_array_, expected.std_array_)
+    
+    @pytest.mark.parametrize("convert", CONVERTERS)
+    def test_simple_imputer(self, df, convert):
+        """Test that SimpleImputer fills string columns with its fill value."""
+        result = SimpleImputer(fill_value="missing").transform(convert(df), columns=["D"])
+        
+        assert result.to_pandas()["D"].tolist() == ["x", "missing", "y", "z", "w"]
+    
+    @pytest.mark.parametrize("convert", CONVERTERS)
+    def test_simple_imputer_mixed_dtypes(self, df, convert):
+        """Test that the default fill value fills numeric and string columns alike."""
+        imputer = SimpleImputer()
+        result = imputer.transform(convert(df))
+        
+        assert_matches_pandas(result, imputer.transform(df))
+        assert result.to_pandas()["D"].tolist() == ["x", "0", "y", "z", "w"]
+    
+    def test_unsupported_type(self):
+        """Test that unsupported input raises TypeError."""
+        with pytest.raises(TypeError, match="Unsupported data type"):
+            MinMaxNormalizer().fit(np.zeros((3, 2)))
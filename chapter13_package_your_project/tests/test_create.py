@@ -5,7 +5,9 @@ Tests for the create module.
 import pytest
 import pandas as pd
 import numpy as np
-from pandas_processors.create import create_dataframe, create_sample_data
+from pandas_processors.create import (
+    create_dataframe, create_sample_data, iter_sample_data, write_sample_data,
+)
 
 
 class TestCreateDataFrame:
@@ -82,4 +84,60 @@ class TestCreateSampleData:
         df1 = create_sample_data(n_rows=10, n_cols=2, random_state=42)
         df2 = create_sample_data(n_rows=10, n_cols=2, random_state=42)
         
-        pd.testing.assert_frame_equal(df1, df2)
\ No newline at end of file
+        pd.testing.assert_frame_equal(df1, df2)
+    
+    def test_create_sample_data_exact_missing_count(self):
+        """Test that exactly missing_rate of the cells are missing."""
+        df = create_sample_data(n_rows=200, n_cols=5, missing_rate=0.1)
+        
+        assert df.isnull().sum().sum() == 100
+    
+    def test_create_sample_data_with_generator(self):
+        """Test that a np.random.Generator can be passed as random_state."""
+        df1 = create_sample_data(n_rows=10, n_cols=2, random_state=np.random.default_rng(7))
+        df2 = create_sample_data(n_rows=10, n_cols=2, random_state=7)
+        
+        pd.testing.assert_frame_equal(df1, df2)
+
+
+class TestIterSampleData:
+    """Test the iter_sample_data function."""
+    
+    def test_iter_sample_data_chunks(self):
+        """Test that chunks cover all rows with a continuous index."""
+        chunks = list(iter_sample_data(n_rows=250, n_cols=3, missing_rate=0.2, chunk_rows=100))
+        
+        assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+        df = pd.concat(chunks)
+        assert list(df.index) == list(range(250))
+        assert list(df.columns) == ["feature_1", "feature_2", "feature_3"]
+        assert df.isnull().sum().sum() == 60 + 60 + 30
+    
+    def test_iter_sample_data_single_chunk_matches_create(self):
+        """Test that one chunk reproduces create_sample_data."""
+        chunk, = iter_sample_data(n_rows=50, n_cols=4, chunk_rows=50)
+        
+        pd.testing.assert_frame_equal(chunk, create_sample_data(n_rows=50, n_cols=4))
+
+
+class TestWriteSampleData:
+    """Test the write_sample_data function."""
+    
+    @pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+    def test_write_sample_data(self, tmp_path, suffix):
+        """Test writing sample data to disk in chunks."""
+        pytest.importorskip("pyarrow")
+        path = write_sample_data(tmp_path / f"data{suffix}", n_rows=250, n_cols=3, chunk_rows=100)
+        
+        if suffix == ".parquet":
+            df = pd.read_parquet(path)
+        else:
+            df = pd.read_feather(path)
+        
+        expected = pd.concat(iter_sample_data(n_rows=250, n_cols=3, chunk_rows=100))
+        pd.testing.assert_frame_equal(df, expected.reset_index(drop=True))
+    
+    def test_write_sample_data_unsupported_extension(self, tmp_path):
+        """Test that unsupported file types raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported file type"):
+            write_sample_data(tmp_path / "data.csv")
@@ -87,6 +87,125 @@ class TestMeanMedianImputer:
         with pytest.raises(ValueError, match="Imputer has not been fit yet"):
             imputer.transform(df)
 
+    
+    def test_mean_imputer_partial_fit_matches_fit(self):
+        """Test that streaming mean fill values match a full fit."""
+        df = pd.DataFrame({
+            "A": [1, 2, np.nan, 4, 5, 6],
+            "B": [np.nan, 1, 2, 3, np.nan, 10]
+        })
+        
+        streamed = MeanMedianImputer(strategy="mean")
+        streamed.partial_fit(df.iloc[:2]).partial_fit(df.iloc[2:])
+        full = MeanMedianImputer(strategy="mean").fit(df)
+        
+        np.testing.assert_array_almost_equal(streamed.fill_array_, full.fill_array_)
+    
+    def test_median_imputer_fit_from_chunks(self):
+        """Test that the streaming median is within the sketch error."""
+        rng = np.random.default_rng(0)
+        values = rng.standard_normal(100_000)
+        df = pd.DataFrame({"A": values})
+        chunks = (df.iloc[i:i + 10_000] for i in range(0, len(df), 10_000))
+        
+        imputer = MeanMedianImputer(strategy="median", sketch_error=0.01)
+        imputer.fit_from_chunks(chunks)
+        
+        rank = (values < imputer.fill_values_["A"]).mean()
+        assert abs(rank - 0.5) < 0.01
+    
+    @pytest.mark.parametrize("strategy", ["mean", "median"])
+    def test_parallel_fit_matches_serial(self, strategy):
+        """Test that fitting across processes gives the same fill values."""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(rng.standard_normal((200, 7)), columns=list("ABCDEFG"))
+        df.iloc[::5, 2] = np.nan
+        
+        serial = MeanMedianImputer(strategy=strategy).fit(df)
+        parallel = MeanMedianImputer(strategy=strategy, n_jobs=2).fit(df)
+        
+        assert parallel.columns_ == serial.columns_
+        np.testing.assert_array_almost_equal(parallel.fill_array_, serial.fill_array_)
+    
+    def test_invalid_n_jobs(self):
+        """Test that an invalid n_jobs raises ValueError at fit time."""
+        df = pd.DataFrame({"A": [1.0, 2.0], "B": [3.0, 4.0]})
+        
+        with pytest.raises(ValueError, match="n_jobs must be"):
+            MeanMedianImputer(n_jobs=0).fit(df)
+    
+    def test_transform_in_place(self):
+        """Test that copy=False fills the given DataFrame itself."""
+        df = pd.DataFrame({
+            "A": [1.0, np.nan, 3.0],
+            "B": [1, 2, 3],
+            "C": ["x", "y", "z"]
+        })
+        imputer = MeanMedianImputer(strategy="mean").fit(df)
+        
+        result = imputer.transform(df, copy=False)
+        
+        assert result is df
+        assert df.loc[1, "A"] == 2.0
+        assert df["B"].dtype == np.int64
+        assert df["C"].tolist() == ["x", "y", "z"]
+    
+    def test_transform_copy_leaves_input_untouched(self):
+        """Test that the default transform does not modify its input."""
+        df = pd.DataFrame({"A": [1.0, np.nan, 3.0]})
+        
+        MeanMedianImputer().fit_transform(df)
+        
+        assert df["A"].isnull().sum() == 1
+    
+    def test_fit_from_chunks_empty_raises_error(self):
+        """Test that fitting on no chunks raises ValueError."""
+        with pytest.raises(ValueError, match="No chunks to fit on"):
+            MeanMedianImputer().fit_from_chunks([])
+    
+    def test_group_by_fills_per_group(self):
+        """Test that each group is filled with its own median."""
+        df = pd.DataFrame({
+            "region": ["north", "north", "north", "south", "south"],
+            "A": [1.0, 3.0, np.nan, 10.0, np.nan],
+            "B": [1, 2, 3, 4, 5]
+        })
+        
+        imputer = MeanMedianImputer(strategy="median", group_by="region").fit(df)
+        result = imputer.transform(df)
+        
+        assert imputer.columns_ == ["A", "B"]
+        assert imputer.group_keys_.tolist() == ["north", "south"]
+        assert result["A"].tolist() == [1.0, 3.0, 2.0, 10.0, 10.0]
+        assert result["region"].tolist() == df["region"].tolist()
+    
+    def test_group_by_unseen_group_uses_global_value(self):
+        """Test that groups not seen during fit fall back to the global mean."""
+        df = pd.DataFrame({"region": ["north", "north", "south"], "A": [1.0, 3.0, 8.0]})
+        imputer = MeanMedianImputer(strategy="mean", group_by="region").fit(df)
+        
+        result = imputer.transform(pd.DataFrame({
+            "region": ["north", "east"],
+            "A": [np.nan, np.nan]
+        }))
+        
+        assert result["A"].tolist() == [2.0, 4.0]
+    
+    def test_group_by_all_missing_group_uses_global_value(self):
+        """Test that a group without observed values falls back to the global mean."""
+        df = pd.DataFrame({"region": ["north", "north", "south"], "A": [1.0, 3.0, np.nan]})
+        
+        result = MeanMedianImputer(group_by="region").fit_transform(df)
+        
+        assert result["A"].tolist() == [1.0, 3.0, 2.0]
+    
+    def test_group_by_partial_fit_raises_error(self):
+        """Test that partial_fit with group_by raises ValueError."""
+        df = pd.DataFrame({"region": ["north"], "A": [1.0]})
+        
+        with pytest.raises(ValueError, match="does not support group_by"):
+            MeanMedianImputer(group_by="region").partial_fit(df)
+
 
 class TestSimpleImputer:
     """Test the SimpleImputer class."""
@@ -137,4 +256,25 @@ class TestSimpleImputer:
         assert result.loc[1, "C"] == 999
         
         # B should still have missing value
-        assert result["B"].isnull().any()
\ No newline at end of file
+        assert result["B"].isnull().any()
+    
+    def test_simple_imputer_in_place(self):
+        """Test that copy=False fills the given DataFrame itself."""
+        df = pd.DataFrame({"A": [1.0, np.nan], "B": ["x", None]})
+        
+        result = SimpleImputer(fill_value=0).transform(df, copy=False)
+        
+        assert result is df
+        assert df.loc[1, "A"] == 0
+        assert df.loc[1, "B"] == 0
+    
+    def test_simple_imputer_no_missing_values(self):
+        """Test that nothing is rewritten when no column has missing values."""
+        df = pd.DataFrame({"A": [1, 2], "B": ["x", "y"]})
+        imputer = SimpleImputer(fill_value=-1)
+        
+        assert imputer.transform(df, copy=False) is df
+        
+        result = imputer.transform(df)
+        assert result is not df
+        pd.testing.assert_frame_equal(result, df)
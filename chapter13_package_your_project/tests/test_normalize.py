@@ -91,6 +91,59 @@ class TestMinMaxNormalizer:
         
         with pytest.raises(ValueError, match="Normalizer has not been fit yet"):
             normalizer.transform(df)
+    
+    def test_minmax_normalizer_fitted_arrays(self):
+        """Test that fitted parameters are stored as arrays aligned with columns."""
+        df = pd.DataFrame({
+            "A": [1, 2, 3],
+            "B": [10, np.nan, 30],
+            "C": ["a", "b", "c"]
+        })
+        
+        normalizer = MinMaxNormalizer().fit(df)
+        
+        assert normalizer.columns_ == ["A", "B"]
+        np.testing.assert_array_equal(normalizer.data_min_array_, [1.0, 10.0])
+        np.testing.assert_array_equal(normalizer.data_max_array_, [3.0, 30.0])
+        assert normalizer.data_min_ == {"A": 1.0, "B": 10.0}
+        assert normalizer.data_max_ == {"A": 3.0, "B": 30.0}
+    
+    def test_minmax_normalizer_keeps_missing_values(self):
+        """Test that missing values stay missing after normalization."""
+        df = pd.DataFrame({"A": [0, np.nan, 10]})
+        
+        result = MinMaxNormalizer().fit_transform(df)
+        
+        assert np.isnan(result.loc[1, "A"])
+        np.testing.assert_array_almost_equal(result["A"].dropna(), [0.0, 1.0])
+    
+    def test_minmax_normalizer_preserves_column_order(self):
+        """Test that transform keeps the original column order."""
+        df = pd.DataFrame({"C": ["x", "y"], "A": [1, 2], "B": [3, 4]})
+        
+        result = MinMaxNormalizer().fit_transform(df)
+        
+        assert list(result.columns) == ["C", "A", "B"]
+    
+    def test_minmax_normalizer_skips_absent_columns(self):
+        """Test that fitted columns missing at transform time are skipped."""
+        normalizer = MinMaxNormalizer().fit(pd.DataFrame({"A": [0, 10], "B": [0, 5]}))
+        
+        result = normalizer.transform(pd.DataFrame({"A": [5]}))
+        
+        assert list(result.columns) == ["A"]
+        assert result.loc[0, "A"] == 0.5
+
+    
+    def test_minmax_normalizer_partial_fit_matches_fit(self):
+        """Test that running min and max match a full fit."""
+        df = pd.DataFrame({"A": [3, np.nan, -1, 7], "B": [0, 5, 2, 1]})
+        
+        streamed = MinMaxNormalizer().fit_from_chunks([df.iloc[:2], df.iloc[2:]])
+        full = MinMaxNormalizer().fit(df)
+        
+        assert streamed.data_min_ == full.data_min_
+        assert streamed.data_max_ == full.data_max_
 
 
 class TestStandardNormalizer:
@@ -161,4 +214,102 @@ class TestStandardNormalizer:
         normalizer = StandardNormalizer()
         
         with pytest.raises(ValueError, match="Normalizer has not been fit yet"):
-            normalizer.transform(df)
\ No newline at end of file
+            normalizer.transform(df)
+    
+    def test_standard_normalizer_fitted_arrays(self):
+        """Test that fitted parameters are stored as arrays aligned with columns."""
+        df = pd.DataFrame({
+            "A": [1, 2, 3, 4, 5],
+            "B": [10, 20, np.nan, 40, 50]
+        })
+        
+        normalizer = StandardNormalizer().fit(df)
+        
+        assert normalizer.columns_ == ["A", "B"]
+        np.testing.assert_array_almost_equal(normalizer.mean_array_, [3.0, 30.0])
+        np.testing.assert_array_almost_equal(
+            normalizer.std_array_, [df["A"].std(), df["B"].std()]
+        )
+        assert normalizer.mean_ == pytest.approx({"A": 3.0, "B": 30.0})
+    
+    def test_standard_normalizer_partial_fit_matches_fit(self):
+        """Test that merged chunk moments match a full fit."""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(rng.normal(5, 3, size=(1000, 3)), columns=["A", "B", "C"])
+        df.iloc[::7, 1] = np.nan
+        
+        streamed = StandardNormalizer()
+        for start in range(0, len(df), 300):
+            streamed.partial_fit(df.iloc[start:start + 300])
+        full = StandardNormalizer().fit(df)
+        
+        np.testing.assert_array_almost_equal(streamed.mean_array_, full.mean_array_)
+        np.testing.assert_array_almost_equal(streamed.std_array_, full.std_array_)
+    
+    def test_fit_resets_stream(self):
+        """Test that fit() discards statistics accumulated by partial_fit()."""
+        normalizer = StandardNormalizer().partial_fit(pd.DataFrame({"A": [100.0, 200.0]}))
+        normalizer.fit(pd.DataFrame({"A": [1.0, 3.0]}))
+        normalizer.partial_fit(pd.DataFrame({"A": [5.0, 7.0]}))
+        
+        assert normalizer.mean_ == {"A": 6.0}
+
+
+@pytest.mark.parametrize("normalizer_class", [MinMaxNormalizer, StandardNormalizer])
+def test_transform_in_place_matches_copy(normalizer_class):
+    """Test that copy=False writes the same values into the given DataFrame."""
+    df = pd.DataFrame({
+        "A": [1.0, 2.0, np.nan, 4.0],
+        "B": [10, 20, 30, 40],
+        "C": ["a", "b", "c", "d"]
+    })
+    normalizer = normalizer_class().fit(df)
+    expected = normalizer.transform(df)
+    
+    result = normalizer.transform(df, copy=False)
+    
+    assert result is df
+    pd.testing.assert_frame_equal(df, expected)
+
+
+@pytest.mark.parametrize("normalizer_class", [MinMaxNormalizer, StandardNormalizer])
+def test_parallel_fit_matches_serial(normalizer_class):
+    """Test that fitting across processes gives the same transform."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.standard_normal((200, 5)), columns=list("ABCDE"))
+    df["label"] = "x"
+    df.iloc[::4, 1] = np.nan
+    
+    serial = normalizer_class().fit_transform(df)
+    parallel = normalizer_class(n_jobs=2).fit_transform(df)
+    
+    pd.testing.assert_frame_equal(parallel, serial)
+
+
+@pytest.mark.parametrize("normalizer_class", [MinMaxNormalizer, StandardNormalizer])
+def test_group_by_matches_per_group_fit(normalizer_class):
+    """Test that group_by scales each group as if it were fit on its own."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.standard_normal((300, 3)), columns=list("ABC"))
+    df["segment"] = rng.choice(["a", "b", "c"], size=len(df))
+    df.iloc[::7, 1] = np.nan
+    
+    result = normalizer_class(group_by="segment").fit_transform(df)
+    
+    for _, group in df.groupby("segment"):
+        expected = normalizer_class().fit_transform(group[list("ABC")])
+        pd.testing.assert_frame_equal(result.loc[group.index, list("ABC")], expected)
+    assert result["segment"].tolist() == df["segment"].tolist()
+
+
+@pytest.mark.parametrize("normalizer_class", [MinMaxNormalizer, StandardNormalizer])
+def test_group_by_unseen_group_uses_global_statistics(normalizer_class):
+    """Test that groups not seen during fit are scaled with the global statistics."""
+    df = pd.DataFrame({"segment": ["a", "a", "b", "b"], "A": [1.0, 2.0, 5.0, 9.0]})
+    grouped = normalizer_class(group_by="segment").fit(df)
+    ungrouped = normalizer_class().fit(df[["A"]])
+    new = pd.DataFrame({"segment": ["z", "z"], "A": [3.0, 4.0]})
+    
+    result = grouped.transform(new)
+    
+    pd.testing.assert_series_equal(result["A"], ungrouped.transform(new[["A"]])["A"])
@@ -0,0 +1,106 @@
+"""
+Tests for the pipeline module.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from pandas_processors.create import create_sample_data
+from pandas_processors.impute import MeanMedianImputer, SimpleImputer
+from pandas_processors.normalize import MinMaxNormalizer, StandardNormalizer
+from pandas_processors.pipeline import Pipeline
+
+
+@pytest.fixture
+def sample_df():
+    """Numeric data with missing values, a constant column and a text column."""
+    df = create_sample_data(n_rows=500, n_cols=4, missing_rate=0.2)
+    df["constant"] = 3.0
+    df["label"] = "x"
+    return df
+
+
+def run_sequentially(steps, df):
+    """Apply each step on the output of the previous one."""
+    for step in steps:
+        df = step.fit_transform(df) if hasattr(step, "fit") else step.transform(df)
+    return df
+
+
+class TestPipeline:
+    """Test the Pipeline class."""
+    
+    @pytest.mark.parametrize("make_steps", [
+        lambda: [MeanMedianImputer(strategy="median"), StandardNormalizer()],
+        lambda: [MeanMedianImputer(), MinMaxNormalizer(feature_range=(-1, 1)), StandardNormalizer()],
+        lambda: [StandardNormalizer(), MinMaxNormalizer(), SimpleImputer(fill_value=-1)],
+        lambda: [MinMaxNormalizer(), MeanMedianImputer(strategy="median")],
+    ])
+    def test_matches_sequential_steps(self, sample_df, make_steps):
+        """Test that the fused pipeline matches running the steps one by one."""
+        expected = run_sequentially(make_steps(), sample_df)
+        
+        steps = make_steps()
+        pipeline = Pipeline([(f"step_{i}", step) for i, step in enumerate(steps)])
+        result = pipeline.fit_transform(sample_df)
+        
+        pd.testing.assert_frame_equal(result, expected)
+    
+    def test_steps_are_fitted(self, sample_df):
+        """Test that each step exposes the parameters it would learn on its own."""
+        imputer, normalizer = MeanMedianImputer(), StandardNormalizer()
+        Pipeline([("impute", imputer), ("scale", normalizer)]).fit(sample_df)
+        
+        imputed = MeanMedianImputer().fit_transform(sample_df)
+        expected = StandardNormalizer().fit(imputed)
+        
+        np.testing.assert_array_almost_equal(imputer.fill_array_, sample_df.iloc[:, :5].mean())
+        np.testing.assert_array_almost_equal(normalizer.std_array_, expected.std_array_)
+    
+    def test_partial_fit_matches_fit(self, sample_df):
+        """Test that fitting on chunks matches fitting on the whole frame."""
+        def make_pipeline():
+            return Pipeline([("impute", MeanMedianImputer()), ("scale", MinMaxNormalizer())])
+        
+        full = make_pipeline().fit(sample_df)
+        streamed = make_pipeline().fit_from_chunks(
+            sample_df.iloc[start:start + 100] for start in range(0, len(sample_df), 100)
+        )
+        
+        pd.testing.assert_frame_equal(streamed.transform(sample_df), full.transform(sample_df))
+    
+    def test_timings(self, sample_df):
+        """Test that timings are reported for every stage."""
+        pipeline = Pipeline([("impute", MeanMedianImputer()), ("scale", StandardNormalizer())])
+        pipeline.fit_transform(sample_df)
+        
+        timings = pipeline.report_timings()
+        assert list(timings) == ["statistics", "impute", "scale", "transform"]
+        assert all(value >= 0 for value in timings.values())
+    
+    def test_transform_in_place(self, sample_df):
+        """Test that copy=False writes into the given DataFrame."""
+        pipeline = Pipeline([("impute", MeanMedianImputer()), ("scale", StandardNormalizer())])
+        expected = pipeline.fit_transform(sample_df)
+        
+        result = pipeline.transform(sample_df, copy=False)
+        
+        assert result is sample_df
+        pd.testing.assert_frame_equal(sample_df, expected)
+    
+    def test_invalid_step(self):
+        """Test that unsupported steps raise TypeError."""
+        with pytest.raises(TypeError, match="Step 'bad' is not a supported processor"):
+            Pipeline([("bad", object())])
+    
+    def test_non_numeric_fill_value(self):
+        """Test that a SimpleImputer with a string fill value is rejected."""
+        with pytest.raises(ValueError, match="must have a numeric fill value"):
+            Pipeline([("impute", SimpleImputer(fill_value="missing"))])
+    
+    def test_transform_without_fit_raises_error(self):
+        """Test that transform without fit raises ValueError."""
+        pipeline = Pipeline([("scale", StandardNormalizer())])
+        
+        with pytest.raises(ValueError, match="Pipeline has not been fit yet"):
+            pipeline.transform(pd.DataFrame({"A": [1.0, 2.0]}))
@@ -0,0 +1,125 @@
+"""
+Tests for the serialize module.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from pandas_processors.impute import MeanMedianImputer
+from pandas_processors.normalize import MinMaxNormalizer, StandardNormalizer
+
+
+@pytest.fixture
+def df():
+    """DataFrame with missing values and a constant column."""
+    return pd.DataFrame({
+        "A": [1.0, 2.0, np.nan, 4.0],
+        "B": [5.0, np.nan, 7.0, 9.0],
+        "C": [3.0, 3.0, 3.0, 3.0],
+    })
+
+
+PROCESSORS = [
+    lambda: MeanMedianImputer(strategy="median"),
+    lambda: MinMaxNormalizer(feature_range=(-1, 1)),
+    lambda: StandardNormalizer(),
+]
+
+
+class TestSerialize:
+    """Test saving and loading fitted processors."""
+    
+    @pytest.mark.parametrize("make_processor", PROCESSORS)
+    def test_bytes_round_trip(self, df, make_processor):
+        """Test that from_bytes() restores a processor with the same output."""
+        processor = make_processor().fit(df)
+        restored = type(processor).from_bytes(processor.to_bytes())
+        
+        assert list(restored.columns_) == processor.columns_
+        pd.testing.assert_frame_equal(restored.transform(df), processor.transform(df))
+    
+    @pytest.mark.parametrize("mmap", [True, False])
+    @pytest.mark.parametrize("make_processor", PROCESSORS)
+    def test_file_round_trip(self, df, make_processor, mmap, tmp_path):
+        """Test that load() restores a processor saved with save()."""
+        processor = make_processor().fit(df)
+        path = processor.save(tmp_path / "processor.bin")
+        restored = type(processor).load(path, mmap=mmap)
+        
+        for name in processor._init_params:
+            assert getattr(restored, name) == getattr(processor, name)
+        pd.testing.assert_frame_equal(restored.transform(df), processor.transform(df))
+    
+    @pytest.mark.parametrize("make_processor", PROCESSORS)
+    def test_integer_column_labels(self, df, make_processor, tmp_path):
+        """Test that non-string column labels are restored unchanged."""
+        df = df.set_axis([0, 1, 2], axis=1)
+        processor = make_processor().fit(df)
+        restored = type(processor).load(processor.save(tmp_path / "processor.bin"))
+        
+        assert restored.columns_ == [0, 1, 2]
+        assert isinstance(restored.columns_, list)
+        pd.testing.assert_frame_equal(restored.transform(df), processor.transform(df))
+    
+    def test_mixed_column_labels(self, df):
+        """Test that labels of different types, including non-ASCII text, round-trip."""
+        labels = ["température", np.int64(7), 2.5]
+        df = df.set_axis(labels, axis=1)
+        processor = StandardNormalizer().fit(df)
+        restored = StandardNormalizer.from_bytes(processor.to_bytes())
+        
+        assert restored.columns_ == ["température", 7, 2.5]
+        assert [type(label) for label in restored.columns_] == [str, int, float]
+        pd.testing.assert_frame_equal(restored.transform(df), processor.transform(df))
+    
+    def test_unsupported_column_labels(self, df):
+        """Test that labels other than strings and numbers raise ValueError."""
+        df = df.set_axis([("A", 1), ("B", 1), ("C", 1)], axis=1)
+        
+        with pytest.raises(ValueError, match="Column labels"):
+            MinMaxNormalizer().fit(df).to_bytes()
+    
+    def test_mmap_arrays(self, df, tmp_path):
+        """Test that loaded arrays are read-only memory maps of the file."""
+        path = StandardNormalizer().fit(df).save(tmp_path / "scaler.bin")
+        restored = StandardNormalizer.load(path)
+        
+        assert isinstance(restored.mean_array_, np.memmap)
+        assert not restored.mean_array_.flags.writeable
+        assert restored.mean_ == pytest.approx({"A": 7 / 3, "B": 7.0, "C": 3.0})
+    
+    def test_arrays_are_aligned(self, df):
+        """Test that every array in the file starts on a 64-byte boundary."""
+        data = MinMaxNormalizer().fit(df).to_bytes()
+        restored = MinMaxNormalizer.from_bytes(data)
+        
+        for array in (restored.data_min_array_, restored.data_max_array_):
+            offset = array.__array_interface__["data"][0] - np.frombuffer(data, np.uint8).ctypes.data
+            assert offset % 64 == 0
+    
+    def test_loaded_processor_can_be_refit(self, df):
+        """Test that a loaded processor can start a new stream."""
+        restored = StandardNormalizer.from_bytes(StandardNormalizer().fit(df).to_bytes())
+        restored.partial_fit(df[["A"]])
+        
+        assert restored.columns_ == ["A"]
+    
+    def test_unfit_processor(self):
+        """Test that serializing an unfit processor raises ValueError."""
+        with pytest.raises(ValueError, match="has not been fit yet"):
+            MinMaxNormalizer().to_bytes()
+    
+    def test_wrong_class(self, df):
+        """Test that loading into a different class raises ValueError."""
+        data = MinMaxNormalizer().fit(df).to_bytes()
+        
+        with pytest.raises(ValueError, match="not a StandardNormalizer"):
+            StandardNormalizer.from_bytes(data)
+    
+    def test_not_a_processor_file(self, tmp_path):
+        """Test that loading an unrelated file raises ValueError."""
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a processor file")
+        
+        with pytest.raises(ValueError, match="Not a serialized"):
+            MinMaxNormalizer.load(path)
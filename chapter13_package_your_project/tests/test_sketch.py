@@ -0,0 +1,53 @@
+"""
+Tests for the sketch module.
+"""
+
+import pytest
+import numpy as np
+from pandas_processors.sketch import QuantileSketch
+
+
+class TestQuantileSketch:
+    """Test the QuantileSketch class."""
+    
+    def test_invalid_error(self):
+        """Test that an error outside (0, 1) raises ValueError."""
+        with pytest.raises(ValueError, match="error must be between 0 and 1"):
+            QuantileSketch(error=0)
+    
+    def test_empty_sketch(self):
+        """Test that an empty sketch returns NaN."""
+        assert np.isnan(QuantileSketch().median())
+    
+    def test_small_input_is_exact(self):
+        """Test that the median is exact before any compaction."""
+        sketch = QuantileSketch().update(np.array([1, 2, np.nan, 4, 5]))
+        
+        assert sketch.count == 4
+        assert sketch.median() == 3.0
+    
+    def test_median_within_error_bound(self):
+        """Test that the median of a large stream is within the rank error."""
+        rng = np.random.default_rng(0)
+        values = rng.standard_normal(200_000)
+        
+        sketch = QuantileSketch(error=0.01)
+        for chunk in np.array_split(values, 20):
+            sketch.update(chunk)
+        
+        rank = (values < sketch.median()).mean()
+        assert abs(rank - 0.5) < 0.01
+        # Memory stays bounded far below the number of values added
+        assert sum(len(level) for level in sketch._levels) < 5 * sketch.k
+    
+    def test_merge(self):
+        """Test that merged sketches approximate the combined stream."""
+        rng = np.random.default_rng(1)
+        values = rng.uniform(0, 100, size=100_000)
+        
+        left = QuantileSketch(error=0.01).update(values[:50_000])
+        right = QuantileSketch(error=0.01, seed=1).update(values[50_000:])
+        left.merge(right)
+        
+        assert left.count == 100_000
+        assert abs((values < left.median()).mean() - 0.5) < 0.01
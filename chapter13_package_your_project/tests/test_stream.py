@@ -0,0 +1,47 @@
+"""
+Tests for the stream module.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from pandas_processors.stream import iter_chunks
+
+
+@pytest.fixture
+def sample_df():
+    """DataFrame with 10 rows and a missing value."""
+    return pd.DataFrame({
+        "A": np.arange(10, dtype=float),
+        "B": [1.0, np.nan] + [2.0] * 8,
+    })
+
+
+class TestIterChunks:
+    """Test the iter_chunks function."""
+    
+    def test_iter_csv_chunks(self, sample_df, tmp_path):
+        """Test reading a CSV file in chunks."""
+        path = tmp_path / "data.csv"
+        sample_df.to_csv(path, index=False)
+        
+        chunks = list(iter_chunks(path, chunksize=4))
+        
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), sample_df)
+    
+    def test_iter_parquet_chunks(self, sample_df, tmp_path):
+        """Test reading a Parquet file in chunks."""
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "data.parquet"
+        sample_df.to_parquet(path, index=False)
+        
+        chunks = list(iter_chunks(path, chunksize=4, columns=["A"]))
+        
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert list(chunks[0].columns) == ["A"]
+    
+    def test_unsupported_extension(self, tmp_path):
+        """Test that unsupported file types raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported file type"):
+            list(iter_chunks(tmp_path / "data.json"))
@@ -0,0 +1,82 @@
+"""Benchmark online scoring latency and throughput at varying concurrency.
+
+Each client sends single-row requests one after another. "per-request"
+scores every request on its own through ModelPredictor.predict_proba with a
+one-row DataFrame; "batched" sends them through a BatchScorer.
+
+Usage (from 06_project_structure):
+    uv run python benchmarks/bench_batch_scoring.py
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.datasets import make_classification
+
+from data_pipeline.models import BatchScorer, ModelPredictor, ModelTrainer
+
+N_REQUESTS = 2_000
+CONCURRENCY = [1, 8, 32, 128]
+MAX_BATCH_SIZE = 64
+MAX_WAIT_MS = 2.0
+
+
+def make_predictor():
+    """Train the default model on synthetic data, returning it and rows to score."""
+    X, y = make_classification(5_000, 10, random_state=42)
+    X = pd.DataFrame(X, columns=[f"feature_{i}" for i in range(X.shape[1])])
+    trainer = ModelTrainer()
+    trainer.train(X, pd.Series(y))
+    return ModelPredictor(trainer), X.to_numpy()
+
+
+async def run_clients(score, rows, concurrency):
+    """Score all rows with concurrent clients, returning latencies and total time."""
+    latencies = []
+    next_row = iter(rows)
+
+    async def client():
+        for row in next_row:
+            start = time.perf_counter()
+            await score(row)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return np.array(latencies), time.perf_counter() - start
+
+
+async def bench(predictor, rows, concurrency):
+    """Return the latencies and total time of both scoring paths."""
+    columns = predictor.feature_names
+
+    async def score_per_request(row):
+        return predictor.predict_proba(pd.DataFrame([row], columns=columns))
+
+    per_request = await run_clients(score_per_request, rows, concurrency)
+    async with BatchScorer(predictor, MAX_BATCH_SIZE, MAX_WAIT_MS) as scorer:
+        batched = await run_clients(scorer.predict_proba, rows, concurrency)
+    return {"per-request": per_request, "batched": batched}
+
+
+def main():
+    """Print latency percentiles and throughput for each concurrency level."""
+    predictor, X = make_predictor()
+    rows = X[:N_REQUESTS]
+
+    print(f"\n{N_REQUESTS} requests, max_batch_size={MAX_BATCH_SIZE}, "
+          f"max_wait_ms={MAX_WAIT_MS}")
+    print(f"{'clients':>8} {'path':<12} {'p50 (ms)':>9} {'p99 (ms)':>9} "
+          f"{'requests/s':>11}")
+    for concurrency in CONCURRENCY:
+        results = asyncio.run(bench(predictor, rows, concurrency))
+        for path, (latencies, total) in results.items():
+            p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+            print(f"{concurrency:>8} {path:<12} {p50:>9.2f} {p99:>9.2f} "
+                  f"{len(latencies) / total:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
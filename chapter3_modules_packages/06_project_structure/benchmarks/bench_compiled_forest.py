@@ -0,0 +1,56 @@
+"""Benchmark the compiled forest against scikit-learn's predict_proba.
+
+Prints the scoring time of both at several batch sizes, and the size of the
+pickled model next to the size of the compiled node arrays.
+
+Usage (from 06_project_structure):
+    uv run python benchmarks/bench_compiled_forest.py
+"""
+
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.datasets import make_classification
+
+from data_pipeline.models import ModelTrainer
+
+BATCH_SIZES = [1, 10, 100, 1_000, 10_000]
+REPEATS = 20
+
+
+def best_time(func, X):
+    """Return the fastest of REPEATS runs of func(X), in milliseconds."""
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(X)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    """Train the default model and compare both inference paths."""
+    X, y = make_classification(20_000, 10, random_state=42)
+    X = pd.DataFrame(X, columns=[f"feature_{i}" for i in range(X.shape[1])])
+    trainer = ModelTrainer()
+    trainer.train(X[:10_000], pd.Series(y[:10_000]))
+    compiled = trainer.compile()
+    rows = X[10_000:].to_numpy()
+
+    assert np.array_equal(
+        compiled.predict_proba(rows), trainer.model.predict_proba(X[10_000:])
+    )
+    print(f"\npickled model: {len(pickle.dumps(trainer.model)) / 1024**2:.1f} MB, "
+          f"compiled arrays: {compiled.nbytes / 1024**2:.1f} MB")
+    print(f"{'rows':>7} {'sklearn (ms)':>13} {'compiled (ms)':>14}")
+    for n_rows in BATCH_SIZES:
+        batch = X[10_000:10_000 + n_rows]
+        sklearn_time = best_time(trainer.model.predict_proba, batch)
+        compiled_time = best_time(compiled.predict_proba, rows[:n_rows])
+        print(f"{n_rows:>7} {sklearn_time:>13.2f} {compiled_time:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark writing and reading back results as text, .npy and Parquet.
+
+Usage (from 06_project_structure):
+    uv run python benchmarks/bench_result_writers.py
+"""
+
+import ast
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_pipeline.utils.results import load_results, write_npy, write_parquet
+
+N_VALUES = 5_000_000
+CHUNK_SIZE = 100_000
+
+
+def timed(func):
+    """Return the time func() takes, in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def write_text(values, path):
+    """Previous save_results: the list as text."""
+    with open(path, "w") as f:
+        f.write(str(values.tolist()))
+
+
+def read_text(path):
+    """Parse a list written as text."""
+    with open(path) as f:
+        return ast.literal_eval(f.read())
+
+
+def chunked(values):
+    """Yield values in chunks of CHUNK_SIZE, as a scoring loop would."""
+    for start in range(0, len(values), CHUNK_SIZE):
+        yield values[start:start + CHUNK_SIZE]
+
+
+def main():
+    """Print the write time, read time and file size of each format."""
+    values = np.random.default_rng(42).random(N_VALUES)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        formats = {
+            "text": (
+                temp_dir / "results.txt",
+                lambda path: write_text(values, path),
+                read_text,
+            ),
+            "npy": (
+                temp_dir / "results.npy",
+                lambda path: write_npy(values, path),
+                lambda path: load_results(path).sum(),
+            ),
+            "npy (streamed)": (
+                temp_dir / "streamed.npy",
+                lambda path: write_npy(chunked(values), path),
+                lambda path: load_results(path).sum(),
+            ),
+            "parquet": (
+                temp_dir / "results.parquet",
+                lambda path: write_parquet(pd.DataFrame({"value": values}), path),
+                load_results,
+            ),
+        }
+
+        print(f"{N_VALUES} float64 values")
+        print(f"{'format':<16} {'write (s)':>10} {'read (s)':>9} {'size (MB)':>10}")
+        for name, (path, write, read) in formats.items():
+            write_time = timed(lambda: write(path))
+            read_time = timed(lambda: read(path))
+            size = path.stat().st_size / 1024**2
+            print(f"{name:<16} {write_time:>10.2f} {read_time:>9.2f} {size:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,11 +14,11 @@ def main():
 	
 	# 2. Process data
 	print("Processing data...")
-	processed_data = process_data(data)
+	processed_data = process_data(data[["feature1", "feature2"]])
 	
 	# 3. Save results
 	print("Saving results...")
-	save_results(processed_data, "output.txt")
+	save_results(processed_data.tolist(), "output.txt")
 	
 	print("Pipeline completed!")
 
@@ -15,6 +15,12 @@ MODEL_CONFIG = {
     "random_state": 42,
     "test_size": 0.2,
     "n_estimators": 100,
+    "n_jobs": -1,  # Train and predict on all cores
+    # Incremental training: trees added per step, and when to stop adding them
+    "tree_batch_size": 25,
+    "max_estimators": 500,
+    "oob_tolerance": 0.001,
+    "oob_patience": 2,
 }
 
 # File paths
@@ -1,6 +1,6 @@
 """Data processing subpackage."""
 
-from .loader import load_data
-from .processor import process_data
+from .loader import iter_chunks, load_data, save_data
+from .processor import process_chunks, process_data
 
-__all__ = ["load_data", "process_data"]
+__all__ = ["load_data", "save_data", "iter_chunks", "process_data", "process_chunks"]
@@ -1,15 +1,121 @@
 """Data loading functions."""
 
+from pathlib import Path
+from typing import Iterator, Mapping, Optional, Sequence
 
-def load_data(filename: str) -> list:
-	"""Load simple data for demonstration.
+import pandas as pd
+
+from ..config import RAW_DATA_DIR
+
+SUFFIXES = {".csv": "csv", ".parquet": "parquet", ".pq": "parquet"}
+
+
+def file_format(path: Path) -> str:
+	"""Get the format of a data file from its suffix.
+	
+	Args:
+		path: Path of the data file
+		
+	Returns:
+		Either "csv" or "parquet"
+	"""
+	try:
+		return SUFFIXES[path.suffix.lower()]
+	except KeyError:
+		raise ValueError(
+			f"Unsupported file type {path.suffix!r}, expected one of {list(SUFFIXES)}"
+		) from None
+
+
+def create_sample_data() -> pd.DataFrame:
+	"""Create a small sample dataset for demonstration.
+	
+	Returns:
+		DataFrame with two features, one with a missing value, and a target
+	"""
+	return pd.DataFrame({
+		"feature1": [1.0, 2.0, 3.0, 4.0, 5.0],
+		"feature2": [7.0, None, 9.0, 10.0, 11.0],
+		"target": [0, 1, 0, 1, 1],
+	})
+
+
+def load_data(filename: str, directory: Path = RAW_DATA_DIR) -> pd.DataFrame:
+	"""Load a CSV or Parquet file from the raw data directory.
+	
+	Sample data is created and saved there first if the file doesn't exist.
 	
 	Args:
-		filename: Name of the file (ignored for simplicity)
+		filename: Name of the file to load
+		directory: Directory containing the file
 		
 	Returns:
-		List of sample data
+		DataFrame containing the loaded data
 	"""
-	data = [1, 2, 3, 4, 5, None, 7, 8, 9, 10]
-	print(f"Loaded data from {filename}")
+	path = Path(directory) / filename
+	if not path.exists():
+		print(f"{path} not found, creating sample data")
+		save_data(create_sample_data(), filename, directory)
+
+	data = pd.concat(iter_chunks(filename, directory=directory), ignore_index=True)
+	print(f"Loaded {len(data)} rows from {path}")
 	return data
+
+
+def iter_chunks(
+	filename: str,
+	chunk_size: int = 100_000,
+	columns: Optional[Sequence[str]] = None,
+	dtypes: Optional[Mapping[str, str]] = None,
+	directory: Path = RAW_DATA_DIR,
+) -> Iterator[pd.DataFrame]:
+	"""Read a CSV or Parquet file lazily, one chunk of rows at a time.
+	
+	Only one chunk is held in memory at a time. Passing dtypes gives every
+	chunk the same column types, which pandas can otherwise infer
+	differently from chunk to chunk.
+	
+	Args:
+		filename: Name of the file to read
+		chunk_size: Maximum number of rows per chunk
+		columns: Columns to read, all columns if None
+		dtypes: Type of each column, for example {"feature1": "float64"}
+		directory: Directory containing the file
+		
+	Yields:
+		DataFrames of at most chunk_size rows
+	"""
+	path = Path(directory) / filename
+	if file_format(path) == "csv":
+		with pd.read_csv(
+			path, chunksize=chunk_size, usecols=columns, dtype=dtypes
+		) as reader:
+			yield from reader
+		return
+
+	import pyarrow.parquet as pq
+
+	parquet_file = pq.ParquetFile(path)
+	try:
+		for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+			chunk = batch.to_pandas()
+			yield chunk.astype(dtypes) if dtypes else chunk
+	finally:
+		parquet_file.close()
+
+
+def save_data(data: pd.DataFrame, filename: str, directory: Path) -> None:
+	"""Save data to a CSV or Parquet file, depending on the file's suffix.
+	
+	Args:
+		data: DataFrame to save
+		filename: Name of the file
+		directory: Directory to save the file in
+	"""
+	path = Path(directory) / filename
+	path.parent.mkdir(parents=True, exist_ok=True)
+	if file_format(path) == "csv":
+		data.to_csv(path, index=False)
+	else:
+		data.to_parquet(path, index=False)
+	print(f"Saved {len(data)} rows to {path}")
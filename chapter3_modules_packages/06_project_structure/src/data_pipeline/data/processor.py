@@ -1,20 +1,59 @@
 """Data processing functions."""
 
+from typing import Iterable, Iterator, Union
 
-def process_data(data: list) -> list:
-	"""Process data by removing None values and multiplying by 2.
+import numpy as np
+import pandas as pd
+
+ArrayLike = Union[np.ndarray, pd.DataFrame, pd.Series, list]
+
+
+def process_data(data: ArrayLike, factor: float = 2.0) -> np.ndarray:
+	"""Process data by removing missing values and multiplying by a factor.
+	
+	Works on the whole array at once. For 2D data, rows with any missing
+	value are removed.
 	
 	Args:
-		data: List of data to process
+		data: Values to process, as a list, array, Series or DataFrame
+		factor: Number to multiply the values by
 		
 	Returns:
-		Processed data list
+		Processed data as a float array
 	"""
-	# Remove None values
-	cleaned = [x for x in data if x is not None]
-	
-	# Transform data
-	processed = [x * 2 for x in cleaned]
-	
+	processed = _drop_missing_and_scale(data, factor)
 	print(f"Processed {len(processed)} data points")
 	return processed
+
+
+def process_chunks(
+	chunks: Iterable[ArrayLike], factor: float = 2.0
+) -> Iterator[np.ndarray]:
+	"""Process data one chunk at a time, for data too large to hold in memory.
+	
+	Args:
+		chunks: Chunks of values, for example from loader.iter_chunks
+		factor: Number to multiply the values by
+		
+	Yields:
+		Each chunk processed with process_data
+	"""
+	n_rows = 0
+	for chunk in chunks:
+		processed = _drop_missing_and_scale(chunk, factor)
+		n_rows += len(processed)
+		yield processed
+	print(f"Processed {n_rows} data points")
+
+
+def _drop_missing_and_scale(data: ArrayLike, factor: float) -> np.ndarray:
+	"""Remove missing values, or rows containing them, and multiply the rest."""
+	values = np.asarray(data, dtype=np.float64)
+	missing = np.isnan(values)
+	if values.ndim > 1:
+		missing = missing.any(axis=tuple(range(1, values.ndim)))
+
+	# Boolean indexing copies, so the input is left unchanged
+	processed = values[~missing]
+	processed *= factor
+	return processed
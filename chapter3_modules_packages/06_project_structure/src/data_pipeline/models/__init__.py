@@ -1,6 +1,8 @@
 """Machine learning models subpackage."""
 
+from .batching import BatchScorer
+from .compiled import CompiledForest
 from .predictor import ModelPredictor
 from .trainer import ModelTrainer
 
-__all__ = ["ModelTrainer", "ModelPredictor"]
+__all__ = ["ModelTrainer", "ModelPredictor", "BatchScorer", "CompiledForest"]
@@ -0,0 +1,161 @@
+"""Micro-batched scoring of single-row requests."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .predictor import ModelPredictor
+
+Row = Union[Mapping[str, float], Sequence[float], np.ndarray]
+
+
+class BatchScorer:
+    """Scores concurrent single-row requests in batches.
+    
+    Requests wait in a queue until max_batch_size rows have arrived or the
+    oldest request has waited max_wait_ms. The batch is then scored with one
+    call to the model on a NumPy array, and each request gets its own row of
+    the result.
+    
+    Use it as an async context manager, or call start() and stop():
+    
+        async with BatchScorer(predictor) as scorer:
+            probabilities = await scorer.predict_proba(row)
+    """
+
+    def __init__(
+        self,
+        predictor: ModelPredictor,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must not be negative")
+        self.predictor = predictor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.n_features = predictor.model.n_features_in_
+        self.classes = predictor.model.classes_
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def __aenter__(self) -> "BatchScorer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        """Start the background task that collects and scores batches."""
+        if self._worker is not None:
+            raise RuntimeError("BatchScorer is already running")
+        self._queue = asyncio.Queue()
+        # Scoring runs in one thread, so the next batch fills up meanwhile
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._worker = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """Score the requests already queued, then stop the background task."""
+        if self._worker is None:
+            return
+        # New requests are refused from here on, queued ones are still scored
+        worker, self._worker = self._worker, None
+        await self._queue.put(None)
+        await worker
+        self._executor.shutdown()
+        self._queue = self._executor = None
+
+    async def predict_proba(self, row: Row) -> np.ndarray:
+        """Get the prediction probabilities of one row.
+        
+        Args:
+            row: Feature values, either a mapping from feature name to value
+                or a sequence in the order of the predictor's feature_names
+        
+        Returns:
+            Array with the probability of each class
+        """
+        if self._worker is None:
+            raise RuntimeError("BatchScorer must be running to score requests")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((self._to_array(row), future))
+        return await future
+
+    async def predict(self, row: Row):
+        """Predict the class of one row.
+        
+        Args:
+            row: Feature values, as for predict_proba
+        
+        Returns:
+            The most probable class
+        """
+        probabilities = await self.predict_proba(row)
+        return self.classes[probabilities.argmax()]
+
+    def _to_array(self, row: Row) -> np.ndarray:
+        """Convert a request to a float array in the model's feature order."""
+        if isinstance(row, Mapping):
+            row = [row[name] for name in self.predictor.feature_names]
+        values = np.asarray(row, dtype=np.float64)
+        if values.shape != (self.n_features,):
+            raise ValueError(
+                f"Expected {self.n_features} feature values, got shape {values.shape}"
+            )
+        return values
+
+    async def _collect(self) -> Tuple[List[Tuple[np.ndarray, asyncio.Future]], bool]:
+        """Wait for a batch of requests, returning it and whether to stop after it."""
+        loop = asyncio.get_running_loop()
+        item = await self._queue.get()
+        if item is None:
+            return [], True
+
+        batch = [item]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if self._queue.empty():
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                item = self._queue.get_nowait()
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    async def _run(self) -> None:
+        """Collect batches, score each with one model call and resolve the requests."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            batch, stopping = await self._collect()
+            if not batch:
+                continue
+
+            rows, futures = zip(*batch)
+            try:
+                probabilities = await loop.run_in_executor(
+                    self._executor, self.predictor.predict_proba_array, np.stack(rows)
+                )
+            except Exception as error:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+
+            for future, row_probabilities in zip(futures, probabilities):
+                # A caller may have been cancelled while the batch was scored
+                if not future.done():
+                    future.set_result(row_probabilities)
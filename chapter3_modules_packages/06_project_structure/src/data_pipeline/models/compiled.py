@@ -0,0 +1,197 @@
+"""Random forest inference on flat node arrays."""
+
+from pathlib import Path
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+
+
+class CompiledForest:
+    """A fitted RandomForestClassifier flattened into contiguous node arrays.
+    
+    All trees share one set of arrays. For an internal node, left and right
+    hold the positions of its children. For a leaf, left holds -1 - i, where
+    i is the leaf's row in leaf_values, so class probabilities are only
+    stored for leaves. Rows are routed through all trees at once, one level
+    at a time, which avoids scikit-learn's per-tree overhead and gives the
+    same probabilities.
+    """
+
+    ARRAYS = (
+        "roots", "left", "right", "feature", "threshold",
+        "missing_left", "leaf_values", "classes",
+    )
+
+    def __init__(
+        self,
+        roots: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        missing_left: np.ndarray,
+        leaf_values: np.ndarray,
+        classes: np.ndarray,
+        feature_names: List[str],
+    ):
+        self.roots = roots
+        self.left = left
+        self.right = right
+        self.feature = feature
+        self.threshold = threshold
+        self.missing_left = missing_left
+        self.leaf_values = leaf_values
+        self.classes = classes
+        self.feature_names = list(feature_names)
+
+    @classmethod
+    def from_forest(cls, model: RandomForestClassifier) -> "CompiledForest":
+        """Flatten the trees of a fitted RandomForestClassifier.
+        
+        Args:
+            model: Fitted single-output forest classifier
+        
+        Returns:
+            CompiledForest giving the same predictions as model
+        """
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        n_classes = len(model.classes_)
+        roots = np.cumsum([0] + [tree.node_count for tree in trees[:-1]])
+
+        left, right, feature, threshold, missing_left, leaf_values = (
+            [], [], [], [], [], []
+        )
+        n_leaves = 0
+        for tree, root in zip(trees, roots):
+            is_leaf = tree.children_left < 0
+            leaf_index = n_leaves + np.cumsum(is_leaf) - 1
+            left.append(np.where(is_leaf, -1 - leaf_index, tree.children_left + root))
+            right.append(np.where(is_leaf, -1, tree.children_right + root))
+            feature.append(np.where(is_leaf, 0, tree.feature))
+            threshold.append(tree.threshold)
+            # Trees fitted before scikit-learn 1.3 send missing values right
+            missing_left.append(
+                getattr(tree, "missing_go_to_left", np.zeros(tree.node_count))
+            )
+
+            # Leaf probabilities as DecisionTreeClassifier.predict_proba gives them
+            values = tree.value[is_leaf, 0, :n_classes]
+            totals = values.sum(axis=1, keepdims=True)
+            totals[totals == 0] = 1
+            leaf_values.append(values / totals)
+            n_leaves += len(values)
+
+        # String labels are stored as text, so saved arrays load without pickle
+        classes = np.asarray(model.classes_)
+        if classes.dtype == object:
+            classes = classes.astype(str)
+
+        return cls(
+            roots=roots.astype(np.int32),
+            left=np.concatenate(left).astype(np.int32),
+            right=np.concatenate(right).astype(np.int32),
+            feature=np.concatenate(feature).astype(np.int32),
+            threshold=np.concatenate(threshold).astype(np.float64),
+            missing_left=np.concatenate(missing_left).astype(bool),
+            leaf_values=np.concatenate(leaf_values),
+            classes=classes,
+            feature_names=getattr(model, "feature_names_in_", []),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the node arrays in bytes."""
+        return sum(getattr(self, name).nbytes for name in self.ARRAYS)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the arrays and feature names to an uncompressed .npz file.
+        
+        Args:
+            path: File to write
+        """
+        arrays = {name: getattr(self, name) for name in self.ARRAYS}
+        np.savez(path, feature_names=np.array(self.feature_names, dtype=str), **arrays)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "CompiledForest":
+        """Load a forest saved with save().
+        
+        Args:
+            path: File written by save()
+        
+        Returns:
+            The loaded CompiledForest
+        """
+        with np.load(path, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in cls.ARRAYS}
+            return cls(**arrays, feature_names=data["feature_names"].tolist())
+
+    def predict_proba(
+        self, X: Union[pd.DataFrame, np.ndarray], batch_size: int = 10_000
+    ) -> np.ndarray:
+        """Average the class probabilities of the leaves each row reaches.
+        
+        Args:
+            X: Features, as a DataFrame with the training columns or a 2D
+                array with columns in the order of feature_names
+            batch_size: Number of rows routed through the trees at a time
+        
+        Returns:
+            Array of class probabilities, one row per row of X
+        """
+        X = self._to_array(X)
+        n_trees = len(self.roots)
+        proba = np.empty((len(X), len(self.classes)))
+        has_missing = bool(np.isnan(X).any())
+
+        for start in range(0, len(X), batch_size):
+            rows = X[start:start + batch_size]
+            flat_rows = rows.ravel()
+            # One entry per (tree, row) pair, in tree order
+            nodes = np.repeat(self.roots, len(rows))
+            offsets = np.tile(np.arange(len(rows)) * rows.shape[1], n_trees)
+            active = np.arange(len(nodes))
+            while len(active) > 0:
+                node = nodes[active]
+                left = self.left[node]
+                internal = left >= 0
+                active, node, left = active[internal], node[internal], left[internal]
+
+                values = flat_rows[offsets[active] + self.feature[node]]
+                go_left = values <= self.threshold[node]
+                if has_missing:
+                    go_left |= np.isnan(values) & self.missing_left[node]
+                nodes[active] = np.where(go_left, left, self.right[node])
+
+            # Summed tree by tree, in the same order as scikit-learn
+            leaves = -1 - self.left[nodes]
+            leaf_values = self.leaf_values[leaves].reshape(n_trees, len(rows), -1)
+            proba[start:start + len(rows)] = leaf_values.sum(axis=0) / n_trees
+
+        return proba
+
+    def predict(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """Predict the most probable class of each row.
+        
+        Args:
+            X: Features, as for predict_proba
+        
+        Returns:
+            Array of predicted classes
+        """
+        return self.classes[self.predict_proba(X).argmax(axis=1)]
+
+    def _to_array(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """Convert features to float32, which the trees' thresholds were fitted on."""
+        if isinstance(X, pd.DataFrame) and self.feature_names:
+            X = X[self.feature_names]
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim != 2:
+            raise ValueError(f"Expected a 2D array of features, got shape {X.shape}")
+        if self.feature_names and X.shape[1] != len(self.feature_names):
+            raise ValueError(
+                f"Expected {len(self.feature_names)} features, got {X.shape[1]}"
+            )
+        return X
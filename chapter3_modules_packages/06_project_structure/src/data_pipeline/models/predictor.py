@@ -1,17 +1,29 @@
 """Model prediction functionality."""
 
+import warnings
+
+import numpy as np
 import pandas as pd
 
 from .trainer import ModelTrainer
 
 
 class ModelPredictor:
-    """Handles model predictions."""
+    """Handles model predictions.
+    
+    Batches of up to compiled_max_rows rows are scored with the compiled
+    forest, which has much less overhead per call than scikit-learn but is
+    slower on large batches. Both give the same predictions. Set
+    compiled_max_rows to 0 to always use the scikit-learn model.
+    """
 
-    def __init__(self, trained_model: ModelTrainer):
+    def __init__(self, trained_model: ModelTrainer, compiled_max_rows: int = 128):
         if not trained_model.is_trained:
             raise ValueError("Model must be trained before creating predictor")
         self.model = trained_model.model
+        self.feature_names = list(getattr(self.model, "feature_names_in_", []))
+        self.compiled_max_rows = compiled_max_rows
+        self.compiled = trained_model.compile() if compiled_max_rows > 0 else None
 
     def predict(self, X: pd.DataFrame) -> pd.Series:
         """Make predictions on new data.
@@ -22,7 +34,8 @@ class ModelPredictor:
         Returns:
             Predictions as a pandas Series
         """
-        predictions = self.model.predict(X)
+        probabilities = self._predict_proba(X)
+        predictions = self.model.classes_[probabilities.argmax(axis=1)]
         return pd.Series(predictions, index=X.index)
 
     def predict_proba(self, X: pd.DataFrame) -> pd.DataFrame:
@@ -34,9 +47,39 @@ class ModelPredictor:
         Returns:
             DataFrame with prediction probabilities
         """
-        probabilities = self.model.predict_proba(X)
+        probabilities = self._predict_proba(X)
         return pd.DataFrame(
             probabilities,
             index=X.index,
             columns=[f"class_{i}" for i in range(probabilities.shape[1])]
         )
+
+    def predict_proba_array(self, X: np.ndarray) -> np.ndarray:
+        """Get prediction probabilities for a plain array of features.
+        
+        Skips building pandas objects, for scoring many small batches.
+        
+        Args:
+            X: 2D array with columns in the order of feature_names
+            
+        Returns:
+            Array of prediction probabilities, one row per row of X
+        """
+        if self._use_compiled(X):
+            return self.compiled.predict_proba(X)
+        with warnings.catch_warnings():
+            # Fitted on a DataFrame, but the columns are already in order
+            warnings.filterwarnings(
+                "ignore", message="X does not have valid feature names"
+            )
+            return self.model.predict_proba(X)
+
+    def _use_compiled(self, X) -> bool:
+        """Whether to score X with the compiled forest."""
+        return self.compiled is not None and len(X) <= self.compiled_max_rows
+
+    def _predict_proba(self, X: pd.DataFrame) -> np.ndarray:
+        """Get prediction probabilities from the faster model for this batch size."""
+        if self._use_compiled(X):
+            return self.compiled.predict_proba(X)
+        return self.model.predict_proba(X)
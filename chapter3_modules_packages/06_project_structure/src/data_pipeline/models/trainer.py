@@ -1,22 +1,34 @@
 """Model training functionality."""
 
+from typing import List
+
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score
 
 from ..config import MODEL_CONFIG
+from .compiled import CompiledForest
 
 
 class ModelTrainer:
     """Handles model training and evaluation."""
 
     def __init__(self):
-        self.model = RandomForestClassifier(
-            n_estimators=MODEL_CONFIG["n_estimators"],
-            random_state=MODEL_CONFIG["random_state"]
-        )
+        self.model = self._build_model()
         self.is_trained = False
 
+    @staticmethod
+    def _build_model(**params) -> RandomForestClassifier:
+        """Create a forest with the configured settings, overridden by params."""
+        return RandomForestClassifier(
+            **{
+                "n_estimators": MODEL_CONFIG["n_estimators"],
+                "random_state": MODEL_CONFIG["random_state"],
+                "n_jobs": MODEL_CONFIG["n_jobs"],
+                **params,
+            }
+        )
+
     def train(self, X_train: pd.DataFrame, y_train: pd.Series) -> None:
         """Train the model on training data.
         
@@ -28,6 +40,52 @@ class ModelTrainer:
         self.is_trained = True
         print(f"Model trained on {len(X_train)} samples")
 
+    def train_incremental(
+        self, X_train: pd.DataFrame, y_train: pd.Series
+    ) -> List[float]:
+        """Grow the forest in batches of trees until the OOB score stops improving.
+        
+        Each step adds MODEL_CONFIG["tree_batch_size"] trees to the trees
+        already fitted, then scores the forest on the out-of-bag samples.
+        Growing stops once the score has improved by less than
+        MODEL_CONFIG["oob_tolerance"] for MODEL_CONFIG["oob_patience"] steps
+        in a row, or the forest has MODEL_CONFIG["max_estimators"] trees.
+        
+        Args:
+            X_train: Training features
+            y_train: Training targets
+            
+        Returns:
+            OOB score after each step
+        """
+        batch_size = MODEL_CONFIG["tree_batch_size"]
+        self.model = self._build_model(
+            n_estimators=batch_size, warm_start=True, oob_score=True
+        )
+
+        scores = []
+        best_score, steps_without_improvement = float("-inf"), 0
+        while True:
+            self.model.fit(X_train, y_train)
+            scores.append(self.model.oob_score_)
+            if scores[-1] >= best_score + MODEL_CONFIG["oob_tolerance"]:
+                best_score, steps_without_improvement = scores[-1], 0
+            else:
+                steps_without_improvement += 1
+
+            n_trees = self.model.n_estimators
+            if (steps_without_improvement >= MODEL_CONFIG["oob_patience"]
+                    or n_trees + batch_size > MODEL_CONFIG["max_estimators"]):
+                break
+            self.model.set_params(n_estimators=n_trees + batch_size)
+
+        # Later calls to fit start a new forest instead of adding trees
+        self.model.set_params(warm_start=False)
+        self.is_trained = True
+        print(f"Model trained on {len(X_train)} samples with {n_trees} trees "
+              f"(OOB score {scores[-1]:.3f})")
+        return scores
+
     def evaluate(self, X_test: pd.DataFrame, y_test: pd.Series) -> float:
         """Evaluate the model on test data.
         
@@ -59,3 +117,14 @@ class ModelTrainer:
             self.model.feature_importances_,
             index=self.model.feature_names_in_
         )
+
+    def compile(self) -> CompiledForest:
+        """Export the trained forest as flat node arrays for fast inference.
+        
+        Returns:
+            CompiledForest giving the same predictions as the trained model
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before compiling")
+
+        return CompiledForest.from_forest(self.model)
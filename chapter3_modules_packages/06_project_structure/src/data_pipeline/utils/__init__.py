@@ -1,5 +1,6 @@
 """Utility functions subpackage."""
 
 from .helpers import save_results
+from .results import load_results, write_npy, write_parquet
 
-__all__ = ["save_results"]
+__all__ = ["save_results", "load_results", "write_npy", "write_parquet"]
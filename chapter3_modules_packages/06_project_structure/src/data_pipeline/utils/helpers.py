@@ -1,13 +1,28 @@
 """Helper utility functions."""
 
+from pathlib import Path
 
-def save_results(data: list, filename: str) -> None:
+from .results import write_npy, write_parquet
+
+
+def save_results(data, filename: str) -> None:
 	"""Save processed data to a file.
 	
+	Files ending in .npy or .parquet are written in binary with
+	results.write_npy or results.write_parquet, which also accept iterators
+	of chunks; read them back with results.load_results. Other files get the
+	data as text.
+	
 	Args:
-		data: List of processed data
+		data: Processed data, as a list, array, DataFrame or iterator of chunks
 		filename: Name of the output file
 	"""
-	with open(filename, "w") as f:
-		f.write(str(data))
+	suffix = Path(filename).suffix
+	if suffix == ".npy":
+		write_npy(data, filename)
+	elif suffix == ".parquet":
+		write_parquet(data, filename)
+	else:
+		with open(filename, "w") as f:
+			f.write(str(data))
 	print(f"Saved results to {filename}")
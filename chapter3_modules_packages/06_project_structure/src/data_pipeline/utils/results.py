@@ -0,0 +1,239 @@
+"""Binary result files, written atomically and read back memory-mapped."""
+
+import itertools
+import os
+import struct
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+PathLike = Union[str, Path]
+
+# Rows collected from an iterator before they are written out
+BUFFER_ROWS = 65_536
+
+
+@contextmanager
+def atomic_path(path: PathLike) -> Iterator[Path]:
+	"""Give a temporary path that replaces path once writing succeeds.
+	
+	The temporary file is created next to path, so the final rename is
+	atomic: readers see either the old file or the complete new one. If
+	writing fails, the temporary file is removed and path is left untouched.
+	The new file keeps the permissions of the file it replaces, or gets the
+	usual permissions for a new file.
+	
+	Args:
+		path: File to write
+	
+	Yields:
+		Temporary path to write to instead
+	"""
+	path = Path(path)
+	path.parent.mkdir(parents=True, exist_ok=True)
+	fd, temp_name = tempfile.mkstemp(
+		dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+	)
+	os.close(fd)
+	try:
+		yield Path(temp_name)
+		# mkstemp creates files readable only by their owner
+		os.chmod(temp_name, _file_mode(path))
+		os.replace(temp_name, path)
+	except BaseException:
+		if os.path.exists(temp_name):
+			os.remove(temp_name)
+		raise
+
+
+def write_npy(
+	data: Union[np.ndarray, Iterable],
+	path: PathLike,
+	dtype: Optional[np.dtype] = None,
+	buffer_rows: int = BUFFER_ROWS,
+) -> None:
+	"""Write an array to a .npy file atomically.
+	
+	Arrays and lists are written in one go. Other iterables are streamed:
+	each item is a single value or a chunk of rows, and small items are
+	collected into a buffer of buffer_rows rows before being written, so
+	the full result is never held in memory.
+	
+	Streamed items must be numeric. Without a dtype, they are stored with
+	the type of the first item, except that integers and booleans are
+	stored as float64, so later fractional values are kept.
+	
+	Args:
+		data: Array, list, or iterable of values or chunks
+		path: File to write
+		dtype: Type of the stored values, taken from the data if None
+		buffer_rows: Number of rows collected before each write when streaming
+	
+	Raises:
+		TypeError: If a streamed item is not numeric, or would have to be
+			cast to a different kind of number, such as floats to integers
+		OverflowError: If a streamed value is outside the range of the
+			stored type, such as 1e300 in a float32 file
+	"""
+	with atomic_path(path) as temp_path, open(temp_path, "wb") as f:
+		if isinstance(data, (np.ndarray, list, tuple)):
+			np.save(f, np.asarray(data, dtype=dtype), allow_pickle=False)
+		else:
+			_stream_npy(iter(data), f, dtype, buffer_rows)
+
+
+def write_parquet(
+	data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+	path: PathLike,
+	buffer_rows: int = BUFFER_ROWS,
+) -> None:
+	"""Write a table to a Parquet file atomically.
+	
+	An iterable of DataFrames is streamed, with small frames combined into
+	row groups of at least buffer_rows rows.
+	
+	Args:
+		data: DataFrame, or iterable of DataFrames with the same columns
+		path: File to write
+		buffer_rows: Number of rows collected before each row group is written
+	"""
+	with atomic_path(path) as temp_path:
+		if isinstance(data, pd.DataFrame):
+			data.to_parquet(temp_path, index=False)
+			return
+
+		import pyarrow as pa
+		import pyarrow.parquet as pq
+
+		writer, buffer, n_buffered = None, [], 0
+		try:
+			for frame in data:
+				buffer.append(frame)
+				n_buffered += len(frame)
+				if n_buffered >= buffer_rows:
+					frame = pd.concat(buffer)
+					table = pa.Table.from_pandas(frame, preserve_index=False)
+					writer = writer or pq.ParquetWriter(temp_path, table.schema)
+					writer.write_table(table)
+					buffer, n_buffered = [], 0
+			if buffer or writer is None:
+				frame = pd.concat(buffer) if buffer else pd.DataFrame()
+				table = pa.Table.from_pandas(frame, preserve_index=False)
+				writer = writer or pq.ParquetWriter(temp_path, table.schema)
+				writer.write_table(table)
+		finally:
+			if writer is not None:
+				writer.close()
+
+
+def load_results(
+	path: PathLike, mmap_mode: Optional[str] = "r"
+) -> Union[np.ndarray, pd.DataFrame]:
+	"""Read results written by write_npy or write_parquet.
+	
+	Args:
+		path: .npy or .parquet file to read
+		mmap_mode: How to memory-map a .npy file, as for np.load; "r" maps
+			it read-only, None reads it into memory
+	
+	Returns:
+		Array for .npy files, DataFrame for Parquet files
+	"""
+	path = Path(path)
+	if path.suffix == ".npy":
+		return np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+	if path.suffix == ".parquet":
+		import pyarrow.parquet as pq
+
+		return pq.read_table(path, memory_map=mmap_mode is not None).to_pandas()
+	raise ValueError(f"Unsupported result file type {path.suffix!r}")
+
+
+def _file_mode(path: Path) -> int:
+	"""Return the permissions of path, or those of a new file if it does not exist."""
+	try:
+		return os.stat(path).st_mode & 0o7777
+	except FileNotFoundError:
+		umask = os.umask(0)
+		os.umask(umask)
+		return 0o666 & ~umask
+
+
+def _npy_header(dtype: np.dtype, shape: tuple, size: Optional[int] = None) -> bytes:
+	"""Build a version 1.0 .npy header, padded with spaces to size bytes."""
+	header = repr({
+		"descr": np.lib.format.dtype_to_descr(dtype),
+		"fortran_order": False,
+		"shape": shape,
+	})
+	prefix_size = len(np.lib.format.magic(1, 0)) + 2
+	# Data starts at a multiple of 64 bytes, as in files written by np.save
+	if size is None:
+		size = -(-(prefix_size + len(header) + 1) // 64) * 64
+	header = header.ljust(size - prefix_size - 1) + "\n"
+	header_length = struct.pack("<H", len(header))
+	return np.lib.format.magic(1, 0) + header_length + header.encode("latin1")
+
+
+def _stream_npy(
+	items: Iterator, f, dtype: Optional[np.dtype], buffer_rows: int
+) -> None:
+	"""Write items to an open file as one .npy array of all their rows.
+	
+	The number of rows is only known at the end, so the header is first
+	written with room for the largest possible count and rewritten last.
+	"""
+	first = next(items, None)
+	if first is None:
+		f.write(_npy_header(np.dtype(dtype or np.float64), (0,)))
+		return
+
+	first = np.asarray(first)
+	if dtype is None:
+		dtype = np.float64 if first.dtype.kind in "biu" else first.dtype
+	dtype = np.dtype(dtype)
+	if dtype.kind not in "biufc":
+		raise TypeError(f"Only numeric values can be streamed, got {dtype}")
+	row_shape = first.shape[1:] if first.ndim > 0 else ()
+	header_size = len(_npy_header(dtype, (np.iinfo(np.int64).max, *row_shape)))
+	f.write(b"\0" * header_size)
+
+	buffer = np.empty((buffer_rows, *row_shape), dtype=dtype)
+	n_buffered = n_rows = 0
+	for item in itertools.chain([first], items):
+		rows = _cast(np.asarray(item), dtype).reshape(-1, *row_shape)
+		if n_buffered + len(rows) > buffer_rows:
+			f.write(buffer[:n_buffered].tobytes())
+			n_buffered = 0
+		if len(rows) >= buffer_rows:
+			f.write(np.ascontiguousarray(rows).tobytes())
+		else:
+			buffer[n_buffered:n_buffered + len(rows)] = rows
+			n_buffered += len(rows)
+		n_rows += len(rows)
+	f.write(buffer[:n_buffered].tobytes())
+
+	f.seek(0)
+	f.write(_npy_header(dtype, (n_rows, *row_shape), header_size))
+
+
+def _cast(values: np.ndarray, dtype: np.dtype) -> np.ndarray:
+	"""Cast values to dtype, refusing other kinds of number and out-of-range values."""
+	if not np.can_cast(values.dtype, dtype, casting="same_kind"):
+		raise TypeError(f"Cannot store {values.dtype} values as {dtype} without loss")
+	if np.can_cast(values.dtype, dtype, casting="safe"):
+		return values.astype(dtype, copy=False)
+	# Narrowing casts, such as float64 to float32, keep values that fit
+	with np.errstate(over="ignore"):
+		cast = values.astype(dtype)
+	if dtype.kind in "fc":
+		out_of_range = np.isfinite(values) & ~np.isfinite(cast)
+	else:
+		out_of_range = cast != values
+	if np.any(out_of_range):
+		raise OverflowError(f"Values out of the range of {dtype} cannot be stored")
+	return cast
@@ -0,0 +1,31 @@
+"""Shared fixtures for the data pipeline tests."""
+
+import string
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def training_data(request):
+    """Random features with a target that depends on the first two of them.
+
+    Parametrize indirectly with a dict to change any of the defaults:
+    n_rows, n_columns, n_classes, and missing, the fraction of feature
+    values replaced with NaN after the target is computed.
+    """
+    options = {"n_rows": 300, "n_columns": 4, "n_classes": 2, "missing": 0.0}
+    options.update(getattr(request, "param", {}))
+
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(
+        rng.normal(size=(options["n_rows"], options["n_columns"])),
+        columns=list(string.ascii_lowercase[:options["n_columns"]]),
+    )
+    # Thresholds that split a + b into n_classes bands, with 0 between two classes
+    thresholds = np.linspace(-1, 1, options["n_classes"] + 1)[1:-1]
+    y = pd.Series(np.digitize(X["a"] + X["b"], thresholds))
+    if options["missing"]:
+        X = X.mask(rng.random(X.shape) < options["missing"])
+    return X, y
@@ -4,9 +4,10 @@ import tempfile
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
 from data_pipeline.config import RAW_DATA_DIR
-from data_pipeline.data.loader import load_data, save_data
+from data_pipeline.data.loader import iter_chunks, load_data, save_data
 
 
 def test_load_data_creates_sample_when_missing():
@@ -56,3 +57,46 @@ def test_save_data():
 
         loaded_data = pd.read_csv(saved_path)
         pd.testing.assert_frame_equal(test_data, loaded_data)
+
+
+def test_iter_chunks_reads_csv_in_typed_chunks():
+    """Test that a CSV file is read lazily in chunks with the given types."""
+    test_data = pd.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": list("abcde")})
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        save_data(test_data, "test_chunks.csv", temp_path)
+
+        chunks = iter_chunks(
+            "test_chunks.csv",
+            chunk_size=2,
+            columns=["col1"],
+            dtypes={"col1": "float32"},
+            directory=temp_path,
+        )
+        first_chunk = next(chunks)
+        chunk_sizes = [len(first_chunk)] + [len(chunk) for chunk in chunks]
+
+    assert chunk_sizes == [2, 2, 1]
+    assert list(first_chunk.columns) == ["col1"]
+    assert first_chunk["col1"].dtype == "float32"
+
+
+def test_iter_chunks_reads_parquet():
+    """Test that a Parquet file is read back in chunks."""
+    test_data = pd.DataFrame({"col1": [1, 2, 3], "col2": [4.0, 5.0, 6.0]})
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        save_data(test_data, "test_chunks.parquet", temp_path)
+
+        chunks = list(iter_chunks("test_chunks.parquet", 2, directory=temp_path))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), test_data)
+
+
+def test_unsupported_file_type():
+    """Test that files other than CSV and Parquet are rejected."""
+    with pytest.raises(ValueError):
+        load_data("data.xlsx")
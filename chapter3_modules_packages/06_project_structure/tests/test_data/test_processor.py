@@ -0,0 +1,39 @@
+"""Tests for data processing functionality."""
+
+import numpy as np
+import pandas as pd
+
+from data_pipeline.data.processor import process_chunks, process_data
+
+
+def test_process_data_drops_missing_values_and_scales():
+    """Test that missing values are removed and the rest multiplied by 2."""
+    result = process_data([1, 2, None, 4])
+
+    np.testing.assert_array_equal(result, [2.0, 4.0, 8.0])
+
+
+def test_process_data_drops_rows_with_missing_values():
+    """Test that 2D data loses every row with a missing value."""
+    data = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4.0, None, 6.0]})
+
+    result = process_data(data, factor=10)
+
+    np.testing.assert_array_equal(result, [[10.0, 40.0], [30.0, 60.0]])
+    assert data["a"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_process_chunks_streams_results():
+    """Test that chunks are processed one at a time, as they are consumed."""
+    consumed = []
+
+    def chunks():
+        for chunk in ([1.0, np.nan], [3.0], [4.0, 5.0]):
+            consumed.append(chunk)
+            yield chunk
+
+    results = process_chunks(chunks())
+
+    np.testing.assert_array_equal(next(results), [2.0])
+    assert len(consumed) == 1
+    np.testing.assert_array_equal(np.concatenate(list(results)), [6.0, 8.0, 10.0])
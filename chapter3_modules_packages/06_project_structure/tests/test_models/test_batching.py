@@ -0,0 +1,82 @@
+"""Tests for micro-batched scoring."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from data_pipeline.models import BatchScorer, ModelPredictor, ModelTrainer
+
+
+@pytest.fixture
+def predictor(training_data):
+    """Predictor for a small model trained on the shared random data."""
+    X, y = training_data
+    trainer = ModelTrainer()
+    trainer.train(X, y)
+    return ModelPredictor(trainer)
+
+
+def test_batched_scores_match_predict_proba(predictor, training_data):
+    """Test that concurrent requests get the same scores as one batch call."""
+    X, _ = training_data
+
+    async def score_all():
+        async with BatchScorer(predictor, max_batch_size=16) as scorer:
+            return await asyncio.gather(
+                *(scorer.predict_proba(row) for row in X.to_numpy())
+            )
+
+    scores = asyncio.run(score_all())
+
+    np.testing.assert_array_equal(np.stack(scores), predictor.predict_proba(X))
+
+
+def test_predict_accepts_mappings(predictor, training_data):
+    """Test that a row given by feature name is put in the model's column order."""
+    X, _ = training_data
+    row = X.iloc[0]
+
+    async def predict_one():
+        async with BatchScorer(predictor) as scorer:
+            return await scorer.predict({name: row[name] for name in reversed(X.columns)})
+
+    assert asyncio.run(predict_one()) == predictor.predict(X.iloc[:1]).iloc[0]
+
+
+def test_requests_are_batched(predictor, training_data):
+    """Test that requests arriving together are scored in as few calls as possible."""
+    X, _ = training_data
+    batch_sizes = []
+    predict_proba_array = predictor.predict_proba_array
+
+    def record_batch(rows):
+        batch_sizes.append(len(rows))
+        return predict_proba_array(rows)
+
+    predictor.predict_proba_array = record_batch
+
+    async def score_all():
+        async with BatchScorer(predictor, max_batch_size=8, max_wait_ms=50) as scorer:
+            rows = X.to_numpy()[:20]
+            await asyncio.gather(*(scorer.predict_proba(row) for row in rows))
+
+    asyncio.run(score_all())
+
+    assert batch_sizes == [8, 8, 4]
+
+
+def test_invalid_rows_are_rejected(predictor):
+    """Test that rows with the wrong number of features raise an error."""
+    async def score_short_row():
+        async with BatchScorer(predictor) as scorer:
+            await scorer.predict_proba([1.0, 2.0])
+
+    with pytest.raises(ValueError):
+        asyncio.run(score_short_row())
+
+
+def test_scoring_requires_running_scorer(predictor):
+    """Test that requests are refused before start() is called."""
+    with pytest.raises(RuntimeError):
+        asyncio.run(BatchScorer(predictor).predict_proba([0.0, 0.0, 0.0, 0.0]))
@@ -0,0 +1,91 @@
+"""Tests for compiled forest inference."""
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_pipeline.models import CompiledForest, ModelPredictor, ModelTrainer
+
+
+@pytest.fixture
+def trained(training_data):
+    """Train a model on the first 200 rows, returning it and the other rows."""
+    X, y = training_data
+    trainer = ModelTrainer()
+    trainer.train(X[:200], y[:200])
+    return trainer, X[200:]
+
+
+@pytest.mark.parametrize(
+    "training_data", [{"n_classes": 2}, {"n_classes": 3}], indirect=True
+)
+def test_compiled_forest_matches_model(trained):
+    """Test that the compiled forest gives exactly the model's probabilities."""
+    trainer, X = trained
+
+    compiled = trainer.compile()
+
+    np.testing.assert_array_equal(
+        compiled.predict_proba(X), trainer.model.predict_proba(X)
+    )
+    np.testing.assert_array_equal(compiled.predict(X), trainer.model.predict(X))
+
+
+@pytest.mark.parametrize("training_data", [{"missing": 0.1}], indirect=True)
+def test_compiled_forest_handles_missing_values(trained):
+    """Test that missing values follow the same branches as in the model."""
+    trainer, X = trained
+
+    compiled = trainer.compile()
+
+    np.testing.assert_array_equal(
+        compiled.predict_proba(X), trainer.model.predict_proba(X)
+    )
+
+
+def test_compiled_forest_reorders_dataframe_columns(trained):
+    """Test that DataFrame columns are matched to the features by name."""
+    trainer, X = trained
+
+    compiled = trainer.compile()
+
+    np.testing.assert_array_equal(
+        compiled.predict_proba(X[["d", "c", "b", "a"]]), compiled.predict_proba(X)
+    )
+
+
+def test_save_and_load(trained):
+    """Test that a saved compiled forest loads with the same predictions."""
+    trainer, X = trained
+    compiled = trainer.compile()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "forest.npz"
+        compiled.save(path)
+        loaded = CompiledForest.load(path)
+
+    assert loaded.feature_names == ["a", "b", "c", "d"]
+    np.testing.assert_array_equal(loaded.predict_proba(X), compiled.predict_proba(X))
+
+
+def test_predictor_uses_compiled_forest_for_small_batches(trained):
+    """Test that both scoring paths of the predictor give the same predictions."""
+    trainer, X = trained
+
+    small_batches = ModelPredictor(trainer, compiled_max_rows=len(X))
+    sklearn_only = ModelPredictor(trainer, compiled_max_rows=0)
+
+    assert sklearn_only.compiled is None
+    pd.testing.assert_frame_equal(
+        small_batches.predict_proba(X), sklearn_only.predict_proba(X)
+    )
+    pd.testing.assert_series_equal(small_batches.predict(X), sklearn_only.predict(X))
+
+
+def test_compile_requires_trained_model():
+    """Test that an untrained model cannot be compiled."""
+    with pytest.raises(ValueError):
+        ModelTrainer().compile()
@@ -0,0 +1,53 @@
+"""Tests for model training functionality."""
+
+import pytest
+
+from data_pipeline.config import MODEL_CONFIG
+from data_pipeline.models import ModelTrainer
+
+
+def test_model_uses_configured_parallelism():
+    """Test that the forest is built with the configured number of jobs."""
+    trainer = ModelTrainer()
+
+    assert trainer.model.n_jobs == MODEL_CONFIG["n_jobs"]
+
+
+def test_train_incremental_stops_when_oob_score_plateaus(monkeypatch, training_data):
+    """Test that trees are added in batches until the OOB score stops improving."""
+    monkeypatch.setitem(MODEL_CONFIG, "tree_batch_size", 5)
+    monkeypatch.setitem(MODEL_CONFIG, "max_estimators", 1000)
+    monkeypatch.setitem(MODEL_CONFIG, "oob_tolerance", 0.5)
+    monkeypatch.setitem(MODEL_CONFIG, "oob_patience", 2)
+    X, y = training_data
+    trainer = ModelTrainer()
+
+    scores = trainer.train_incremental(X, y)
+
+    # No score can improve by 0.5 after the first, so growing stops after 3 steps
+    assert len(scores) == 3
+    assert len(trainer.model.estimators_) == 15
+    assert trainer.is_trained
+    assert not trainer.model.warm_start
+
+
+def test_train_incremental_respects_max_estimators(monkeypatch, training_data):
+    """Test that the forest never grows beyond max_estimators trees."""
+    monkeypatch.setitem(MODEL_CONFIG, "tree_batch_size", 10)
+    monkeypatch.setitem(MODEL_CONFIG, "max_estimators", 35)
+    monkeypatch.setitem(MODEL_CONFIG, "oob_tolerance", -1.0)
+    X, y = training_data
+    trainer = ModelTrainer()
+
+    scores = trainer.train_incremental(X, y)
+
+    assert len(scores) == 3
+    assert len(trainer.model.estimators_) == 30
+
+
+def test_evaluate_requires_training(training_data):
+    """Test that an untrained model cannot be evaluated."""
+    X, y = training_data
+
+    with pytest.raises(ValueError):
+        ModelTrainer().evaluate(X, y)
@@ -0,0 +1,146 @@
+"""Tests for binary result files."""
+
+import os
+import stat
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_pipeline.utils.helpers import save_results
+from data_pipeline.utils.results import load_results, write_npy, write_parquet
+
+
+def test_write_npy_reads_back_memory_mapped():
+    """Test that an array written to .npy is read back memory-mapped."""
+    data = np.arange(10, dtype=np.float64)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "results.npy"
+        write_npy(data, path)
+        loaded = load_results(path)
+
+        assert isinstance(loaded, np.memmap)
+        np.testing.assert_array_equal(loaded, data)
+        del loaded
+
+
+@pytest.mark.parametrize("buffer_rows", [1, 3, 100])
+def test_write_npy_streams_chunks_and_values(buffer_rows):
+    """Test that chunks and single values from an iterator end up in one array."""
+    chunks = [np.array([[1, 2], [3, 4]]), np.array([5, 6]), np.zeros((4, 2))]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "results.npy"
+        write_npy(iter(chunks), path, dtype=np.float32, buffer_rows=buffer_rows)
+        loaded = np.load(path)
+
+    assert loaded.dtype == np.float32
+    expected = np.vstack([chunks[0], [chunks[1]], chunks[2]])
+    np.testing.assert_array_equal(loaded, expected)
+
+
+def test_write_npy_streams_mixed_integers_and_floats():
+    """Test that a stream starting with an integer keeps later fractions."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "results.npy"
+        write_npy(iter([1, 2.5, 3]), path)
+        loaded = np.load(path)
+
+    assert loaded.dtype == np.float64
+    np.testing.assert_array_equal(loaded, [1.0, 2.5, 3.0])
+
+
+def test_write_npy_rejects_lossy_casts():
+    """Test that floats streamed into an integer file raise an error."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "results.npy"
+
+        with pytest.raises(TypeError):
+            write_npy(iter([1, 2.5]), path, dtype=np.int64)
+
+        assert not path.exists()
+
+
+def test_write_npy_rejects_values_out_of_range():
+    """Test that values too large for the stored float type raise an error."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "results.npy"
+
+        with pytest.raises(OverflowError):
+            write_npy(iter([np.float32(1.0), 1e300]), path)
+
+        write_npy(iter([np.float32(1.0), 0.5]), path)
+        np.testing.assert_array_equal(load_results(path), [1.0, 0.5])
+        assert load_results(path).dtype == np.float32
+
+
+def test_written_files_get_usual_permissions():
+    """Test that new files follow the umask and replaced files keep their mode."""
+    umask = os.umask(0o022)
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "results.npy"
+
+            write_npy(np.arange(3), path)
+            assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+            path.chmod(0o600)
+            write_npy(np.arange(3), path)
+            assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    finally:
+        os.umask(umask)
+
+
+def test_write_npy_streams_empty_iterator():
+    """Test that an empty iterator gives an empty array."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "results.npy"
+        write_npy(iter([]), path)
+
+        assert load_results(path, mmap_mode=None).shape == (0,)
+
+
+def test_failed_write_keeps_previous_file():
+    """Test that a write that fails leaves the old file and no temporary files."""
+
+    def failing_chunks():
+        yield np.ones(3)
+        raise RuntimeError("scoring failed")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "results.npy"
+        write_npy(np.zeros(2), path)
+
+        with pytest.raises(RuntimeError):
+            write_npy(failing_chunks(), path)
+
+        np.testing.assert_array_equal(np.load(path), np.zeros(2))
+        assert list(Path(temp_dir).iterdir()) == [path]
+
+
+def test_write_parquet_streams_frames():
+    """Test that DataFrames from an iterator are combined into one table."""
+    frames = [pd.DataFrame({"id": [i, i + 1], "score": [0.5, 0.25]}) for i in (0, 2, 4)]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "results.parquet"
+        write_parquet(iter(frames), path, buffer_rows=3)
+        loaded = load_results(path)
+
+    pd.testing.assert_frame_equal(loaded, pd.concat(frames, ignore_index=True))
+
+
+def test_save_results_picks_format_from_suffix():
+    """Test that save_results writes .npy files in binary and others as text."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        npy_path = Path(temp_dir) / "results.npy"
+        text_path = Path(temp_dir) / "results.txt"
+
+        save_results([2, 4, 6], str(npy_path))
+        save_results([2, 4, 6], str(text_path))
+
+        np.testing.assert_array_equal(np.load(npy_path), [2, 4, 6])
+        assert text_path.read_text() == "[2, 4, 6]"